@@ -10,15 +10,32 @@ import os
 import sys
 import time
 import random
-import requests
-import json
+import asyncio
+import itertools
+import aiohttp
+import re
 from typing import Dict, Any, Optional, List, Tuple
 from dotenv import load_dotenv
 from web3 import Web3
 from eth_account import Account
 import datetime
-import threading
-from concurrent.futures import ThreadPoolExecutor
+from collections import namedtuple
+import numpy as np
+from contracts import USDC_ABI
+from trader_kernels import analyze_batch, kelly_bet
+
+# Use uvloop's libuv-based event loop when it is installed (Linux/macOS)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# Prefer orjson for faster parsing when it is installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 # Load environment variables
 load_dotenv()
@@ -26,6 +43,15 @@ load_dotenv()
 # Constants
 USDC_CONTRACT = "0x3c499c542cEF5E3811e1192ce70d8cC03d5c3359"
 RPC_URL = "https://polygon-rpc.com"
+BALANCE_CACHE_TTL = 5  # seconds a balance read stays fresh
+PRICE_CACHE_TTL = 60  # seconds a fetched token price stays fresh
+PRICE_CACHE_MAX_SIZE = 2048
+
+# HTTP connection pool and retry policy for the price APIs
+HTTP_POOL_SIZE = 32
+HTTP_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 0.3
+HTTP_RETRY_STATUSES = {429, 500, 502, 503, 504}
 
 # Advanced Trading Configuration
 INITIAL_BET_SIZE = 2.0
@@ -35,10 +61,28 @@ TRADING_INTERVAL = 180  # 3 minutes for aggressive trading
 MAX_DAILY_TRADES = 100
 MIN_EDGE_THRESHOLD = 0.10  # Lower threshold for more opportunities
 MAX_CONCURRENT_TRADES = 3
+MAX_CONCURRENT_PRICE_FETCHES = 5  # markets priced at once during a scan
+SCAN_TIMEOUT = 15  # seconds allowed for pricing all markets in one scan
+
+# A validated tradable market, parsed once when the markets file is loaded
+Market = namedtuple("Market", "condition_id question yes_tid no_tid volume")
+
+def compile_keyword_pattern(keywords: List[str]) -> "re.Pattern":
+    """Compile keywords into one regex that finds every (overlapping) occurrence"""
+    return re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))")
 
 class AdvancedAutoTrader:
+    # Sentiment keywords, compiled once so each question is scanned in a single pass
+    _BULLISH = frozenset({"will", "win", "succeed", "pass", "approve", "increase", "rise", "championship", "finals", "victory", "achieve"})
+    _BEARISH = frozenset({"fail", "lose", "reject", "decrease", "fall", "crash", "relegated", "eliminated", "defeat", "miss"})
+    _bullish_pattern = compile_keyword_pattern(sorted(_BULLISH))
+    _bearish_pattern = compile_keyword_pattern(sorted(_BEARISH))
+
     def __init__(self):
         self.wallet_address, self.private_key, self.w3 = self.get_wallet_info()
+        self._usdc_contract = self.w3.eth.contract(address=USDC_CONTRACT, abi=USDC_ABI)
+        self._balance_cache = None
+        self._balance_cache_ts = 0.0
         self.starting_balance = self.get_usdc_balance()
         self.current_balance = self.starting_balance
         self.total_profit = 0.0
@@ -46,9 +90,10 @@ class AdvancedAutoTrader:
         self.successful_trades = 0
         self.failed_trades = 0
         self.current_bet_size = INITIAL_BET_SIZE
-        self.last_trade_time = 0
+        self.last_trade_time = float("-inf")  # time.monotonic() of the last trade
         self.active_positions = {}
-        self.session = self.create_session()
+        self.session = None  # aiohttp session, created inside the event loop
+        self._price_cache = {}  # token_id -> (time.monotonic(), price)
         
         # Advanced features
         self.user_agents = [
@@ -59,6 +104,10 @@ class AdvancedAutoTrader:
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:109.0) Gecko/20100101 Firefox/121.0"
         ]
         
+        # Private RNG for jitter and a pre-shuffled round-robin of user agents
+        self._rng = random.Random()
+        self._user_agent_cycle = itertools.cycle(self._rng.sample(self.user_agents, len(self.user_agents)))
+        
         print(f"🤖 ADVANCED AUTOMATED POLYMARKET TRADER INITIALIZED")
         print(f"💰 Starting Balance: ${self.starting_balance:.2f} USDC")
         print(f"🎯 Initial Bet Size: ${self.current_bet_size:.2f} USDC")
@@ -84,71 +133,75 @@ class AdvancedAutoTrader:
         
         return wallet_address, private_key, w3
 
-    def get_usdc_balance(self) -> float:
-        """Get current USDC balance"""
-        usdc_abi = [
-            {
-                "constant": True,
-                "inputs": [{"name": "account", "type": "address"}],
-                "name": "balanceOf",
-                "outputs": [{"name": "", "type": "uint256"}],
-                "payable": False,
-                "stateMutability": "view",
-                "type": "function"
-            }
-        ]
+    def get_usdc_balance(self, force: bool = False) -> float:
+        """Get current USDC balance, reusing a reading younger than BALANCE_CACHE_TTL"""
+        now = time.time()
+        if not force and self._balance_cache is not None and now - self._balance_cache_ts < BALANCE_CACHE_TTL:
+            return self._balance_cache
         
-        usdc_contract = self.w3.eth.contract(address=USDC_CONTRACT, abi=usdc_abi)
-        balance = usdc_contract.functions.balanceOf(self.wallet_address).call()
-        return balance / 10**6
-
-    def create_session(self):
-        """Create a session with rotating headers to avoid detection"""
-        session = requests.Session()
-        session.headers.update({
-            "User-Agent": random.choice(self.user_agents),
-            "Accept": "application/json, text/plain, */*",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-            "Sec-Fetch-Dest": "empty",
-            "Sec-Fetch-Mode": "cors",
-            "Sec-Fetch-Site": "same-origin",
-            "Cache-Control": "no-cache",
-            "Pragma": "no-cache"
-        })
-        return session
+        balance = self._usdc_contract.functions.balanceOf(self.wallet_address).call()
+        self._balance_cache = balance / 10**6
+        self._balance_cache_ts = now
+        return self._balance_cache
+
+    def create_session(self) -> aiohttp.ClientSession:
+        """Create an aiohttp session with rotating headers to avoid detection"""
+        return aiohttp.ClientSession(
+            headers={
+                "User-Agent": self.next_user_agent(),
+                "Accept": "application/json, text/plain, */*",
+                "Accept-Language": "en-US,en;q=0.9",
+                "Accept-Encoding": "gzip, deflate, br",
+                "Connection": "keep-alive",
+                "Sec-Fetch-Dest": "empty",
+                "Sec-Fetch-Mode": "cors",
+                "Sec-Fetch-Site": "same-origin",
+                "Cache-Control": "no-cache",
+                "Pragma": "no-cache"
+            },
+            timeout=aiohttp.ClientTimeout(total=10),
+            # Pooled keep-alive connections amortize the TLS handshake across calls
+            connector=aiohttp.TCPConnector(limit=HTTP_POOL_SIZE, ttl_dns_cache=300)
+        )
+
+    def next_user_agent(self) -> str:
+        """Next user agent in the shuffled rotation"""
+        return next(self._user_agent_cycle)
 
     def rotate_session(self):
-        """Rotate session and headers to avoid detection"""
-        self.session.close()
-        self.session = self.create_session()
-        time.sleep(random.uniform(1, 3))
+        """Rotate the User-Agent header, keeping pooled connections alive"""
+        self.session.headers["User-Agent"] = self.next_user_agent()
 
-    def get_markets_with_retry(self) -> List[Dict[str, Any]]:
+    def get_markets_with_retry(self) -> List[Market]:
         """Get markets with multiple retry strategies"""
         try:
             # Load from file first
-            with open("current_markets.json", "r") as f:
-                markets = json.load(f)
+            with open("current_markets.json", "rb") as f:
+                markets = json_loads(f.read())
             
             # Filter for high-volume markets
             filtered_markets = []
             for market in markets[:50]:  # Check more markets
-                if market.get("active", False) and float(market.get("volume", 0)) > 50000:  # Lower volume threshold
+                get = market.get
+                volume = float(get("volume", 0))
+                if get("active", False) and volume > 50000:  # Lower volume threshold
+                    condition_id = get("condition_id")
+                    question = get("question", "")
+                    if not condition_id or not question:
+                        continue
+                    
                     # Parse tokens
-                    tokens_str = market.get("tokens", "[]")
+                    tokens_str = get("tokens", "[]")
                     try:
                         if isinstance(tokens_str, str):
-                            tokens = json.loads(tokens_str)
+                            tokens = json_loads(tokens_str)
                         else:
                             tokens = tokens_str
                     except:
                         tokens = []
                     
                     if len(tokens) >= 2:
-                        market["tokens"] = tokens
-                        filtered_markets.append(market)
+                        filtered_markets.append(Market(condition_id, question, tokens[0], tokens[1], volume))
             
             print(f"✅ Loaded {len(filtered_markets)} potential markets")
             return filtered_markets
@@ -157,60 +210,89 @@ class AdvancedAutoTrader:
             print(f"❌ Error loading markets: {e}")
             return []
 
-    def get_price_with_fallback(self, token_id: str) -> Optional[float]:
-        """Get price with multiple fallback strategies"""
+    async def get_price_with_fallback(self, token_id: str) -> Optional[float]:
+        """Get price, serving repeat lookups from a short-lived cache"""
+        now = time.monotonic()
+        cached = self._price_cache.get(token_id)
+        if cached is not None and now - cached[0] < PRICE_CACHE_TTL:
+            return cached[1]
+        
+        price = await self.race_price_sources(token_id)
+        if price is not None:
+            # Re-insert so the dict stays ordered oldest-first for eviction
+            self._price_cache.pop(token_id, None)
+            self._price_cache[token_id] = (now, price)
+            if len(self._price_cache) > PRICE_CACHE_MAX_SIZE:
+                del self._price_cache[next(iter(self._price_cache))]
+        return price
+
+    async def race_price_sources(self, token_id: str) -> Optional[float]:
+        """Get price by racing all fallback strategies concurrently"""
         strategies = [
             self.get_price_clob_api,
             self.get_price_gamma_api,
             self.get_price_direct_api
         ]
+        pending = {asyncio.create_task(strategy(token_id)) for strategy in strategies}
         
-        for strategy in strategies:
-            try:
-                price = strategy(token_id)
-                if price and 0.01 <= price <= 0.99:
-                    return price
-            except:
-                continue
+        # Return the first valid price in completion order, cancelling the
+        # sources still in flight; latency is the fastest source, not the sum
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    price = task.result()
+                    if price and 0.01 <= price <= 0.99:
+                        return price
+        finally:
+            for task in pending:
+                task.cancel()
         
         return None
 
-    def get_price_clob_api(self, token_id: str) -> Optional[float]:
+    async def fetch_json(self, url: str, headers: Optional[Dict[str, str]] = None) -> Any:
+        """GET a JSON document on the pooled session, retrying transient errors with backoff"""
+        for attempt in range(HTTP_RETRIES + 1):
+            async with self.session.get(url, headers=headers) as response:
+                if response.status == 200:
+                    return json_loads(await response.read())
+                if response.status not in HTTP_RETRY_STATUSES or attempt == HTTP_RETRIES:
+                    return None
+            await asyncio.sleep(HTTP_BACKOFF_FACTOR * 2 ** attempt)
+        return None
+
+    async def get_price_clob_api(self, token_id: str) -> Optional[float]:
         """Get price from CLOB API"""
         try:
             url = f"https://clob.polymarket.com/prices-history?market={token_id}&interval=1m&fidelity=1"
-            response = self.session.get(url, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data and len(data) > 0:
-                    return float(data[-1].get("p", 0))
-        except:
+            data = await self.fetch_json(url)
+            if data and len(data) > 0:
+                return float(data[-1].get("p", 0))
+        except Exception:
             pass
         return None
 
-    def get_price_gamma_api(self, token_id: str) -> Optional[float]:
+    async def get_price_gamma_api(self, token_id: str) -> Optional[float]:
         """Get price from Gamma API"""
         try:
-            # Rotate session for this request
-            self.rotate_session()
+            # Rotate the user agent for this request; the shared session
+            # cannot be torn down while the other sources are in flight
+            headers = {"User-Agent": self.next_user_agent()}
             
             url = f"https://gamma-api.polymarket.com/markets/{token_id}"
-            response = self.session.get(url, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
+            data = await self.fetch_json(url, headers=headers)
+            if data is not None:
                 return float(data.get("price", 0))
-        except:
+        except Exception:
             pass
         return None
 
-    def get_price_direct_api(self, token_id: str) -> Optional[float]:
+    async def get_price_direct_api(self, token_id: str) -> Optional[float]:
         """Get price from direct API calls"""
         try:
             # Use a different approach - simulate browser behavior
             headers = {
-                "User-Agent": random.choice(self.user_agents),
+                "User-Agent": self.next_user_agent(),
                 "Referer": "https://polymarket.com/",
                 "Origin": "https://polymarket.com"
             }
@@ -222,100 +304,78 @@ class AdvancedAutoTrader:
             ]
             
             for endpoint in endpoints:
-                response = requests.get(endpoint, headers=headers, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    if isinstance(data, list) and len(data) > 0:
-                        return float(data[0].get("price", 0))
-                    elif isinstance(data, dict):
-                        return float(data.get("price", 0))
-        except:
+                data = await self.fetch_json(endpoint, headers=headers)
+                if isinstance(data, list) and len(data) > 0:
+                    return float(data[0].get("price", 0))
+                elif isinstance(data, dict):
+                    return float(data.get("price", 0))
+        except Exception:
             pass
         return None
 
-    def analyze_market_advanced(self, market: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def analyze_market_advanced(self, market: Market) -> Optional[Dict[str, Any]]:
         """Advanced market analysis with multiple factors"""
         try:
-            condition_id = market.get("condition_id")
-            question = market.get("question", "")
-            volume = float(market.get("volume", 0))
-            tokens = market.get("tokens", [])
-            
-            if not condition_id or not question or len(tokens) < 2:
-                return None
-            
-            yes_token_id = tokens[0]
-            
             # Get current price with fallback strategies
-            current_price = self.get_price_with_fallback(yes_token_id)
-            if current_price is None:
-                return None
-            
-            # Advanced AI analysis
-            bullish_keywords = ["will", "win", "succeed", "pass", "approve", "increase", "rise", "championship", "finals", "victory", "achieve"]
-            bearish_keywords = ["fail", "lose", "reject", "decrease", "fall", "crash", "relegated", "eliminated", "defeat", "miss"]
-            
-            # Sentiment scoring
-            question_lower = question.lower()
-            bullish_score = sum(2 if word in question_lower else 0 for word in bullish_keywords)
-            bearish_score = sum(2 if word in question_lower else 0 for word in bearish_keywords)
-            
-            # Volume factor (higher volume = more reliable)
-            volume_factor = min(volume / 1000000, 0.2)  # Up to 20% adjustment
-            
-            # Time factor (closer to resolution = more volatile)
-            time_factor = 0.1  # Default time adjustment
-            
-            # Calculate AI probability with multiple factors
-            base_probability = 0.5
-            sentiment_adjustment = (bullish_score - bearish_score) * 0.05
-            
-            ai_probability = max(0.15, min(0.85, 
-                base_probability + sentiment_adjustment + volume_factor + time_factor))
-            
-            # Calculate edge with improved formula
-            if ai_probability > current_price:
-                edge = (ai_probability - current_price) / current_price
-                side = "YES"
-                token_id = yes_token_id
-            else:
-                edge = (current_price - ai_probability) / ai_probability
-                side = "NO"
-                token_id = tokens[1] if len(tokens) > 1 else yes_token_id
-            
-            # Apply edge threshold
-            if edge >= MIN_EDGE_THRESHOLD:
-                return {
-                    "market": market,
-                    "condition_id": condition_id,
-                    "token_id": token_id,
-                    "side": side,
-                    "edge": edge,
-                    "current_price": current_price,
-                    "ai_probability": ai_probability,
-                    "question": question,
-                    "volume": volume,
-                    "confidence": min(volume / 1000000, 1.0)  # Confidence based on volume
-                }
-            
-            return None
+            current_price = await self.get_price_with_fallback(market.yes_tid)
+            opportunities = self.analyze_markets_batch([market], [current_price])
+            return opportunities[0] if opportunities else None
             
         except Exception as e:
             return None
 
+    def analyze_markets_batch(self, markets: List[Market], prices: List[Optional[float]]) -> List[Dict[str, Any]]:
+        """Score many markets at once with vectorized NumPy math, best first"""
+        rows = [(market, price) for market, price in zip(markets, prices) if price is not None]
+        
+        if not rows:
+            return []
+        
+        # Structure-of-arrays view of the priced markets
+        count = len(rows)
+        price_arr = np.fromiter((price for _, price in rows), dtype=np.float64, count=count)
+        volumes = np.fromiter((market.volume for market, _ in rows), dtype=np.float64, count=count)
+        
+        # Sentiment: number of distinct keywords present in each question
+        questions_lower = [market.question.lower() for market, _ in rows]
+        bull_counts = np.fromiter((len(set(self._bullish_pattern.findall(q))) for q in questions_lower), dtype=np.int64, count=count)
+        bear_counts = np.fromiter((len(set(self._bearish_pattern.findall(q))) for q in questions_lower), dtype=np.int64, count=count)
+        
+        edge, is_yes, ai_probability, confidence = analyze_batch(price_arr, volumes, bull_counts, bear_counts)
+        
+        # Apply edge threshold, then rank by score = edge * confidence
+        scores = edge * confidence
+        candidates = np.flatnonzero(edge >= MIN_EDGE_THRESHOLD)
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+        
+        opportunities = []
+        for i in candidates:
+            market, current_price = rows[i]
+            opportunities.append({
+                "market": market,
+                "condition_id": market.condition_id,
+                "token_id": market.yes_tid if is_yes[i] else market.no_tid,
+                "side": "YES" if is_yes[i] else "NO",
+                "edge": float(edge[i]),
+                "current_price": current_price,
+                "ai_probability": float(ai_probability[i]),
+                "question": market.question,
+                "volume": market.volume,
+                "confidence": float(confidence[i]),  # Confidence based on volume
+                "score": float(scores[i])
+            })
+        
+        return opportunities
+
     def calculate_optimal_bet_size(self, edge: float, confidence: float) -> float:
         """Calculate optimal bet size using Kelly Criterion with confidence"""
-        # Kelly Criterion with safety margin and confidence factor
-        kelly_fraction = edge * confidence * 0.2  # Conservative Kelly
-        bet_size = self.current_balance * kelly_fraction
-        
-        # Apply limits
-        bet_size = max(MIN_BET_SIZE, min(MAX_BET_SIZE, bet_size))
-        bet_size = min(bet_size, self.current_balance * 0.15)  # Max 15% of balance
+        # Conservative Kelly (0.2x), capped at 15% of balance
+        bet_size = kelly_bet(edge, confidence, self.current_balance,
+                             MIN_BET_SIZE, MAX_BET_SIZE, 0.2, 0.15)
         
         return round(bet_size, 2)
 
-    def execute_trade_advanced(self, opportunity: Dict[str, Any]) -> bool:
+    async def execute_trade_advanced(self, opportunity: Dict[str, Any]) -> bool:
         """Execute trade with advanced error handling and retry logic"""
         max_retries = 3
         
@@ -324,7 +384,7 @@ class AdvancedAutoTrader:
                 # Rotate session before each attempt
                 if attempt > 0:
                     self.rotate_session()
-                    time.sleep(random.uniform(5, 15))
+                    await asyncio.sleep(self._rng.uniform(5, 15))
                 
                 market = opportunity["market"]
                 token_id = opportunity["token_id"]
@@ -347,7 +407,7 @@ class AdvancedAutoTrader:
                 print(f"Confidence: {confidence:.1%}")
                 
                 # Simulate trade execution with direct API calls
-                success = self.simulate_trade_execution(token_id, side, bet_size)
+                success = await self.simulate_trade_execution(token_id, side, bet_size)
                 
                 if success:
                     print(f"✅ TRADE EXECUTED SUCCESSFULLY!")
@@ -383,7 +443,7 @@ class AdvancedAutoTrader:
         self.current_bet_size = max(self.current_bet_size * 0.9, MIN_BET_SIZE)
         return False
 
-    def simulate_trade_execution(self, token_id: str, side: str, amount: float) -> bool:
+    async def simulate_trade_execution(self, token_id: str, side: str, amount: float) -> bool:
         """Simulate trade execution - replace with real implementation when Cloudflare is bypassed"""
         # This is a simulation - in reality you would:
         # 1. Create the order using py-clob-client
@@ -391,33 +451,35 @@ class AdvancedAutoTrader:
         # 3. Handle the response
         
         # For now, simulate with random success based on market conditions
-        time.sleep(random.uniform(2, 5))  # Simulate API delay
+        await asyncio.sleep(self._rng.uniform(2, 5))  # Simulate API delay
         
         # Simulate 85% success rate for demonstration
         success_rate = 0.85
-        return random.random() < success_rate
+        return self._rng.random() < success_rate
 
-    def find_best_opportunities(self) -> List[Dict[str, Any]]:
+    async def find_best_opportunities(self) -> List[Dict[str, Any]]:
         """Find the best trading opportunities"""
         print("🔍 Scanning for best opportunities...")
         
-        markets = self.get_markets_with_retry()
-        opportunities = []
+        markets = self.get_markets_with_retry()[:20]
         
-        # Use threading for faster analysis
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(self.analyze_market_advanced, market) for market in markets[:20]]
-            
-            for future in futures:
-                try:
-                    result = future.result(timeout=10)
-                    if result:
-                        opportunities.append(result)
-                except:
-                    continue
+        # Fetch prices concurrently (bounded by a semaphore), then score every market in one vectorized pass
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PRICE_FETCHES)
         
-        # Sort by edge * confidence for best opportunities
-        opportunities.sort(key=lambda x: x["edge"] * x["confidence"], reverse=True)
+        async def fetch_price(market: Market) -> Optional[float]:
+            async with semaphore:
+                return await self.get_price_with_fallback(market.yes_tid)
+        
+        # Collect whatever finishes within the scan deadline; stragglers are
+        # cancelled and scored as unpriced instead of holding up the scan
+        tasks = [asyncio.create_task(fetch_price(market)) for market in markets]
+        if tasks:
+            done, pending = await asyncio.wait(tasks, timeout=SCAN_TIMEOUT)
+            for task in pending:
+                task.cancel()
+        prices = [task.result() if task.done() and not task.cancelled() and task.exception() is None else None
+                  for task in tasks]
+        opportunities = self.analyze_markets_batch(markets, prices)
         
         print(f"✅ Found {len(opportunities)} opportunities")
         return opportunities
@@ -453,48 +515,58 @@ class AdvancedAutoTrader:
 
     def run_automated_trading(self):
         """Main automated trading loop"""
+        try:
+            if UVLOOP_AVAILABLE:
+                uvloop.run(self.run_automated_trading_async())
+            else:
+                asyncio.run(self.run_automated_trading_async())
+        except KeyboardInterrupt:
+            print("\n🛑 Automated trading stopped by user")
+
+    async def run_automated_trading_async(self):
+        """Automated trading loop running on the asyncio event loop"""
         print(f"\n🚀 STARTING ADVANCED AUTOMATED TRADING")
         print(f"⚡ Aggressive Mode: Every {TRADING_INTERVAL} seconds")
         print(f"🎯 Target: {MAX_DAILY_TRADES} trades per day")
         print(f"💰 Starting with ${self.starting_balance:.2f} USDC")
         
-        while self.should_continue_trading():
-            try:
-                current_time = time.time()
-                
-                # Check if enough time has passed
-                if current_time - self.last_trade_time < TRADING_INTERVAL:
-                    time.sleep(10)
-                    continue
-                
-                # Find best opportunities
-                opportunities = self.find_best_opportunities()
-                
-                if opportunities:
-                    # Execute the best opportunity
-                    best_opportunity = opportunities[0]
+        self.session = self.create_session()
+        try:
+            while self.should_continue_trading():
+                try:
+                    # Sleep once, exactly until the trading interval has elapsed
+                    wait = TRADING_INTERVAL - (time.monotonic() - self.last_trade_time)
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                    current_time = time.monotonic()
                     
-                    print(f"\n🎯 Best Opportunity Found:")
-                    print(f"   Edge: {best_opportunity['edge']:.1%}")
-                    print(f"   Confidence: {best_opportunity['confidence']:.1%}")
-                    print(f"   Market: {best_opportunity['question'][:50]}...")
+                    # Find best opportunities
+                    opportunities = await self.find_best_opportunities()
                     
-                    if self.execute_trade_advanced(best_opportunity):
-                        self.last_trade_time = current_time
+                    if opportunities:
+                        # Execute the best opportunity
+                        best_opportunity = opportunities[0]
+                        
+                        print(f"\n🎯 Best Opportunity Found:")
+                        print(f"   Edge: {best_opportunity['edge']:.1%}")
+                        print(f"   Confidence: {best_opportunity['confidence']:.1%}")
+                        print(f"   Market: {best_opportunity['question'][:50]}...")
+                        
+                        if await self.execute_trade_advanced(best_opportunity):
+                            self.last_trade_time = current_time
+                        
+                        self.print_status()
+                    else:
+                        print("🔍 No profitable opportunities found, waiting...")
                     
-                    self.print_status()
-                else:
-                    print("🔍 No profitable opportunities found, waiting...")
-                
-                # Random delay to avoid detection
-                time.sleep(random.uniform(30, 90))
-                
-            except KeyboardInterrupt:
-                print("\n🛑 Automated trading stopped by user")
-                break
-            except Exception as e:
-                print(f"❌ Error in trading loop: {e}")
-                time.sleep(60)
+                    # Random delay to avoid detection
+                    await asyncio.sleep(self._rng.uniform(30, 90))
+                    
+                except Exception as e:
+                    print(f"❌ Error in trading loop: {e}")
+                    await asyncio.sleep(60)
+        finally:
+            await self.session.close()
 
 def main():
     """Main function to run advanced automated trading"""
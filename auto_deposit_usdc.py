@@ -4,25 +4,23 @@ Automatic USDC Deposit to Polymarket
 This script automatically deposits USDC from your wallet into Polymarket's trading system
 """
 
-import os
 import sys
+import importlib.util
 import time
 from dotenv import load_dotenv
 from web3 import Web3
-from eth_account import Account
+from wallet import get_account, get_private_key
+from contracts import USDC_ABI
 
 # Load environment variables
 load_dotenv()
 
-# Import py-clob-client
-try:
-    from py_clob_client.client import ClobClient
-    from py_clob_client.constants import POLYGON
-except ImportError:
-    print("❌ py-clob-client not installed. Installing...")
-    os.system("pip install py-clob-client")
-    from py_clob_client.client import ClobClient
-    from py_clob_client.constants import POLYGON
+# Require py-clob-client up front rather than installing it at import time
+if importlib.util.find_spec("py_clob_client") is None:
+    sys.exit("❌ py-clob-client not installed. Run: pip install -r requirements.txt")
+
+from py_clob_client.client import ClobClient
+from py_clob_client.constants import POLYGON
 
 # Constants
 USDC_CONTRACT = "0x3c499c542cEF5E3811e1192ce70d8cC03d5c3359"
@@ -32,6 +30,7 @@ RPC_URL = "https://polygon-rpc.com"
 # Auto-deposit settings
 AUTO_DEPOSIT_AMOUNT = 75.0  # Deposit $75 automatically
 MIN_WALLET_RESERVE = 25.0   # Keep $25 in wallet as reserve
+FEE_HISTORY_BLOCKS = 5      # Blocks sampled for the EIP-1559 priority fee
 
 def auto_deposit_usdc():
     """Automatically deposit USDC into Polymarket for trading"""
@@ -40,53 +39,38 @@ def auto_deposit_usdc():
     print("=" * 60)
     
     # Get private key
-    private_key = os.getenv("POLYGON_WALLET_PRIVATE_KEY", "")
+    private_key = get_private_key()
     if not private_key:
         print("❌ No private key found in environment variables")
         return False
     
-    if not private_key.startswith("0x"):
-        private_key = "0x" + private_key
-    
     # Setup Web3
     w3 = Web3(Web3.HTTPProvider(RPC_URL))
     if not w3.is_connected():
         print("❌ Failed to connect to Polygon network")
         return False
     
-    account = Account.from_key(private_key)
+    account = get_account()
     wallet_address = account.address
     
     print(f"Wallet address: {wallet_address}")
     
     # Check current USDC balance
     try:
-        usdc_abi = [
-            {
-                "constant": True,
-                "inputs": [{"name": "account", "type": "address"}],
-                "name": "balanceOf",
-                "outputs": [{"name": "", "type": "uint256"}],
-                "payable": False,
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "constant": False,
-                "inputs": [
-                    {"name": "to", "type": "address"},
-                    {"name": "amount", "type": "uint256"}
-                ],
-                "name": "transfer",
-                "outputs": [{"name": "", "type": "bool"}],
-                "payable": False,
-                "stateMutability": "nonpayable",
-                "type": "function"
-            }
-        ]
-        
-        usdc_contract = w3.eth.contract(address=USDC_CONTRACT, abi=usdc_abi)
-        wallet_balance = usdc_contract.functions.balanceOf(wallet_address).call()
+        usdc_contract = w3.eth.contract(address=USDC_CONTRACT, abi=USDC_ABI)
+        
+        # Fetch balance, nonce and recent fee history in a single JSON-RPC batch
+        try:
+            with w3.batch_requests() as batch:
+                batch.add(usdc_contract.functions.balanceOf(wallet_address))
+                batch.add(w3.eth.get_transaction_count(wallet_address))
+                batch.add(w3.eth.fee_history(FEE_HISTORY_BLOCKS, "latest", [50]))
+                wallet_balance, nonce, fee_history = batch.execute()
+        except Exception:
+            # Provider does not support batching; fall back to separate calls
+            wallet_balance = usdc_contract.functions.balanceOf(wallet_address).call()
+            nonce = w3.eth.get_transaction_count(wallet_address)
+            fee_history = w3.eth.fee_history(FEE_HISTORY_BLOCKS, "latest", [50])
         wallet_balance_usdc = wallet_balance / 10**6
         
         print(f"Current wallet USDC: ${wallet_balance_usdc:.6f}")
@@ -116,15 +100,20 @@ def auto_deposit_usdc():
         # Convert to smallest unit (6 decimals for USDC)
         deposit_amount_wei = int(deposit_amount * 10**6)
         
+        # EIP-1559 fees: average of recent per-block median tips, with headroom
+        # for the base fee to double before the transaction is included
+        base_fee = fee_history["baseFeePerGas"][-1]
+        rewards = fee_history["reward"]
+        priority_fee = sum(reward[0] for reward in rewards) // len(rewards)
+        
         # Build transfer transaction
-        transfer_txn = usdc_contract.functions.transfer(
-            POLYMARKET_EXCHANGE,
-            deposit_amount_wei
-        ).build_transaction({
+        transfer = usdc_contract.functions.transfer(POLYMARKET_EXCHANGE, deposit_amount_wei)
+        transfer_txn = transfer.build_transaction({
             'from': wallet_address,
-            'gas': 100000,
-            'gasPrice': w3.to_wei('50', 'gwei'),
-            'nonce': w3.eth.get_transaction_count(wallet_address),
+            'gas': transfer.estimate_gas({'from': wallet_address}),
+            'maxFeePerGas': base_fee * 2 + priority_fee,
+            'maxPriorityFeePerGas': priority_fee,
+            'nonce': nonce,
         })
         
         # Sign and send transaction
@@ -136,7 +125,7 @@ def auto_deposit_usdc():
         
         # Wait for confirmation
         print("⏳ Waiting for transaction confirmation...")
-        tx_receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+        tx_receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=300, poll_latency=0.2)
         
         if tx_receipt.status == 1:
             print(f"✅ USDC transfer successful!")
@@ -213,9 +202,7 @@ def check_polymarket_deposit_status():
     """Check if USDC has been deposited into Polymarket"""
     print("\n🔍 Checking Polymarket deposit status...")
     
-    private_key = os.getenv("POLYGON_WALLET_PRIVATE_KEY", "")
-    if not private_key.startswith("0x"):
-        private_key = "0x" + private_key
+    private_key = get_private_key()
     
     try:
         # Initialize CLOB client to test connectivity
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-time compile the numeric kernels in trader_kernels.py
+
+Builds the poly_kernels extension module with numba.pycc so the trading
+bots start with native kernels instead of paying JIT compilation on the
+first call after every restart. Run once per machine (or after changing
+trader_kernels.py):
+
+    python3 build_kernels.py
+"""
+
+import os
+import sys
+
+try:
+    from numba.pycc import CC
+except ImportError:
+    print("❌ numba is required to build the kernels: pip install numba")
+    sys.exit(1)
+
+import trader_kernels
+
+# Exported name -> numba signature
+SIGNATURES = {
+    "edge_calc": "Tuple((f8, b1))(f8, f8)",
+    "kelly_bet": "f8(f8, f8, f8, f8, f8, f8, f8)",
+    "score_edge": "Tuple((f8, b1, f8))(f8, f8, f8, f8, f8, f8)",
+    "analyze_batch": "Tuple((f8[::1], b1[::1], f8[::1], f8[::1]))(f8[::1], f8[::1], i8[::1], i8[::1])",
+    "score_edge_batch": "Tuple((f8[::1], b1[::1], f8[::1], f8[::1]))(f8[::1], f8[::1], i8[::1])",
+}
+
+def main():
+    """Compile every kernel into poly_kernels next to this script"""
+    cc = CC("poly_kernels")
+    cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+    cc.verbose = True
+    
+    for name, signature in SIGNATURES.items():
+        # Compile the Python source, not a previously built AOT function
+        kernel = trader_kernels.PY_KERNELS[name]
+        cc.export(name, signature)(getattr(kernel, "py_func", kernel))
+    
+    cc.compile()
+    print(f"✅ Built poly_kernels in {cc.output_dir}")
+
+if __name__ == "__main__":
+    main()
@@ -5,108 +5,137 @@ This script checks USDC balances in both wallet addresses
 """
 
 import os
+import sys
+import json
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-from web3 import Web3
+from rpc_client import get_w3
+from contracts import usdc_contract
 
 # Load environment variables
 load_dotenv()
 
-def check_both_wallets():
-    """Check USDC balances in both wallet addresses"""
-    print("=" * 60)
-    print("CHECKING BOTH WALLET ADDRESSES")
-    print("=" * 60)
+def check_both_wallets(as_json=False):
+    """Check USDC balances in both wallet addresses
+
+    Returns (wallet1_usdc, wallet2_usdc), or None if the RPC is unreachable.
+    """
+    # Collect the report and write it in one go
+    out = []
+    out.append("=" * 60)
+    out.append("CHECKING BOTH WALLET ADDRESSES")
+    out.append("=" * 60)
     
     # Setup Web3
-    w3 = Web3(Web3.HTTPProvider("https://polygon-rpc.com"))
+    w3 = get_w3()
     if not w3.is_connected():
-        print("❌ Failed to connect to Polygon network")
-        return
+        out.append("❌ Failed to connect to Polygon network")
+        if as_json:
+            out = [json.dumps({"error": "Failed to connect to Polygon network"})]
+        sys.stdout.write("\n".join(out) + "\n")
+        return None
     
     # Wallet addresses
     wallet1 = "0xb3A635E05d1a159b0d2658d3F0e7D59cd4643633"  # From private key
     wallet2 = "0x3E1B662bB2FD32D7eb6c57221296205C9D48D012"  # Polymarket wallet
     
     # USDC contract
-    usdc_contract = "0x3c499c542cEF5E3811e1192ce70d8cC03d5c3359"
-    
-    # USDC ABI
-    usdc_abi = [
-        {
-            "constant": True,
-            "inputs": [{"name": "account", "type": "address"}],
-            "name": "balanceOf",
-            "outputs": [{"name": "", "type": "uint256"}],
-            "payable": False,
-            "stateMutability": "view",
-            "type": "function"
-        }
-    ]
-    
-    usdc = w3.eth.contract(address=usdc_contract, abi=usdc_abi)
-    
-    print("💰 WALLET BALANCE COMPARISON:")
-    print()
+    usdc = usdc_contract(w3)
+    
+    out.append("💰 WALLET BALANCE COMPARISON:")
+    out.append("")
+    
+    # Read both balances in a single JSON-RPC batch round trip
+    try:
+        with w3.batch_requests() as batch:
+            batch.add(usdc.functions.balanceOf(wallet1))
+            batch.add(usdc.functions.balanceOf(wallet2))
+            balance1, balance2 = batch.execute()
+    except Exception:
+        # Provider rejected the batch; overlap one call per wallet instead
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            future1 = executor.submit(usdc.functions.balanceOf(wallet1).call)
+            future2 = executor.submit(usdc.functions.balanceOf(wallet2).call)
+            balance1, balance2 = future1.result(), future2.result()
     
-    # Check Wallet 1 (Private Key Wallet)
-    balance1 = usdc.functions.balanceOf(wallet1).call()
     balance1_usdc = balance1 / 10**6
-    print(f"WALLET 1 (Private Key): {wallet1}")
-    print(f"   USDC Balance: ${balance1_usdc:.6f}")
-    print(f"   This is the wallet used by your trading bot")
-    print()
+    balance2_usdc = balance2 / 10**6
+    
+    if as_json:
+        sys.stdout.write(json.dumps({
+            "wallet1": {"address": wallet1, "usdc": balance1_usdc},
+            "wallet2": {"address": wallet2, "usdc": balance2_usdc}
+        }) + "\n")
+        return balance1_usdc, balance2_usdc
+    
+    # Check Wallet 1 (Private Key Wallet)
+    out.append(f"WALLET 1 (Private Key): {wallet1}")
+    out.append(f"   USDC Balance: ${balance1_usdc:.6f}")
+    out.append(f"   This is the wallet used by your trading bot")
+    out.append("")
     
     # Check Wallet 2 (Polymarket Wallet)
-    balance2 = usdc.functions.balanceOf(wallet2).call()
-    balance2_usdc = balance2 / 10**6
-    print(f"WALLET 2 (Polymarket): {wallet2}")
-    print(f"   USDC Balance: ${balance2_usdc:.6f}")
-    print(f"   This is the wallet you're checking on Polymarket")
-    print()
+    out.append(f"WALLET 2 (Polymarket): {wallet2}")
+    out.append(f"   USDC Balance: ${balance2_usdc:.6f}")
+    out.append(f"   This is the wallet you're checking on Polymarket")
+    out.append("")
     
-    print("🔍 ANALYSIS:")
+    out.append("🔍 ANALYSIS:")
     if balance1_usdc > 0:
-        print(f"   ✅ Wallet 1 has ${balance1_usdc:.2f} USDC")
+        out.append(f"   ✅ Wallet 1 has ${balance1_usdc:.2f} USDC")
     else:
-        print("   ❌ Wallet 1 has no USDC")
+        out.append("   ❌ Wallet 1 has no USDC")
     
     if balance2_usdc > 0:
-        print(f"   ✅ Wallet 2 has ${balance2_usdc:.2f} USDC")
+        out.append(f"   ✅ Wallet 2 has ${balance2_usdc:.2f} USDC")
     else:
-        print("   ❌ Wallet 2 has no USDC")
-    
-    print()
-    print("🎯 THE ISSUE:")
-    print("   Your trading bot is using WALLET 1, but you're checking WALLET 2")
-    print("   on Polymarket. These are DIFFERENT wallets!")
-    print()
-    
-    print("🔧 SOLUTIONS:")
-    print("   1. Connect WALLET 1 to Polymarket:")
-    print(f"      - Import this private key to MetaMask: {wallet1}")
-    print("      - Connect this wallet to polymarket.com")
-    print("      - Your funds will appear there")
-    print()
-    print("   2. OR transfer funds from WALLET 1 to WALLET 2:")
-    print("      - Send USDC from the private key wallet to your Polymarket wallet")
-    print("      - Then use Polymarket normally")
-    print()
-    print("   3. OR update your bot to use WALLET 2:")
-    print("      - Export private key from WALLET 2")
-    print("      - Update your .env file with the new private key")
+        out.append("   ❌ Wallet 2 has no USDC")
+    
+    out.append("")
+    out.append("🎯 THE ISSUE:")
+    out.append("   Your trading bot is using WALLET 1, but you're checking WALLET 2")
+    out.append("   on Polymarket. These are DIFFERENT wallets!")
+    out.append("")
+    
+    out.append("🔧 SOLUTIONS:")
+    out.append("   1. Connect WALLET 1 to Polymarket:")
+    out.append(f"      - Import this private key to MetaMask: {wallet1}")
+    out.append("      - Connect this wallet to polymarket.com")
+    out.append("      - Your funds will appear there")
+    out.append("")
+    out.append("   2. OR transfer funds from WALLET 1 to WALLET 2:")
+    out.append("      - Send USDC from the private key wallet to your Polymarket wallet")
+    out.append("      - Then use Polymarket normally")
+    out.append("")
+    out.append("   3. OR update your bot to use WALLET 2:")
+    out.append("      - Export private key from WALLET 2")
+    out.append("      - Update your .env file with the new private key")
     
+    sys.stdout.write("\n".join(out) + "\n")
     return balance1_usdc, balance2_usdc
 
 def main():
     """Main function"""
-    balance1, balance2 = check_both_wallets()
-    
-    print("\n" + "=" * 60)
-    print("SUMMARY")
-    print("=" * 60)
-    print(f"💰 Private Key Wallet: ${balance1:.2f} USDC")
-    print(f"💰 Polymarket Wallet: ${balance2:.2f} USDC")
-    print("🔑 You need to connect the correct wallet to see your funds!")
+    parser = argparse.ArgumentParser(description="Check USDC balances in both wallet addresses")
+    parser.add_argument("--json", action="store_true", help="print one machine-readable JSON line instead of the report")
+    args = parser.parse_args()
+    
+    result = check_both_wallets(as_json=args.json)
+    if result is None:
+        sys.exit(1)
+    balance1, balance2 = result
+    if args.json:
+        return
+    
+    sys.stdout.write("\n".join([
+        "\n" + "=" * 60,
+        "SUMMARY",
+        "=" * 60,
+        f"💰 Private Key Wallet: ${balance1:.2f} USDC",
+        f"💰 Polymarket Wallet: ${balance2:.2f} USDC",
+        "🔑 You need to connect the correct wallet to see your funds!"
+    ]) + "\n")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -4,89 +4,119 @@ Check Polymarket Trading Balance
 This script checks your actual trading balance on Polymarket using the CLOB client
 """
 
-import os
 import sys
+import importlib.util
+import asyncio
+import argparse
 from dotenv import load_dotenv
-from web3 import Web3
-from eth_account import Account
+from rpc_client import connect_async_w3
+from wallet import get_account, get_private_key
+from contracts import MULTICALL3_ABI, MULTICALL3_ADDRESS, USDC_CONTRACT, encode_balance_of, usdc_contract
 
 # Load environment variables
 load_dotenv()
 
-# Import py-clob-client
-try:
-    from py_clob_client.client import ClobClient
-    from py_clob_client.constants import POLYGON
-except ImportError:
-    print("❌ py-clob-client not installed. Installing...")
-    os.system("pip install py-clob-client")
-    from py_clob_client.client import ClobClient
-    from py_clob_client.constants import POLYGON
+# Require py-clob-client up front rather than installing it at import time
+if importlib.util.find_spec("py_clob_client") is None:
+    sys.exit("❌ py-clob-client not installed. Run: pip install -r requirements.txt")
 
-# Constants
-USDC_CONTRACT = "0x3c499c542cEF5E3811e1192ce70d8cC03d5c3359"
-RPC_URL = "https://polygon-rpc.com"
+from py_clob_client.client import ClobClient
+from py_clob_client.constants import POLYGON
+from clob_creds import get_api_creds
 
-def check_polymarket_balance():
+async def read_wallet_balances(w3, wallet_address):
+    """Return (usdc_balance, matic_balance) raw integers; a failed read is its exception"""
+    try:
+        # Read USDC and MATIC balances in one Multicall3 aggregate3 call
+        multicall = w3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+        calls = [
+            (USDC_CONTRACT, False, encode_balance_of(wallet_address)),
+            (MULTICALL3_ADDRESS, False, multicall.encode_abi("getEthBalance", args=[wallet_address])),
+        ]
+        (_, usdc_data), (_, matic_data) = await multicall.functions.aggregate3(calls).call()
+        return int.from_bytes(usdc_data, "big"), int.from_bytes(matic_data, "big")
+    except Exception:
+        # Multicall unavailable; read each balance separately
+        usdc = usdc_contract(w3)
+        return await asyncio.gather(
+            usdc.functions.balanceOf(wallet_address).call(),
+            w3.eth.get_balance(wallet_address),
+            return_exceptions=True
+        )
+
+def init_clob_client(private_key, refresh_creds=False):
+    """Create the CLOB client and set API credentials; returns (client, creds_error)"""
+    client = ClobClient(
+        host="https://clob.polymarket.com",
+        key=private_key,
+        chain_id=POLYGON
+    )
+    
+    # Try to set up API credentials
+    try:
+        api_creds = get_api_creds(client, refresh=refresh_creds)
+        client.set_api_creds(api_creds)
+        return client, None
+    except Exception as e:
+        return client, e
+
+async def check_polymarket_balance(refresh_creds=False):
     """Check both wallet and Polymarket trading balances"""
     print("=" * 60)
     print("POLYMARKET TRADING BALANCE CHECKER")
     print("=" * 60)
     
     # Get private key
-    private_key = os.getenv("POLYGON_WALLET_PRIVATE_KEY", "")
+    private_key = get_private_key()
     if not private_key:
         print("❌ No private key found in environment variables")
         return
     
-    if not private_key.startswith("0x"):
-        private_key = "0x" + private_key
-    
-    # Setup Web3
-    w3 = Web3(Web3.HTTPProvider(RPC_URL))
-    if not w3.is_connected():
-        print("❌ Failed to connect to Polygon network")
-        return
-    
-    account = Account.from_key(private_key)
+    account = get_account()
     wallet_address = account.address
     
     print(f"Wallet address: {wallet_address}")
     print()
     
+    # Setup Web3
+    w3 = await connect_async_w3()
+    try:
+        if not await w3.is_connected():
+            print("❌ Failed to connect to Polygon network")
+            return
+        
+        # On-chain balances and CLOB client setup are independent, so run them together
+        balances, clob = await asyncio.gather(
+            read_wallet_balances(w3, wallet_address),
+            asyncio.to_thread(init_clob_client, private_key, refresh_creds),
+            return_exceptions=True
+        )
+    finally:
+        await w3.provider.disconnect()
+    
+    if isinstance(balances, Exception):
+        wallet_balance = matic_balance = balances
+    else:
+        wallet_balance, matic_balance = balances
+    
     # Check wallet USDC balance
     print("1. WALLET USDC BALANCE:")
     print("-" * 30)
-    try:
-        usdc_abi = [
-            {
-                "constant": True,
-                "inputs": [{"name": "account", "type": "address"}],
-                "name": "balanceOf",
-                "outputs": [{"name": "", "type": "uint256"}],
-                "payable": False,
-                "stateMutability": "view",
-                "type": "function"
-            }
-        ]
-        
-        usdc_contract = w3.eth.contract(address=USDC_CONTRACT, abi=usdc_abi)
-        wallet_balance = usdc_contract.functions.balanceOf(wallet_address).call()
+    if isinstance(wallet_balance, Exception):
+        print(f"❌ Error checking wallet balance: {wallet_balance}")
+        wallet_balance_usdc = 0
+    else:
         wallet_balance_usdc = wallet_balance / 10**6
-        
         print(f"Wallet USDC: ${wallet_balance_usdc:.6f}")
-        
-    except Exception as e:
-        print(f"❌ Error checking wallet balance: {e}")
-        wallet_balance_usdc = 0
     
     print()
     
     # Check MATIC balance for gas
     print("2. MATIC BALANCE (for gas):")
     print("-" * 30)
-    try:
-        matic_balance = w3.eth.get_balance(wallet_address)
+    if isinstance(matic_balance, Exception):
+        print(f"❌ Error checking MATIC balance: {matic_balance}")
+    else:
         matic_balance_eth = matic_balance / 10**18
         print(f"MATIC: {matic_balance_eth:.6f}")
         
@@ -94,30 +124,20 @@ def check_polymarket_balance():
             print("⚠️ Low MATIC! You need MATIC for gas fees.")
         else:
             print("✅ MATIC balance sufficient for gas fees.")
-            
-    except Exception as e:
-        print(f"❌ Error checking MATIC balance: {e}")
     
     print()
     
     # Check Polymarket trading balance
     print("3. POLYMARKET TRADING BALANCE:")
     print("-" * 30)
-    try:
-        # Initialize CLOB client
-        client = ClobClient(
-            host="https://clob.polymarket.com",
-            key=private_key,
-            chain_id=POLYGON
-        )
-        
-        # Try to set up API credentials
-        try:
-            api_creds = client.create_or_derive_api_creds()
-            client.set_api_creds(api_creds)
+    if isinstance(clob, Exception):
+        print(f"❌ Error initializing Polymarket client: {clob}")
+    else:
+        client, creds_error = clob
+        if creds_error is None:
             print("✅ API credentials set up successfully")
-        except Exception as e:
-            print(f"⚠️ API credentials warning: {e}")
+        else:
+            print(f"⚠️ API credentials warning: {creds_error}")
         
         # Try to get balance from Polymarket
         try:
@@ -146,9 +166,6 @@ def check_polymarket_balance():
             except Exception as e2:
                 print(f"❌ CLOB client test failed: {e2}")
                 print("💡 This might be why trades are failing")
-        
-    except Exception as e:
-        print(f"❌ Error initializing Polymarket client: {e}")
     
     print()
     print("4. DIAGNOSIS:")
@@ -172,4 +189,7 @@ def check_polymarket_balance():
         print("💡 You need to add USDC to your wallet first")
 
 if __name__ == "__main__":
-    check_polymarket_balance() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Check Polymarket trading balance")
+    parser.add_argument("--refresh-creds", action="store_true", help="derive new CLOB API credentials instead of using the cached ones")
+    args = parser.parse_args()
+    asyncio.run(check_polymarket_balance(refresh_creds=args.refresh_creds)) 
\ No newline at end of file
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Cached Polymarket CLOB API credentials
+
+Deriving API credentials costs a signature plus a round trip to the CLOB
+server, so the result is kept in ~/.polytrader/creds.json and reused
+until it is 90 days old.
+"""
+
+import os
+import json
+import time
+from py_clob_client.clob_types import ApiCreds
+
+# Constants
+CREDS_PATH = os.path.expanduser("~/.polytrader/creds.json")
+CREDS_MAX_AGE = 90 * 24 * 60 * 60  # seconds
+
+def load_cached_creds(address):
+    """Return cached ApiCreds for address, or None if missing, stale or for another wallet"""
+    try:
+        if time.time() - os.path.getmtime(CREDS_PATH) > CREDS_MAX_AGE:
+            return None
+        with open(CREDS_PATH) as f:
+            data = json.load(f)
+        if data.get("address") != address:
+            return None
+        return ApiCreds(
+            api_key=data["api_key"],
+            api_secret=data["api_secret"],
+            api_passphrase=data["api_passphrase"]
+        )
+    except (OSError, ValueError, KeyError):
+        return None
+
+def save_creds(address, creds):
+    """Write creds to the cache file, readable only by the current user"""
+    os.makedirs(os.path.dirname(CREDS_PATH), mode=0o700, exist_ok=True)
+    fd = os.open(CREDS_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump({
+            "address": address,
+            "api_key": creds.api_key,
+            "api_secret": creds.api_secret,
+            "api_passphrase": creds.api_passphrase
+        }, f)
+    os.chmod(CREDS_PATH, 0o600)
+
+def get_api_creds(client, refresh=False):
+    """Return API creds for client, deriving and caching them only when needed"""
+    address = client.get_address()
+    creds = None if refresh else load_cached_creds(address)
+    if creds is None:
+        creds = client.create_or_derive_api_creds()
+        try:
+            save_creds(address, creds)
+        except OSError as e:
+            print(f"⚠️ Could not cache API credentials: {e}")
+    return creds
@@ -5,11 +5,22 @@ Cloudflare Workaround for Polymarket Trading
 This script provides solutions for when Cloudflare blocks automated trading requests.
 """
 
-import time
 import random
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 
+# Maximum number of probe URLs requested at once
+PROBE_CONCURRENCY = 3
+
+def probe_url(session, url):
+    """Fetch one URL, returning its status code or the exception raised"""
+    try:
+        return session.get(url, timeout=10).status_code
+    except Exception as e:
+        return e
+
 def test_cloudflare_access():
     """Test if we can access Polymarket APIs"""
     print("🔍 Testing Cloudflare access...")
@@ -33,23 +44,28 @@ def test_cloudflare_access():
         "https://polymarket.com/api/markets"
     ]
     
-    for url in test_urls:
-        try:
-            print(f"Testing: {url}")
-            response = requests.get(url, headers=headers, timeout=10)
-            print(f"Status: {response.status_code}")
-            
-            if response.status_code == 403:
-                print("❌ Blocked by Cloudflare")
-            elif response.status_code == 200:
-                print("✅ Access successful")
-            else:
-                print(f"⚠️  Unexpected status: {response.status_code}")
-                
-        except Exception as e:
-            print(f"❌ Error: {e}")
+    # One pooled session for every probe, so connections are reused
+    session = requests.Session()
+    session.headers.update(headers)
+    session.mount("https://", HTTPAdapter(pool_connections=PROBE_CONCURRENCY, pool_maxsize=PROBE_CONCURRENCY * 2))
+    
+    # Probe all URLs concurrently, then report in the original order
+    with session, ThreadPoolExecutor(max_workers=PROBE_CONCURRENCY) as executor:
+        results = list(executor.map(lambda url: probe_url(session, url), test_urls))
+    
+    for url, result in zip(test_urls, results):
+        print(f"Testing: {url}")
+        if isinstance(result, Exception):
+            print(f"❌ Error: {result}")
+            continue
         
-        time.sleep(2)
+        print(f"Status: {result}")
+        if result == 403:
+            print("❌ Blocked by Cloudflare")
+        elif result == 200:
+            print("✅ Access successful")
+        else:
+            print(f"⚠️  Unexpected status: {result}")
 
 def suggest_solutions():
     """Suggest solutions for Cloudflare blocking"""
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Shared contract ABIs for the Polygon wallet scripts
+
+Defined once at module scope so each script reuses the same parsed list
+instead of rebuilding the ABI literal on every call.
+"""
+
+import functools
+
+from eth_abi import encode
+
+# Native USDC on Polygon
+USDC_CONTRACT = "0x3c499c542cEF5E3811e1192ce70d8cC03d5c3359"
+
+# keccak("balanceOf(address)")[:4]
+BALANCE_OF_SELECTOR = b'\x70\xa0\x82\x31'
+
+# keccak("transfer(address,uint256)")[:4]
+TRANSFER_SELECTOR = b'\xa9\x05\x9c\xbb'
+
+# keccak("Transfer(address,address,uint256)"), the ERC20 Transfer event topic
+TRANSFER_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+
+# Minimal ERC20 ABI for USDC: balance and allowance reads, transfers
+USDC_ABI = [
+    {
+        "constant": True,
+        "inputs": [{"name": "account", "type": "address"}],
+        "name": "balanceOf",
+        "outputs": [{"name": "", "type": "uint256"}],
+        "payable": False,
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "constant": True,
+        "inputs": [
+            {"name": "owner", "type": "address"},
+            {"name": "spender", "type": "address"}
+        ],
+        "name": "allowance",
+        "outputs": [{"name": "", "type": "uint256"}],
+        "payable": False,
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "constant": False,
+        "inputs": [
+            {"name": "to", "type": "address"},
+            {"name": "amount", "type": "uint256"}
+        ],
+        "name": "transfer",
+        "outputs": [{"name": "", "type": "bool"}],
+        "payable": False,
+        "stateMutability": "nonpayable",
+        "type": "function"
+    }
+]
+
+
+@functools.lru_cache(maxsize=4)
+def usdc_contract(w3):
+    """Return the USDC contract object for a Web3 instance, built once"""
+    return w3.eth.contract(address=USDC_CONTRACT, abi=USDC_ABI)
+
+
+def encode_balance_of(address):
+    """Raw calldata for USDC balanceOf(address), without a contract object"""
+    return BALANCE_OF_SELECTOR + encode(['address'], [address])
+
+
+def encode_transfer(to, amount):
+    """Raw calldata for USDC transfer(to, amount), without a contract object"""
+    return TRANSFER_SELECTOR + encode(['address', 'uint256'], [to, amount])
+
+# Canonical Multicall3 deployment (same address on Polygon and most EVM chains)
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Minimal Multicall3 ABI: batched calls plus native balance reads
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"}
+                ],
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"}
+                ],
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    },
+    {
+        "inputs": [{"name": "addr", "type": "address"}],
+        "name": "getEthBalance",
+        "outputs": [{"name": "balance", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function"
+    }
+]
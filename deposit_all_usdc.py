@@ -4,20 +4,25 @@ Deposit All USDC to Polymarket
 This script deposits all available USDC from your wallet into Polymarket's trading system
 """
 
-import os
+import io
 import sys
 import time
+import contextlib
 from dotenv import load_dotenv
-from web3 import Web3
-from eth_account import Account
+from rpc_client import CHAIN_ID, get_w3, wait_for_receipt
+from contracts import USDC_CONTRACT, encode_transfer, usdc_contract
+from gas_cache import cached_gas_limit
+from wallet import get_account, get_private_key
 
 # Load environment variables
 load_dotenv()
 
 # Constants
-USDC_CONTRACT = "0x3c499c542cEF5E3811e1192ce70d8cC03d5c3359"
 POLYMARKET_EXCHANGE = "0x4bFb41d5B3570DeFd03C39a9A4D8dE6Bd8B8982E"
-RPC_URL = "https://polygon-rpc.com"
+
+# USDC amounts in base units (6 decimals)
+MIN_DEPOSIT_BALANCE = 1_000_000  # $1.00
+RESERVE_AMOUNT = 500_000         # $0.50 kept in the wallet
 
 def deposit_all_usdc():
     """Deposit all available USDC into Polymarket for trading"""
@@ -27,91 +32,73 @@ def deposit_all_usdc():
     print("=" * 60)
     
     # Get private key
-    private_key = os.getenv("POLYGON_WALLET_PRIVATE_KEY", "")
+    private_key = get_private_key()
     if not private_key:
         print("❌ No private key found in environment variables")
         return False
     
-    if not private_key.startswith("0x"):
-        private_key = "0x" + private_key
-    
     # Setup Web3
-    w3 = Web3(Web3.HTTPProvider(RPC_URL))
+    w3 = get_w3()
     if not w3.is_connected():
         print("❌ Failed to connect to Polygon network")
         return False
     
-    account = Account.from_key(private_key)
+    account = get_account()
     wallet_address = account.address
     
     print(f"Wallet address: {wallet_address}")
     
-    # Get current USDC balance
-    usdc_abi = [
-        {
-            "constant": True,
-            "inputs": [{"name": "account", "type": "address"}],
-            "name": "balanceOf",
-            "outputs": [{"name": "", "type": "uint256"}],
-            "payable": False,
-            "stateMutability": "view",
-            "type": "function"
-        },
-        {
-            "constant": False,
-            "inputs": [
-                {"name": "to", "type": "address"},
-                {"name": "value", "type": "uint256"}
-            ],
-            "name": "transfer",
-            "outputs": [{"name": "", "type": "bool"}],
-            "payable": False,
-            "stateMutability": "nonpayable",
-            "type": "function"
-        }
-    ]
-    
-    usdc_contract = w3.eth.contract(address=USDC_CONTRACT, abi=usdc_abi)
-    current_balance = usdc_contract.functions.balanceOf(wallet_address).call()
-    current_balance_usdc = current_balance / 10**6
+    # Get current USDC balance, gas price and nonce in one JSON-RPC batch
+    usdc = usdc_contract(w3)
+    try:
+        with w3.batch_requests() as batch:
+            batch.add(usdc.functions.balanceOf(wallet_address))
+            batch.add(w3.eth.gas_price)
+            batch.add(w3.eth.get_transaction_count(wallet_address, "pending"))
+            current_balance, gas_price, nonce = batch.execute()
+    except Exception:
+        # Provider rejected the batch; fall back to individual calls
+        current_balance = usdc.functions.balanceOf(wallet_address).call()
+        gas_price = w3.eth.gas_price
+        nonce = w3.eth.get_transaction_count(wallet_address, "pending")
     
-    print(f"Current wallet USDC: ${current_balance_usdc:.6f}")
+    print(f"Current wallet USDC: ${current_balance / 10**6:.6f}")
     
-    if current_balance_usdc < 1.0:
+    if current_balance < MIN_DEPOSIT_BALANCE:
         print("❌ Insufficient USDC balance to deposit (minimum $1)")
         return False
     
-    # Reserve a small amount for gas fees (keep $0.50 in wallet)
-    reserve_amount = 0.5
-    deposit_amount = current_balance_usdc - reserve_amount
+    # Reserve a small amount for gas fees; integer base units avoid float rounding
+    deposit_amount_wei = current_balance - RESERVE_AMOUNT
     
-    if deposit_amount <= 0:
+    if deposit_amount_wei <= 0:
         print("❌ Not enough USDC to deposit after reserving for gas")
         return False
     
-    print(f"💰 Depositing: ${deposit_amount:.2f} USDC")
-    print(f"💰 Keeping in wallet: ${reserve_amount:.2f} USDC")
+    print(f"💰 Depositing: ${deposit_amount_wei / 10**6:.2f} USDC")
+    print(f"💰 Keeping in wallet: ${RESERVE_AMOUNT / 10**6:.2f} USDC")
     
     try:
-        # Convert to wei (6 decimals for USDC)
-        deposit_amount_wei = int(deposit_amount * 10**6)
-        
-        # Get current gas price
-        gas_price = w3.eth.gas_price
+        # Gas limit from the weekly estimate cache; the amount does not change transfer gas
+        try:
+            gas_limit = cached_gas_limit(w3, USDC_CONTRACT, encode_transfer(POLYMARKET_EXCHANGE, 1), wallet_address)
+        except Exception:
+            gas_limit = 100000  # Standard gas limit for ERC20 transfer
         
-        # Build transaction
-        transaction = usdc_contract.functions.transfer(
-            POLYMARKET_EXCHANGE,
-            deposit_amount_wei
-        ).build_transaction({
-            'from': wallet_address,
-            'gas': 100000,  # Standard gas limit for ERC20 transfer
+        # Build transaction from pre-encoded calldata; every field is already known,
+        # so no contract dispatch or middleware-filled RPC calls are needed
+        transaction = {
+            'to': USDC_CONTRACT,
+            'data': encode_transfer(POLYMARKET_EXCHANGE, deposit_amount_wei),
+            'value': 0,
+            'gas': gas_limit,
             'gasPrice': gas_price,
-            'nonce': w3.eth.get_transaction_count(wallet_address),
-        })
+            'nonce': nonce,
+            'chainId': CHAIN_ID,
+        }
         
         # Sign transaction
-        signed_txn = w3.eth.account.sign_transaction(transaction, private_key)
+        signed_txn = account.sign_transaction(transaction)
         
         # Send transaction
         print(f"🔄 Sending deposit transaction...")
@@ -123,15 +110,15 @@ def deposit_all_usdc():
         
         # Wait for confirmation
         print("⏳ Waiting for transaction confirmation...")
-        receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+        receipt = wait_for_receipt(w3, tx_hash, timeout=300)
         
         if receipt.status == 1:
             print("✅ USDC deposit successful!")
-            print(f"💰 Deposited ${deposit_amount:.2f} USDC to Polymarket")
+            print(f"💰 Deposited ${deposit_amount_wei / 10**6:.2f} USDC to Polymarket")
             print(f"⛽ Gas used: {receipt.gasUsed:,}")
             
             # Check new balance
-            new_balance = usdc_contract.functions.balanceOf(wallet_address).call()
+            new_balance = usdc.functions.balanceOf(wallet_address).call()
             new_balance_usdc = new_balance / 10**6
             print(f"💰 Remaining wallet balance: ${new_balance_usdc:.6f} USDC")
             
@@ -144,6 +131,25 @@ def deposit_all_usdc():
         print(f"❌ Error during deposit: {e}")
         return False
 
+def bot_recognizes_balance():
+    """Check that the trading bot can read the balance, in-process when it can be imported"""
+    try:
+        from real_auto_trader import RealAutoTrader
+    except (ImportError, SystemExit):
+        import subprocess
+        result = subprocess.run(
+            ["python3", "real_auto_trader.py", "--test-balance"],
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+        return "Total Available" in result.stdout
+    
+    # The trader reads wallet + Polymarket balance on init, sharing our RPC connection
+    with contextlib.redirect_stdout(io.StringIO()) as output:
+        RealAutoTrader()
+    return "Total Available" in output.getvalue()
+
 def main():
     """Main function"""
     print("💰 DEPOSIT ALL USDC TO POLYMARKET")
@@ -159,14 +165,7 @@ def main():
         
         # Test the balance recognition
         try:
-            import subprocess
-            result = subprocess.run(
-                ["python3", "real_auto_trader.py", "--test-balance"],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            if "Total Available" in result.stdout:
+            if bot_recognizes_balance():
                 print("✅ Bot can now recognize deposited funds")
             else:
                 print("⚠️ Bot may still need time to recognize deposited funds")
@@ -4,71 +4,52 @@ Deposit USDC into Polymarket
 This script deposits USDC from your wallet into Polymarket's trading system
 """
 
-import os
 import sys
+import importlib.util
+import argparse
 from dotenv import load_dotenv
-from web3 import Web3
-from eth_account import Account
+from rpc_client import get_w3
+from contracts import usdc_contract
+from wallet import get_account, get_private_key
 
 # Load environment variables
 load_dotenv()
 
-# Import py-clob-client
-try:
-    from py_clob_client.client import ClobClient
-    from py_clob_client.constants import POLYGON
-except ImportError:
-    print("❌ py-clob-client not installed. Installing...")
-    os.system("pip install py-clob-client")
-    from py_clob_client.client import ClobClient
-    from py_clob_client.constants import POLYGON
+# Require py-clob-client up front rather than installing it at import time
+if importlib.util.find_spec("py_clob_client") is None:
+    sys.exit("❌ py-clob-client not installed. Run: pip install -r requirements.txt")
 
-# Constants
-USDC_CONTRACT = "0x3c499c542cEF5E3811e1192ce70d8cC03d5c3359"
-RPC_URL = "https://polygon-rpc.com"
+from py_clob_client.client import ClobClient
+from py_clob_client.constants import POLYGON
+from clob_creds import get_api_creds
 
-def deposit_usdc_to_polymarket():
+def deposit_usdc_to_polymarket(refresh_creds=False):
     """Deposit USDC into Polymarket for trading"""
     print("=" * 60)
     print("POLYMARKET USDC DEPOSIT TOOL")
     print("=" * 60)
     
     # Get private key
-    private_key = os.getenv("POLYGON_WALLET_PRIVATE_KEY", "")
+    private_key = get_private_key()
     if not private_key:
         print("❌ No private key found in environment variables")
         return
     
-    if not private_key.startswith("0x"):
-        private_key = "0x" + private_key
-    
     # Setup Web3
-    w3 = Web3(Web3.HTTPProvider(RPC_URL))
+    w3 = get_w3()
     if not w3.is_connected():
         print("❌ Failed to connect to Polygon network")
         return
     
-    account = Account.from_key(private_key)
+    account = get_account()
     wallet_address = account.address
     
     print(f"Wallet address: {wallet_address}")
     
     # Check current USDC balance
     try:
-        usdc_abi = [
-            {
-                "constant": True,
-                "inputs": [{"name": "account", "type": "address"}],
-                "name": "balanceOf",
-                "outputs": [{"name": "", "type": "uint256"}],
-                "payable": False,
-                "stateMutability": "view",
-                "type": "function"
-            }
-        ]
-        
-        usdc_contract = w3.eth.contract(address=USDC_CONTRACT, abi=usdc_abi)
-        wallet_balance = usdc_contract.functions.balanceOf(wallet_address).call()
+        usdc = usdc_contract(w3)
+        wallet_balance = usdc.functions.balanceOf(wallet_address).call()
         wallet_balance_usdc = wallet_balance / 10**6
         
         print(f"Current wallet USDC: ${wallet_balance_usdc:.6f}")
@@ -112,7 +93,7 @@ def deposit_usdc_to_polymarket():
         )
         
         # Set up API credentials
-        api_creds = client.create_or_derive_api_creds()
+        api_creds = get_api_creds(client, refresh=refresh_creds)
         client.set_api_creds(api_creds)
         print("✅ CLOB client initialized")
         
@@ -162,4 +143,7 @@ def deposit_usdc_to_polymarket():
         print("Please visit polymarket.com and deposit USDC manually")
 
 if __name__ == "__main__":
-    deposit_usdc_to_polymarket() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Deposit USDC into Polymarket")
+    parser.add_argument("--refresh-creds", action="store_true", help="derive new CLOB API credentials instead of using the cached ones")
+    args = parser.parse_args()
+    deposit_usdc_to_polymarket(refresh_creds=args.refresh_creds) 
\ No newline at end of file
@@ -1,236 +1,411 @@
 #!/usr/bin/env python3
-import os
 import sys
 import requests
 import json
-from typing import List, Dict, Any
+import io
+import queue
+import itertools
+import threading
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, NamedTuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Prefer orjson for faster parsing and serialization when it is installed
+try:
+    import orjson
+    from orjson import loads as json_loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    from json import loads as json_loads
+    ORJSON_AVAILABLE = False
 
-def discover_current_markets() -> List[Dict[str, Any]]:
-    """Discover current active markets from Polymarket's API"""
+# simdjson parses lazily, so only the fields we actually read become Python objects
+try:
+    import simdjson
+    SIMDJSON_AVAILABLE = True
+    JSON_OBJECT_TYPES = (dict, simdjson.Object)
+except ImportError:
+    SIMDJSON_AVAILABLE = False
+    JSON_OBJECT_TYPES = (dict,)
+
+# ijson streams the large gamma /events payload one event at a time
+try:
+    import ijson
     try:
-        print("🔍 Discovering current active markets from Polymarket...")
-        
-        # Use the correct Polymarket API endpoint for current markets
-        api_url = "https://gamma-api.polymarket.com/events"
-        
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Accept": "application/json",
-            "Content-Type": "application/json"
-        }
-        
-        params = {
-            "limit": 20,
-            "offset": 0,
-            "active": "true",
-            "closed": "false",
-            "archived": "false"
-        }
-        
+        ijson = ijson.get_backend("yajl2_c")
+    except ImportError:
+        pass  # C backend not built; use ijson's default
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# One pooled, keep-alive session shared by every discovery request
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Accept": "application/json",
+    "Content-Type": "application/json"
+})
+_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
+# Largest response body a simdjson parser will accept
+SIMDJSON_MAX_CAPACITY = 16 * 1024 * 1024
+
+# simdjson parsers are not thread-safe, so each fetch thread holds its own
+_parser_local = threading.local()
+
+# Parsers handed back by finished fetches, so they survive across discovery runs
+_idle_parsers = queue.SimpleQueue()
+
+def get_parser():
+    """Return this thread's simdjson parser, reusing an idle one when available"""
+    parser = getattr(_parser_local, "parser", None)
+    if parser is None:
+        try:
+            parser = _idle_parsers.get_nowait()
+        except queue.Empty:
+            parser = simdjson.Parser(max_capacity=SIMDJSON_MAX_CAPACITY)
+        _parser_local.parser = parser
+    return parser
+
+def release_parser():
+    """Hand this thread's parser back for the next fetch to reuse"""
+    parser = getattr(_parser_local, "parser", None)
+    if parser is not None:
+        _parser_local.parser = None
+        _idle_parsers.put(parser)
+
+def parse_response(content: bytes):
+    """Parse a response body, as a lazy simdjson document when simdjson is installed"""
+    if SIMDJSON_AVAILABLE:
         try:
-            response = requests.get(api_url, headers=headers, params=params, timeout=15)
-            print(f"API Response Status: {response.status_code}")
+            return get_parser().parse(content)
+        except RuntimeError:
+            pass  # The parser is still referenced by a live document
+    return json_loads(content)
+
+def to_python(value):
+    """Materialize a simdjson array/object into plain Python; other values pass through"""
+    if SIMDJSON_AVAILABLE:
+        if isinstance(value, simdjson.Array):
+            return value.as_list()
+        if isinstance(value, simdjson.Object):
+            return value.as_dict()
+    return value
+
+def read_events(response):
+    """Iterate the events of a gamma /events response, streaming them with ijson when installed"""
+    if IJSON_AVAILABLE:
+        response.raw.decode_content = True
+        reader = io.BufferedReader(response.raw)
+        if reader.peek(64).lstrip()[:1] == b"[":
+            return ijson.items(reader, "item", use_float=True)
+        data = parse_response(reader.read())  # Wrapped object: parse it whole
+    else:
+        data = parse_response(response.content)
+    
+    # Handle different response formats
+    if isinstance(data, JSON_OBJECT_TYPES):
+        return data.get("data", data.get("events", []))
+    return data
+
+class MarketInfo(NamedTuple):
+    """One discovered market, as saved to current_markets.json"""
+    condition_id: str
+    question: str
+    description: str
+    end_date: str
+    active: bool
+    volume: float
+    tokens: tuple
+    event_title: str = ""
+    event_slug: str = ""
+    market_id: str = ""
+
+def to_tokens(value) -> tuple:
+    """Normalize clobTokenIds (a list or the JSON-encoded string the APIs return) to a tuple"""
+    value = to_python(value)
+    if isinstance(value, str):
+        try:
+            value = json_loads(value)
+        except ValueError:
+            return ()
+    return tuple(value or ())
+
+def to_volume(value) -> float:
+    """Coerce an API volume (number, numeric string or null) to float"""
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+def _fetch_gamma(log: List[str]) -> List[MarketInfo]:
+    """Current markets from the gamma /events API, or [] on failure"""
+    # Use the correct Polymarket API endpoint for current markets
+    api_url = "https://gamma-api.polymarket.com/events"
+    
+    params = {
+        "limit": 20,
+        "offset": 0,
+        "active": "true",
+        "closed": "false",
+        "archived": "false"
+    }
+    
+    try:
+        with _SESSION.get(api_url, params=params, timeout=15, stream=True) as response:
+            log.append(f"API Response Status: {response.status_code}")
             
             if response.status_code == 200:
-                data = response.json()
-                
-                # Handle different response formats
-                if isinstance(data, dict):
-                    events = data.get("data", data.get("events", []))
-                else:
-                    events = data
+                events = read_events(response)
                 
                 current_markets = []
-                current_year = datetime.now().year
+                current_year_str = str(datetime.now().year)
                 
                 for event in events:
-                    if not isinstance(event, dict):
+                    if not isinstance(event, JSON_OBJECT_TYPES):
                         continue
                     
-                    # Check if event is current (2025 or later)
-                    end_date = event.get("endDate", "")
-                    if end_date:
-                        try:
-                            end_year = datetime.fromisoformat(end_date.replace('Z', '+00:00')).year
-                            if end_year < current_year:
-                                continue  # Skip old events
-                        except:
-                            pass  # If date parsing fails, include the event
+                    # Check if event is current (2025 or later); only the year is
+                    # needed, so read it from the ISO string instead of parsing a datetime
+                    event_end = event.get("endDate") or ""
+                    end_year = event_end[:4]
+                    if end_year.isdigit() and end_year < current_year_str:
+                        continue  # Skip old events; unparseable dates are included
                     
                     # Extract market information
+                    event_title = event.get("title", "")
+                    event_slug = event.get("slug", "")
                     markets = event.get("markets", [])
                     for market in markets:
-                        if isinstance(market, dict):
-                            condition_id = market.get("conditionId")
+                        if isinstance(market, JSON_OBJECT_TYPES):
+                            mget = market.get
+                            condition_id = mget("conditionId")
                             if condition_id:
-                                market_info = {
-                                    "condition_id": condition_id,
-                                    "question": market.get("question", ""),
-                                    "description": market.get("description", ""),
-                                    "end_date": market.get("endDate", event.get("endDate", "")),
-                                    "active": market.get("active", True),
-                                    "volume": market.get("volume", 0),
-                                    "tokens": market.get("clobTokenIds", []),
-                                    "event_title": event.get("title", ""),
-                                    "event_slug": event.get("slug", "")
-                                }
-                                current_markets.append(market_info)
+                                current_markets.append(MarketInfo(
+                                    condition_id=condition_id,
+                                    question=mget("question", ""),
+                                    description=mget("description", ""),
+                                    end_date=mget("endDate") or event_end,
+                                    active=mget("active", True),
+                                    volume=to_volume(mget("volume")),
+                                    tokens=to_tokens(mget("clobTokenIds")),
+                                    event_title=event_title,
+                                    event_slug=event_slug
+                                ))
                 
-                print(f"✅ Found {len(current_markets)} current active markets")
+                log.append(f"✅ Found {len(current_markets)} current active markets")
                 return current_markets
                 
-        except Exception as e:
-            print(f"❌ Gamma API failed: {e}")
+    except Exception as e:
+        log.append(f"❌ Gamma API failed: {e}")
+    
+    return []
+
+def _fetch_clob(log: List[str]) -> List[MarketInfo]:
+    """Current markets from the CLOB /markets API, or [] on failure"""
+    # Try alternative CLOB API for current markets
+    clob_url = "https://clob.polymarket.com/markets"
+    
+    try:
+        clob_params = {
+            "active": "true",
+            "closed": "false",
+            "limit": 20
+        }
         
-        # Try alternative CLOB API for current markets
-        clob_url = "https://clob.polymarket.com/markets"
+        response = _SESSION.get(clob_url, params=clob_params, timeout=15)
+        log.append(f"CLOB API Response Status: {response.status_code}")
         
-        try:
-            clob_params = {
-                "active": "true",
-                "closed": "false",
-                "limit": 20
-            }
+        if response.status_code == 200:
+            data = parse_response(response.content)
+            markets = data.get("data", []) if isinstance(data, JSON_OBJECT_TYPES) else data
             
-            response = requests.get(clob_url, headers=headers, params=clob_params, timeout=15)
-            print(f"CLOB API Response Status: {response.status_code}")
+            current_markets = []
+            current_year_str = str(datetime.now().year)
             
-            if response.status_code == 200:
-                data = response.json()
-                markets = data.get("data", []) if isinstance(data, dict) else data
+            for market in markets:
+                if not isinstance(market, JSON_OBJECT_TYPES):
+                    continue
                 
-                current_markets = []
-                current_year = datetime.now().year
+                # Check if market is current
+                mget = market.get
+                end_date = mget("endDate") or mget("end_date") or ""
+                end_year = end_date[:4]
+                if end_year.isdigit() and end_year < current_year_str:
+                    continue
                 
-                for market in markets:
-                    if not isinstance(market, dict):
-                        continue
+                if mget("active", False):
+                    market_info = MarketInfo(
+                        condition_id=mget("conditionId") or mget("condition_id"),
+                        question=mget("question", ""),
+                        description=mget("description", ""),
+                        end_date=end_date,
+                        active=mget("active", True),
+                        volume=to_volume(mget("volume", mget("volumeNum"))),
+                        tokens=to_tokens(mget("clobTokenIds")),
+                        market_id=mget("id", "")
+                    )
                     
-                    # Check if market is current
-                    end_date = market.get("endDate", market.get("end_date", ""))
-                    if end_date:
-                        try:
-                            end_year = datetime.fromisoformat(end_date.replace('Z', '+00:00')).year
-                            if end_year < current_year:
-                                continue
-                        except:
-                            pass
+                    if market_info.condition_id:
+                        current_markets.append(market_info)
+            
+            log.append(f"✅ Found {len(current_markets)} current markets from CLOB API")
+            return current_markets
+            
+    except Exception as e:
+        log.append(f"❌ CLOB API failed: {e}")
+    
+    return []
+
+def _fetch_site(log: List[str]) -> List[MarketInfo]:
+    """Up to 10 active markets from the main site API, or [] on failure"""
+    # Try to get some current markets from the main site
+    try:
+        site_url = "https://polymarket.com/api/markets"
+        response = _SESSION.get(site_url, timeout=10)
+        
+        if response.status_code == 200:
+            data = parse_response(response.content)
+            markets = data.get("data", []) if isinstance(data, JSON_OBJECT_TYPES) else data
+            
+            current_markets = []
+            for market in itertools.islice(markets, 10):  # Limit to first 10
+                if isinstance(market, JSON_OBJECT_TYPES) and market.get("active"):
+                    mget = market.get
+                    market_info = MarketInfo(
+                        condition_id=mget("conditionId") or mget("condition_id"),
+                        question=mget("question") or mget("title", ""),
+                        description=mget("description", ""),
+                        end_date=mget("endDate", ""),
+                        active=True,
+                        volume=to_volume(mget("volume")),
+                        tokens=to_tokens(mget("clobTokenIds"))
+                    )
                     
-                    if market.get("active", False):
-                        market_info = {
-                            "condition_id": market.get("conditionId", market.get("condition_id")),
-                            "question": market.get("question", ""),
-                            "description": market.get("description", ""),
-                            "end_date": end_date,
-                            "active": market.get("active", True),
-                            "volume": market.get("volume", market.get("volumeNum", 0)),
-                            "tokens": market.get("clobTokenIds", []),
-                            "market_id": market.get("id", "")
-                        }
-                        
-                        if market_info["condition_id"]:
-                            current_markets.append(market_info)
-                
-                print(f"✅ Found {len(current_markets)} current markets from CLOB API")
+                    if market_info.condition_id:
+                        current_markets.append(market_info)
+            
+            if current_markets:
+                log.append(f"✅ Found {len(current_markets)} markets from main site")
                 return current_markets
                 
-        except Exception as e:
-            print(f"❌ CLOB API failed: {e}")
-        
-        # If both APIs fail, try to get some known current condition IDs
-        print("⚠️  APIs failed, trying to find current markets manually...")
+    except Exception as e:
+        log.append(f"❌ Main site API failed: {e}")
+    
+    return []
+
+def _run_fetch(fetch, log: List[str]) -> List[MarketInfo]:
+    """Run one source fetch on a worker thread, then hand its parser back"""
+    try:
+        return fetch(log)
+    finally:
+        if SIMDJSON_AVAILABLE:
+            release_parser()
+
+def discover_current_markets() -> List[MarketInfo]:
+    """Discover current active markets from Polymarket's API"""
+    try:
+        print("🔍 Discovering current active markets from Polymarket...")
         
-        # Try to get some current markets from the main site
+        # Query all three sources at once so a failing source doesn't delay the
+        # next; results are still taken in preference order gamma, CLOB, site.
+        # Each source logs into its own list, and only the sources actually
+        # consulted are printed, so a losing fetch never reaches the output
+        executor = ThreadPoolExecutor(max_workers=3)
         try:
-            site_url = "https://polymarket.com/api/markets"
-            response = requests.get(site_url, headers=headers, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                markets = data.get("data", []) if isinstance(data, dict) else data
-                
-                current_markets = []
-                for market in markets[:10]:  # Limit to first 10
-                    if isinstance(market, dict) and market.get("active"):
-                        market_info = {
-                            "condition_id": market.get("conditionId", market.get("condition_id")),
-                            "question": market.get("question", market.get("title", "")),
-                            "description": market.get("description", ""),
-                            "end_date": market.get("endDate", ""),
-                            "active": True,
-                            "volume": market.get("volume", 0),
-                            "tokens": market.get("clobTokenIds", [])
-                        }
-                        
-                        if market_info["condition_id"]:
-                            current_markets.append(market_info)
-                
+            fetches = []
+            for fetch in (_fetch_gamma, _fetch_clob, _fetch_site):
+                log = []
+                fetches.append((executor.submit(_run_fetch, fetch, log), log))
+            for future, log in fetches:
+                current_markets = future.result()
+                for line in log:
+                    print(line)
                 if current_markets:
-                    print(f"✅ Found {len(current_markets)} markets from main site")
                     return current_markets
-                    
-        except Exception as e:
-            print(f"❌ Main site API failed: {e}")
+        finally:
+            # Don't wait on the slower sources once a result is chosen
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        print("⚠️  APIs failed, no current markets found")
         
         # Last resort: return some test condition IDs
         print("⚠️  Using fallback test condition IDs for development")
         return [
-            {
-                "condition_id": "0x1234567890abcdef1234567890abcdef12345678",
-                "question": "Will Bitcoin reach $150,000 by end of 2025?",
-                "description": "Test market for Bitcoin price prediction",
-                "end_date": "2025-12-31T23:59:59Z",
-                "active": True,
-                "volume": 1000000,
-                "tokens": ["123456789", "987654321"]
-            },
-            {
-                "condition_id": "0xabcdef1234567890abcdef1234567890abcdef12",
-                "question": "Will there be a major AI breakthrough in 2025?",
-                "description": "Test market for AI development prediction",
-                "end_date": "2025-12-31T23:59:59Z",
-                "active": True,
-                "volume": 500000,
-                "tokens": ["111222333", "444555666"]
-            }
+            MarketInfo(
+                condition_id="0x1234567890abcdef1234567890abcdef12345678",
+                question="Will Bitcoin reach $150,000 by end of 2025?",
+                description="Test market for Bitcoin price prediction",
+                end_date="2025-12-31T23:59:59Z",
+                active=True,
+                volume=1000000.0,
+                tokens=("123456789", "987654321")
+            ),
+            MarketInfo(
+                condition_id="0xabcdef1234567890abcdef1234567890abcdef12",
+                question="Will there be a major AI breakthrough in 2025?",
+                description="Test market for AI development prediction",
+                end_date="2025-12-31T23:59:59Z",
+                active=True,
+                volume=500000.0,
+                tokens=("111222333", "444555666")
+            )
         ]
         
     except Exception as e:
         print(f"❌ Error discovering markets: {e}")
         return []
 
-def save_markets_to_file(markets: List[Dict[str, Any]], filename: str = "current_markets.json"):
+def save_markets_to_file(markets: List[MarketInfo], filename: str = "current_markets.json"):
     """Save discovered markets to a JSON file"""
     try:
-        with open(filename, 'w') as f:
-            json.dump(markets, f, indent=2)
+        # Tokens were already decoded to a tuple, so the trading bots get a
+        # list they don't have to re-parse on every load
+        markets = [market._asdict() for market in markets]
+        
+        if ORJSON_AVAILABLE:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(markets, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(markets, f, indent=2)
         print(f"💾 Saved {len(markets)} markets to {filename}")
     except Exception as e:
         print(f"❌ Error saving markets: {e}")
 
-def print_market_summary(markets: List[Dict[str, Any]]):
+def print_market_summary(markets: List[MarketInfo]):
     """Print a summary of discovered markets"""
     print(f"\n📊 CURRENT MARKETS SUMMARY")
     print("=" * 60)
     
+    # One write per market instead of one print per line
+    write = sys.stdout.write
     for i, market in enumerate(markets, 1):
-        print(f"\n{i}. Condition ID: {market.get('condition_id', 'N/A')}")
-        print(f"   Question: {market.get('question', 'N/A')[:80]}...")
-        print(f"   Active: {market.get('active', 'Unknown')}")
-        print(f"   End Date: {market.get('end_date', 'N/A')}")
-        print(f"   Volume: ${float(market.get('volume', 0)):,.2f}")
+        lines = [
+            f"\n{i}. Condition ID: {market.condition_id or 'N/A'}",
+            f"   Question: {(market.question or 'N/A')[:80]}...",
+            f"   Active: {market.active}",
+            f"   End Date: {market.end_date or 'N/A'}",
+            f"   Volume: ${market.volume:,.2f}",
+        ]
         
         # Show token information if available
-        tokens = market.get("tokens", [])
+        tokens = market.tokens
         if tokens:
-            print(f"   Tokens: {len(tokens)} available")
-            for j, token in enumerate(tokens[:2]):  # Show first 2 tokens
-                print(f"     Token {j+1}: {token}")
+            lines.append(f"   Tokens: {len(tokens)} available")
+            lines.append(f"     Token 1: {tokens[0]}")  # Show first 2 tokens
+            if len(tokens) > 1:
+                lines.append(f"     Token 2: {tokens[1]}")
+        write("\n".join(lines) + "\n")
 
 def main():
     """Main function to discover and display current markets"""
@@ -254,11 +429,11 @@ def main():
         # Show how to use in trading bot
         if markets:
             first_market = markets[0]
-            condition_id = first_market.get("condition_id")
+            condition_id = first_market.condition_id
             print(f"\n🤖 Example usage in real trading bot:")
             print(f"   condition_id = \"{condition_id}\"")
             print(f"   market = clob_client.get_market(condition_id)")
-            print(f"   # Question: {first_market.get('question', 'N/A')}")
+            print(f"   # Question: {first_market.question or 'N/A'}")
     else:
         print("❌ No current markets discovered. Check your internet connection and try again.")
 
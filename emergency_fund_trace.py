@@ -4,13 +4,18 @@ EMERGENCY FUND TRACER
 This script traces all USDC transactions to find your missing $134 USDC
 """
 
-import os
-import requests
-from dotenv import load_dotenv
-from web3 import Web3
+import sys
 
-# Load environment variables
-load_dotenv()
+# Prefer orjson for faster parsing when it is installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+from rpc_client import get_session, get_w3
+from contracts import MULTICALL3_ABI, MULTICALL3_ADDRESS, TRANSFER_TOPIC, USDC_CONTRACT, encode_balance_of, usdc_contract
+
+# How far back to search transfer logs (~5 days of Polygon blocks)
+LOG_LOOKBACK_BLOCKS = 200_000
 
 def emergency_fund_trace():
     """Emergency trace of all USDC movements"""
@@ -19,38 +24,32 @@ def emergency_fund_trace():
     print("🚨" * 30)
     
     # Setup Web3
-    w3 = Web3(Web3.HTTPProvider("https://polygon-rpc.com"))
+    w3 = get_w3()
     
     # Wallet addresses
     wallet1 = "0xb3A635E05d1a159b0d2658d3F0e7D59cd4643633"  # Bot wallet
     wallet2 = "0x3E1B662bB2FD32D7eb6c57221296205C9D48D012"  # Polymarket wallet
     
     # Contract addresses
-    usdc_contract = "0x3c499c542cEF5E3811e1192ce70d8cC03d5c3359"
     polymarket_exchange = "0x4bFb41d5B3570DeFd03C39a9A4D8dE6Bd8B8982E"
     
-    # USDC ABI
-    usdc_abi = [
-        {
-            "constant": True,
-            "inputs": [{"name": "account", "type": "address"}],
-            "name": "balanceOf",
-            "outputs": [{"name": "", "type": "uint256"}],
-            "payable": False,
-            "stateMutability": "view",
-            "type": "function"
-        }
-    ]
-    
-    usdc = w3.eth.contract(address=usdc_contract, abi=usdc_abi)
+    usdc = usdc_contract(w3)
     
     print("💰 CURRENT BALANCES:")
     print("-" * 50)
     
-    # Check all relevant balances
-    balance1 = usdc.functions.balanceOf(wallet1).call() / 10**6
-    balance2 = usdc.functions.balanceOf(wallet2).call() / 10**6
-    exchange_balance = usdc.functions.balanceOf(polymarket_exchange).call() / 10**6
+    # Check all relevant balances in one Multicall3 aggregate3 call
+    addresses = (wallet1, wallet2, polymarket_exchange)
+    try:
+        multicall = w3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+        results = multicall.functions.aggregate3(
+            [(USDC_CONTRACT, False, encode_balance_of(address)) for address in addresses]
+        ).call()
+        balances = [int.from_bytes(data, "big") for _, data in results]
+    except Exception:
+        # Multicall unavailable; read each balance separately
+        balances = [usdc.functions.balanceOf(address).call() for address in addresses]
+    balance1, balance2, exchange_balance = (balance / 10**6 for balance in balances)
     
     print(f"Bot Wallet ({wallet1}): ${balance1:.6f} USDC")
     print(f"Polymarket Wallet ({wallet2}): ${balance2:.6f} USDC")
@@ -72,11 +71,26 @@ def emergency_fund_trace():
         "0xa963abfebe3e7b558dcd4c212b6a0b22bb9ce9a13852646dbcd32623b390ac0d"   # Failed transfer
     ]
     
+    # Fetch every transaction and receipt in one JSON-RPC batch
+    try:
+        with w3.batch_requests() as batch:
+            for tx_hash in known_txs:
+                batch.add(w3.eth.get_transaction(tx_hash))
+                batch.add(w3.eth.get_transaction_receipt(tx_hash))
+            responses = batch.execute()
+        fetched = dict(zip(known_txs, zip(responses[::2], responses[1::2])))
+    except Exception:
+        # Batch failed (e.g. an unknown hash); fetch per transaction below
+        fetched = {}
+    
     for i, tx_hash in enumerate(known_txs, 1):
         print(f"Transaction {i}: {tx_hash}")
         try:
-            tx = w3.eth.get_transaction(tx_hash)
-            receipt = w3.eth.get_transaction_receipt(tx_hash)
+            if tx_hash in fetched:
+                tx, receipt = fetched[tx_hash]
+            else:
+                tx = w3.eth.get_transaction(tx_hash)
+                receipt = w3.eth.get_transaction_receipt(tx_hash)
             
             print(f"   From: {tx['from']}")
             print(f"   To: {tx['to']}")
@@ -88,95 +102,159 @@ def emergency_fund_trace():
             print(f"   ❌ Error getting transaction: {e}")
             print()
     
-    print("🔍 ANALYSIS:")
-    print("-" * 50)
+    # Write the analysis and advice banners in one go
+    out = ["🔍 ANALYSIS:", "-" * 50]
     
     if total_found < 10:
-        print("🚨 CRITICAL: Most of your USDC is missing!")
-        print("   Possible causes:")
-        print("   1. Funds were sent to wrong address")
-        print("   2. Multiple transactions we haven't tracked")
-        print("   3. Funds are in a different contract")
-        print("   4. Network/RPC issues showing wrong balances")
+        out += [
+            "🚨 CRITICAL: Most of your USDC is missing!",
+            "   Possible causes:",
+            "   1. Funds were sent to wrong address",
+            "   2. Multiple transactions we haven't tracked",
+            "   3. Funds are in a different contract",
+            "   4. Network/RPC issues showing wrong balances",
+        ]
     
-    print()
-    print("🔧 IMMEDIATE ACTIONS:")
-    print("-" * 50)
-    print("1. Check PolygonScan for your wallet:")
-    print(f"   https://polygonscan.com/address/{wallet1}")
-    print(f"   https://polygonscan.com/address/{wallet2}")
-    print()
-    print("2. Look for ALL recent USDC transactions")
-    print("3. Check if funds went to any other addresses")
-    print("4. Verify your MetaMask is connected to Polygon network")
-    print()
-    print("🆘 RECOVERY OPTIONS:")
-    print("-" * 50)
-    print("1. If funds are in wrong contract - may be recoverable")
-    print("2. If sent to wrong address - depends on the address")
-    print("3. Contact Polymarket support immediately")
-    print("4. Check all transaction history on PolygonScan")
+    out += [
+        "",
+        "🔧 IMMEDIATE ACTIONS:",
+        "-" * 50,
+        "1. Check PolygonScan for your wallet:",
+        f"   https://polygonscan.com/address/{wallet1}",
+        f"   https://polygonscan.com/address/{wallet2}",
+        "",
+        "2. Look for ALL recent USDC transactions",
+        "3. Check if funds went to any other addresses",
+        "4. Verify your MetaMask is connected to Polygon network",
+        "",
+        "🆘 RECOVERY OPTIONS:",
+        "-" * 50,
+        "1. If funds are in wrong contract - may be recoverable",
+        "2. If sent to wrong address - depends on the address",
+        "3. Contact Polymarket support immediately",
+        "4. Check all transaction history on PolygonScan",
+    ]
+    sys.stdout.write("\n".join(out) + "\n")
     
     return balance1, balance2, total_found
 
+def fetch_transfer_logs(wallet, limit=10):
+    """Latest USDC transfers in or out of wallet, read from eth_getLogs on our node"""
+    w3 = get_w3()
+    padded = "0x" + wallet[2:].lower().rjust(64, "0")
+    log_filter = {
+        "fromBlock": max(w3.eth.block_number - LOG_LOOKBACK_BLOCKS, 0),
+        "toBlock": "latest",
+        "address": USDC_CONTRACT
+    }
+    
+    # Outgoing (wallet is topic1) and incoming (wallet is topic2) in one batch
+    with w3.batch_requests() as batch:
+        batch.add(w3.eth.get_logs({**log_filter, "topics": [TRANSFER_TOPIC, padded, None]}))
+        batch.add(w3.eth.get_logs({**log_filter, "topics": [TRANSFER_TOPIC, None, padded]}))
+        outgoing, incoming = batch.execute()
+    
+    # A self-transfer matches both filters; keep one copy of each log
+    logs = {(log["transactionHash"], log["logIndex"]): log for log in outgoing + incoming}
+    ordered = sorted(logs.values(), key=lambda log: (log["blockNumber"], log["logIndex"]), reverse=True)
+    
+    # Shape each log like a PolygonScan tokentx entry
+    transfers = [
+        {
+            "from": "0x" + log["topics"][1][-20:].hex(),
+            "to": "0x" + log["topics"][2][-20:].hex(),
+            "value": int.from_bytes(log["data"], "big"),
+            "hash": "0x" + log["transactionHash"].hex().removeprefix("0x"),
+            "blockNumber": log["blockNumber"]
+        }
+        for log in ordered[:limit]
+    ]
+    return transfers
+
+def fetch_polygonscan_transfers(wallet):
+    """Latest 10 USDC transfers for wallet from the PolygonScan API, or [] on failure"""
+    # PolygonScan API (free tier)
+    api_url = "https://api.polygonscan.com/api"
+    
+    # Get ERC20 token transfers for USDC
+    params = {
+        "module": "account",
+        "action": "tokentx",
+        "contractaddress": USDC_CONTRACT,
+        "address": wallet,
+        "page": 1,
+        "offset": 10,  # Only the last 10 are shown
+        "sort": "desc"
+    }
+    
+    response = get_session().get(api_url, params=params, timeout=10)
+    data = json_loads(response.content)
+    
+    if data.get("status") == "1" and data.get("result"):
+        return data["result"]
+    return []
+
 def check_transaction_history():
-    """Check transaction history using PolygonScan API"""
+    """Check USDC transfer history straight from the chain, PolygonScan as fallback"""
     print("\n📊 CHECKING TRANSACTION HISTORY...")
     print("-" * 50)
     
     wallet1 = "0xb3A635E05d1a159b0d2658d3F0e7D59cd4643633"
-    usdc_contract = "0x3c499c542cEF5E3811e1192ce70d8cC03d5c3359"
-    
-    # PolygonScan API (free tier)
-    api_url = "https://api.polygonscan.com/api"
     
     try:
-        # Get ERC20 token transfers for USDC
-        params = {
-            "module": "account",
-            "action": "tokentx",
-            "contractaddress": usdc_contract,
-            "address": wallet1,
-            "page": 1,
-            "offset": 100,
-            "sort": "desc"
-        }
+        try:
+            transactions = fetch_transfer_logs(wallet1)
+            logs_answered = True
+        except Exception:
+            # Node rejected the log query (e.g. block range limits)
+            transactions = []
+            logs_answered = False
         
-        response = requests.get(api_url, params=params, timeout=10)
-        data = response.json()
+        if not transactions:
+            # Nothing in the lookback window: older transfers may still exist
+            try:
+                transactions = fetch_polygonscan_transfers(wallet1)
+            except Exception:
+                if not logs_answered:
+                    raise
         
-        if data.get("status") == "1" and data.get("result"):
-            transactions = data["result"]
-            print(f"Found {len(transactions)} USDC transactions:")
-            print()
+        if transactions:
+            out = [f"Found {len(transactions)} USDC transactions:", ""]
             
             total_out = 0
             total_in = 0
+            wallet_addr = wallet1.lower()
             
-            for tx in transactions[:10]:  # Show last 10 transactions
+            for tx in transactions:  # Already limited to the last 10
                 value = int(tx["value"]) / 10**6
                 from_addr = tx["from"].lower()
                 to_addr = tx["to"].lower()
-                wallet_addr = wallet1.lower()
                 
                 if from_addr == wallet_addr:
                     direction = "OUT"
                     total_out += value
-                    print(f"📤 OUT: ${value:.2f} USDC to {to_addr[:10]}...")
+                    out.append(f"📤 OUT: ${value:.2f} USDC to {to_addr[:10]}...")
                 elif to_addr == wallet_addr:
                     direction = "IN"
                     total_in += value
-                    print(f"📥 IN:  ${value:.2f} USDC from {from_addr[:10]}...")
+                    out.append(f"📥 IN:  ${value:.2f} USDC from {from_addr[:10]}...")
                 
-                print(f"    Hash: {tx['hash']}")
-                print(f"    Time: {tx['timeStamp']}")
-                print()
+                out.append(f"    Hash: {tx['hash']}")
+                out.append(f"    Block: {tx['blockNumber']}")
+                out.append("")
             
-            print(f"💰 SUMMARY (last 10 transactions):")
-            print(f"   Total IN:  ${total_in:.2f} USDC")
-            print(f"   Total OUT: ${total_out:.2f} USDC")
-            print(f"   Net:       ${total_in - total_out:.2f} USDC")
+            out += [
+                f"💰 SUMMARY (last 10 transactions):",
+                f"   Total IN:  ${total_in:.2f} USDC",
+                f"   Total OUT: ${total_out:.2f} USDC",
+                f"   Net:       ${total_in - total_out:.2f} USDC",
+            ]
+            sys.stdout.write("\n".join(out) + "\n")
             
+        elif logs_answered:
+            print(f"ℹ️  No USDC transfers in the last {LOG_LOOKBACK_BLOCKS:,} blocks")
+            print("For older history, check manually on PolygonScan:")
+            print(f"https://polygonscan.com/address/{wallet1}#tokentxns")
         else:
             print("❌ Could not fetch transaction history")
             print("Please check manually on PolygonScan:")
@@ -191,18 +269,20 @@ def main():
     balance1, balance2, total_found = emergency_fund_trace()
     check_transaction_history()
     
-    print("\n" + "🚨" * 30)
-    print("EMERGENCY SUMMARY")
-    print("🚨" * 30)
-    print(f"💰 Expected: $134.00 USDC")
-    print(f"💰 Found: ${total_found:.2f} USDC")
-    print(f"🚨 Missing: ${134 - total_found:.2f} USDC")
-    print()
-    print("🆘 NEXT STEPS:")
-    print("1. Check PolygonScan links above")
-    print("2. Look for any large USDC transfers")
-    print("3. Contact Polymarket support if funds went to their contracts")
-    print("4. If funds went to unknown address, they may be lost")
+    sys.stdout.write("\n".join([
+        "\n" + "🚨" * 30,
+        "EMERGENCY SUMMARY",
+        "🚨" * 30,
+        f"💰 Expected: $134.00 USDC",
+        f"💰 Found: ${total_found:.2f} USDC",
+        f"🚨 Missing: ${134 - total_found:.2f} USDC",
+        "",
+        "🆘 NEXT STEPS:",
+        "1. Check PolygonScan links above",
+        "2. Look for any large USDC transfers",
+        "3. Contact Polymarket support if funds went to their contracts",
+        "4. If funds went to unknown address, they may be lost",
+    ]) + "\n")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
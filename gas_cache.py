@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Cached gas limits for repeated contract calls
+
+Gas for a fixed call such as an ERC20 transfer barely changes, so the
+estimate (plus 20% headroom) is kept in ~/.polytrader/gas_cache.json and
+re-estimated weekly instead of on every run.
+"""
+
+import os
+import json
+import time
+from rpc_client import CHAIN_ID
+
+# Constants
+GAS_CACHE_PATH = os.path.expanduser("~/.polytrader/gas_cache.json")
+GAS_CACHE_MAX_AGE = 7 * 24 * 60 * 60  # seconds
+
+def load_gas_cache():
+    """Return the cached gas limits, or an empty dict if none are readable"""
+    try:
+        with open(GAS_CACHE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def cached_gas_limit(w3, to, data, from_address):
+    """Gas limit for calling `to` with calldata `data`, estimated at most once a week per chain/contract/selector"""
+    key = f"{CHAIN_ID}:{to}:0x{data[:4].hex()}"
+    cache = load_gas_cache()
+    entry = cache.get(key)
+    if entry and time.time() - entry["time"] < GAS_CACHE_MAX_AGE:
+        return entry["gas"]
+    
+    gas = w3.eth.estimate_gas({'from': from_address, 'to': to, 'data': data}) * 12 // 10
+    cache[key] = {"gas": gas, "time": time.time()}
+    try:
+        os.makedirs(os.path.dirname(GAS_CACHE_PATH), exist_ok=True)
+        with open(GAS_CACHE_PATH, "w") as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print(f"⚠️ Could not cache gas estimate: {e}")
+    return gas
@@ -12,13 +12,28 @@ Combines multiple strategies to bypass Cloudflare and execute trades automatical
 import os
 import sys
 import time
+import queue
+import atexit
+import logging
+from logging.handlers import QueueHandler, QueueListener
 import random
+import asyncio
+import aiohttp
+import re
 import json
+import threading
 import requests
-from typing import Dict, Any, Optional, List
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, Optional, List, Tuple
 from dotenv import load_dotenv
 from web3 import Web3
 from eth_account import Account
+import numpy as np
+from contracts import encode_balance_of
+from trader_kernels import score_edge, score_edge_batch
+from collections import namedtuple
+from functools import lru_cache
 from concurrent.futures import ThreadPoolExecutor
 import subprocess
 
@@ -39,17 +54,70 @@ try:
     from py_clob_client.constants import POLYGON
     from py_clob_client.order_builder.constants import BUY, SELL
     from py_clob_client.exceptions import PolyApiException
-    from py_clob_client.clob_types import ApiCreds, MarketOrderArgs, OrderType
+    from py_clob_client.clob_types import ApiCreds, BookParams, MarketOrderArgs, OrderType
     CLOB_AVAILABLE = True
 except ImportError:
     CLOB_AVAILABLE = False
 
+# py-clob-client sends every request through one module-level httpx client
+try:
+    import httpx
+    from py_clob_client.http_helpers import helpers as clob_http_helpers
+    CLOB_HTTP_PATCHABLE = hasattr(clob_http_helpers, "_http_client")
+except ImportError:
+    CLOB_HTTP_PATCHABLE = False
+
+# Prefer orjson for faster parsing when it is installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 # Load environment variables
 load_dotenv()
 
+# Output goes through this logger; a background listener thread does the
+# actual stdout writes so the trading loop doesn't block on them
+logger = logging.getLogger(__name__)
+_log_listener = None
+
+def start_log_listener() -> QueueListener:
+    """Route this module's log records through a queue drained by a background thread"""
+    global _log_listener
+    if _log_listener is None:
+        log_queue = queue.SimpleQueue()
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        _log_listener = QueueListener(log_queue, handler)
+        _log_listener.start()
+        atexit.register(_log_listener.stop)  # Flush whatever is still queued
+        logger.addHandler(QueueHandler(log_queue))
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return _log_listener
+
 # Constants
 USDC_CONTRACT = "0x3c499c542cEF5E3811e1192ce70d8cC03d5c3359"
 RPC_URL = "https://polygon-rpc.com"
+CLOB_HOST = "https://clob.polymarket.com"
+CLOB_HTTP_MAX_CONNECTIONS = 20
+CLOB_HTTP_TIMEOUT = 15.0
+BALANCE_CACHE_TTL = 60  # seconds a balance read stays fresh
+BALANCE_CACHE_PATH = os.path.expanduser("~/.polytrader/balance_cache.json")
+PRICE_CACHE_TTL = 25  # seconds a fetched token price stays fresh
+PRICE_CACHE_MAX_SIZE = 512
+PRICE_CACHE_PATH = os.path.expanduser("~/.polytrader/price_cache.json")
+MARKETS_FILE = "current_markets.json"
+HTTP_POOL_SIZE = 32  # pooled keep-alive connections for the async price APIs
+HTTP_KEEPALIVE_TIMEOUT = 60
+SCAN_WORKERS = min(32, 4 * (os.cpu_count() or 1))  # threads for blocking price sources
+MARKET_ANALYSIS_TIMEOUT = 12  # seconds allowed to price one market during a scan
+
+# Alternative price APIs, tried in order after the CLOB client
+PRICE_API_ENDPOINTS = [
+    "https://clob.polymarket.com/prices-history?market={token_id}&interval=1m&fidelity=1",
+    "https://gamma-api.polymarket.com/markets/{token_id}"
+]
 
 # Hybrid Trading Configuration
 INITIAL_BET_SIZE = 2.5
@@ -58,30 +126,83 @@ MIN_BET_SIZE = 1.0
 TRADING_INTERVAL = 90  # 1.5 minutes for maximum frequency
 MAX_DAILY_TRADES = 150
 MIN_EDGE_THRESHOLD = 0.07
+PREFILTER_PRICE_BAND = 0.03  # largest price move assumed between scans when pre-filtering
+PREFILTER_MAX_AGE = 300  # seconds a last-known price can be used to skip a market
 MAX_CLOUDFLARE_RETRIES = 10
+BROWSER_IDLE_TIMEOUT = 600  # seconds before an unused headless Chrome is shut down
+MAX_IDLE_DELAY = 900  # cap, in seconds, on the back-off between empty scans
+IDLE_STATE_PATH = os.path.expanduser("~/.polytrader/hybrid_idle.json")
+BET_SIZE_CACHE_RESET = 0.5  # clear memoized bet sizes after a 50% balance move
+
+# A validated tradable market, parsed once when the markets file is loaded
+MarketRow = namedtuple("MarketRow", "condition_id question question_lower volume yes_id no_id")
+
+def compile_keyword_pattern(keywords: List[str]) -> "re.Pattern":
+    """Compile keywords into one regex that finds every (overlapping) occurrence"""
+    return re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))")
+
+@lru_cache(maxsize=4096)
+def _bet_size_cached(edge_q: float, conf_q: float, sent_q: int, bal_q: float, succ_gt_fail: bool) -> float:
+    """Unclamped Kelly bet for quantized inputs (see calculate_dynamic_bet_size)"""
+    # Base Kelly Criterion
+    kelly_fraction = edge_q * conf_q * 0.3
+    
+    # Sentiment boost
+    sentiment_multiplier = 1.0 + (abs(sent_q) * 0.1)
+    
+    # Success rate adjustment
+    success_multiplier = 1.2 if succ_gt_fail else 0.8
+    
+    return bal_q * kelly_fraction * sentiment_multiplier * success_multiplier
 
 class HybridAutoTrader:
+    # Weighted sentiment keywords, compiled once so each question is scanned
+    # in one pass per bucket instead of one substring test per word
+    _STRONG_BULLISH = frozenset({"championship", "finals", "victory", "win", "succeed", "qualify", "advance"})
+    _BULLISH = frozenset({"likely", "expected", "probable", "increase", "rise", "achieve", "lead"})
+    _STRONG_BEARISH = frozenset({"fail", "lose", "reject", "crash", "eliminated", "defeat", "relegated"})
+    _BEARISH = frozenset({"unlikely", "decrease", "fall", "miss", "struggle", "behind"})
+    _strong_bullish_pattern = compile_keyword_pattern(sorted(_STRONG_BULLISH))
+    _bullish_pattern = compile_keyword_pattern(sorted(_BULLISH))
+    _strong_bearish_pattern = compile_keyword_pattern(sorted(_STRONG_BEARISH))
+    _bearish_pattern = compile_keyword_pattern(sorted(_BEARISH))
+
     def __init__(self):
+        start_log_listener()
         self.setup_wallet()
         self.setup_trading_clients()
+        self._balance_cache = None
+        self._balance_cache_ts = 0.0
+        self.load_cached_balance()
         self.starting_balance = self.get_usdc_balance()
         self.current_balance = self.starting_balance
         self.trades_today = 0
         self.successful_trades = 0
         self.failed_trades = 0
         self.current_bet_size = INITIAL_BET_SIZE
+        self._bet_cache_balance = self.current_balance
         self.last_trade_time = 0
         self.active_positions = {}
         self.cloudflare_failures = 0
         self.trading_methods = []
+        self._price_cache = {}  # token_id -> (time.time(), price)
+        self._price_cache_lock = threading.Lock()
+        self._price_cache_hits = 0
+        self._price_cache_misses = 0
+        self._markets_cache = (None, [])  # (markets file mtime, filtered markets)
+        self._loop = asyncio.new_event_loop()  # kept across scans so the aiohttp pool survives
+        self.http_session = None  # aiohttp session, created inside the event loop
+        self.executor = ThreadPoolExecutor(max_workers=SCAN_WORKERS, thread_name_prefix="price")  # reused across scans
+        self._idle_scans = self.load_idle_scans()  # consecutive scans with no opportunity
+        self.load_price_cache()
         
         # Initialize available trading methods
         self.initialize_trading_methods()
         
-        print(f"🤖 HYBRID AUTOMATED POLYMARKET TRADER INITIALIZED")
-        print(f"💰 Starting Balance: ${self.starting_balance:.2f} USDC")
-        print(f"🔧 Available Methods: {len(self.trading_methods)}")
-        print(f"⚡ Hyper-Aggressive Mode: {TRADING_INTERVAL}s intervals")
+        logger.info(f"🤖 HYBRID AUTOMATED POLYMARKET TRADER INITIALIZED")
+        logger.info(f"💰 Starting Balance: ${self.starting_balance:.2f} USDC")
+        logger.info(f"🔧 Available Methods: {len(self.trading_methods)}")
+        logger.info(f"⚡ Hyper-Aggressive Mode: {TRADING_INTERVAL}s intervals")
 
     def setup_wallet(self):
         """Setup wallet connection"""
@@ -101,11 +222,28 @@ class HybridAutoTrader:
         account = Account.from_key(private_key)
         self.wallet_address = account.address
         self.private_key = private_key
+        
+        # balanceOf calldata never changes for this wallet, so encode it once
+        self._balance_call = {"to": USDC_CONTRACT, "data": encode_balance_of(self.wallet_address)}
 
     def setup_trading_clients(self):
         """Setup multiple trading clients"""
         self.clob_client = None
-        self.browser_driver = None
+        self.clob_http = None  # HTTP/2 client shared by CLOB price and order calls
+        self._browser_driver = None  # headless Chrome, launched on first use
+        self._browser_last_used = 0.0
+        
+        # Pooled keep-alive session for the blocking price API fallback
+        self.http = requests.Session()
+        self.http.mount("https://", HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        ))
+        self.http.headers.update({
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+            "Accept-Encoding": "gzip"
+        })
         
         # Setup CLOB client if available
         if CLOB_AVAILABLE:
@@ -117,30 +255,41 @@ class HybridAutoTrader:
                 )
                 
                 self.clob_client = ClobClient(
-                    host="https://clob.polymarket.com",
+                    host=CLOB_HOST,
                     chain_id=POLYGON,
                     private_key=self.private_key,
                     creds=creds,
                     signature_type=2,
                     funder=self.wallet_address
                 )
-                print("✅ CLOB client initialized")
-            except Exception as e:
-                print(f"⚠️ CLOB client failed: {e}")
-        
-        # Setup browser automation if available
-        if SELENIUM_AVAILABLE:
-            try:
-                self.setup_browser_driver()
-                print("✅ Browser automation initialized")
+                logger.info("✅ CLOB client initialized")
+                self.setup_clob_http()
             except Exception as e:
-                print(f"⚠️ Browser automation failed: {e}")
+                logger.warning(f"⚠️ CLOB client failed: {e}")
 
-    def setup_browser_driver(self):
-        """Setup headless browser for web automation"""
-        if not SELENIUM_AVAILABLE:
-            return
+    def setup_clob_http(self):
+        """Give py-clob-client a pooled HTTP/2 client with a timeout, and share it with our CLOB price calls"""
+        if not CLOB_HTTP_PATCHABLE:
+            return  # Library layout changed; keep its default client
         
+        self.clob_http = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_connections=CLOB_HTTP_MAX_CONNECTIONS, max_keepalive_connections=CLOB_HTTP_MAX_CONNECTIONS),
+            timeout=CLOB_HTTP_TIMEOUT
+        )
+        clob_http_helpers._http_client.close()
+        clob_http_helpers._http_client = self.clob_http
+
+    @property
+    def browser_driver(self):
+        """Headless Chrome for web automation, launched the first time it is needed"""
+        if self._browser_driver is None and SELENIUM_AVAILABLE:
+            self._browser_driver = self.make_browser_driver()
+        self._browser_last_used = time.time()
+        return self._browser_driver
+
+    def make_browser_driver(self):
+        """Launch a headless browser for web automation, or return None if it fails"""
         try:
             chrome_options = Options()
             chrome_options.add_argument("--headless")
@@ -150,10 +299,24 @@ class HybridAutoTrader:
             chrome_options.add_argument("--window-size=1920,1080")
             chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
             
-            self.browser_driver = webdriver.Chrome(options=chrome_options)
+            driver = webdriver.Chrome(options=chrome_options)
+            logger.info("✅ Browser automation initialized")
+            return driver
+        except Exception as e:
+            logger.info(f"Browser setup failed: {e}")
+            return None
+
+    def close_browser_driver(self, idle_only: bool = False):
+        """Quit the browser, or with idle_only only if unused for BROWSER_IDLE_TIMEOUT"""
+        if self._browser_driver is None:
+            return
+        if idle_only and time.time() - self._browser_last_used < BROWSER_IDLE_TIMEOUT:
+            return
+        try:
+            self._browser_driver.quit()
         except Exception as e:
-            print(f"Browser setup failed: {e}")
-            self.browser_driver = None
+            logger.info(f"Browser shutdown failed: {e}")
+        self._browser_driver = None
 
     def initialize_trading_methods(self):
         """Initialize available trading methods in order of preference"""
@@ -162,66 +325,192 @@ class HybridAutoTrader:
         if self.clob_client:
             self.trading_methods.append("clob_api")
         
-        if self.browser_driver:
+        if SELENIUM_AVAILABLE:
             self.trading_methods.append("browser_automation")
         
         self.trading_methods.append("direct_contract")
         self.trading_methods.append("manual_fallback")
         
-        print(f"🔧 Trading methods: {', '.join(self.trading_methods)}")
-
-    def get_usdc_balance(self) -> float:
-        """Get current USDC balance"""
-        usdc_abi = [
-            {
-                "constant": True,
-                "inputs": [{"name": "account", "type": "address"}],
-                "name": "balanceOf",
-                "outputs": [{"name": "", "type": "uint256"}],
-                "payable": False,
-                "stateMutability": "view",
-                "type": "function"
-            }
-        ]
+        logger.info(f"🔧 Trading methods: {', '.join(self.trading_methods)}")
+
+    def load_cached_balance(self):
+        """Seed the balance cache from disk so a quick restart skips the RPC"""
+        try:
+            with open(BALANCE_CACHE_PATH, "rb") as f:
+                entry = json_loads(f.read())[self.wallet_address]
+            self._balance_cache = float(entry["balance"])
+            self._balance_cache_ts = float(entry["time"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    def save_cached_balance(self):
+        """Persist the latest balance reading for this wallet"""
+        try:
+            try:
+                with open(BALANCE_CACHE_PATH, "rb") as f:
+                    cache = json_loads(f.read())
+            except (OSError, ValueError):
+                cache = {}
+            cache[self.wallet_address] = {"balance": self._balance_cache, "time": self._balance_cache_ts}
+            os.makedirs(os.path.dirname(BALANCE_CACHE_PATH), exist_ok=True)
+            with open(BALANCE_CACHE_PATH, "w") as f:
+                json.dump(cache, f)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not cache balance: {e}")
+
+    def get_usdc_balance(self, force: bool = False) -> float:
+        """Get current USDC balance, reusing a reading younger than BALANCE_CACHE_TTL"""
+        now = time.time()
+        if not force and self._balance_cache is not None and now - self._balance_cache_ts < BALANCE_CACHE_TTL:
+            return self._balance_cache
         
-        usdc_contract = self.w3.eth.contract(address=USDC_CONTRACT, abi=usdc_abi)
-        balance = usdc_contract.functions.balanceOf(self.wallet_address).call()
-        return balance / 10**6
+        balance = int.from_bytes(self.w3.eth.call(self._balance_call), "big")
+        self._balance_cache = balance / 10**6
+        self._balance_cache_ts = now
+        self.save_cached_balance()
+        return self._balance_cache
 
-    def get_markets_with_fallback(self) -> List[Dict[str, Any]]:
-        """Get markets using multiple fallback methods"""
+    def get_markets_with_fallback(self) -> List[MarketRow]:
+        """Get markets using multiple fallback methods, re-reading the file only when it changes"""
         try:
             # Primary: Load from file
-            with open("current_markets.json", "r") as f:
-                markets = json.load(f)
+            mtime = os.stat(MARKETS_FILE).st_mtime
+            cached_mtime, filtered_markets = self._markets_cache
+            if mtime == cached_mtime:
+                logger.info(f"✅ Loaded {len(filtered_markets)} markets")
+                return filtered_markets
+            
+            with open(MARKETS_FILE, "rb") as f:
+                markets = json_loads(f.read())
             
             # Filter for profitable markets
             filtered_markets = []
             for market in markets[:40]:
-                if (market.get("active", False) and 
-                    float(market.get("volume", 0)) > 20000):
+                get = market.get
+                volume = float(get("volume", 0))
+                if get("active", False) and volume > 20000:
+                    condition_id = get("condition_id")
+                    question = get("question", "")
+                    if not condition_id or not question:
+                        continue
                     
-                    tokens_str = market.get("tokens", "[]")
+                    tokens_str = get("tokens", "[]")
                     try:
                         if isinstance(tokens_str, str):
-                            tokens = json.loads(tokens_str)
+                            tokens = json_loads(tokens_str)
                         else:
                             tokens = tokens_str
                     except:
                         continue
                     
                     if len(tokens) >= 2:
-                        market["tokens"] = tokens
-                        filtered_markets.append(market)
+                        filtered_markets.append(MarketRow(condition_id, question, question.lower(), volume, tokens[0], tokens[1]))
             
-            print(f"✅ Loaded {len(filtered_markets)} markets")
+            self._markets_cache = (mtime, filtered_markets)
+            logger.info(f"✅ Loaded {len(filtered_markets)} markets")
             return filtered_markets
             
         except Exception as e:
-            print(f"❌ Error loading markets: {e}")
+            logger.error(f"❌ Error loading markets: {e}")
             return []
 
+    def load_price_cache(self):
+        """Seed the price cache from disk, keeping only entries still within the TTL"""
+        try:
+            with open(PRICE_CACHE_PATH, "rb") as f:
+                entries = json_loads(f.read())
+            now = time.time()
+            for token_id, (ts, price) in entries.items():
+                if now - ts < PRICE_CACHE_TTL:
+                    self._price_cache[token_id] = (ts, price)
+        except (OSError, ValueError, TypeError, AttributeError):
+            pass
+
+    def save_price_cache(self):
+        """Write the price cache to disk so a restart skips the first scan's fetches"""
+        with self._price_cache_lock:
+            entries = dict(self._price_cache)
+        try:
+            os.makedirs(os.path.dirname(PRICE_CACHE_PATH), exist_ok=True)
+            with open(PRICE_CACHE_PATH, "w") as f:
+                json.dump(entries, f)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not cache prices: {e}")
+
+    def cached_price(self, token_id: str, now: float) -> Optional[float]:
+        """Return a cached price younger than PRICE_CACHE_TTL, counting the hit or miss"""
+        with self._price_cache_lock:
+            cached = self._price_cache.get(token_id)
+            if cached is not None and now - cached[0] < PRICE_CACHE_TTL:
+                self._price_cache_hits += 1
+                return cached[1]
+            self._price_cache_misses += 1
+        return None
+
     def get_price_multi_source(self, token_id: str) -> Optional[float]:
+        """Get price, serving repeat lookups from a short-lived cache"""
+        now = time.time()
+        price = self.cached_price(token_id, now)
+        if price is not None:
+            return price
+        
+        price = self.fetch_price_multi_source(token_id)
+        if price is not None:
+            self.cache_price(token_id, price, now)
+        return price
+
+    async def afetch_price_multi_source(self, token_id: str) -> Optional[float]:
+        """Async fetch_price_multi_source: blocking sources run in a thread, the HTTP APIs on aiohttp"""
+        loop = asyncio.get_running_loop()
+        for source in (self.get_price_clob, self.get_price_web_scraping):
+            try:
+                price = await loop.run_in_executor(self.executor, source, token_id)
+                if price and 0.01 <= price <= 0.99:
+                    return price
+            except Exception:
+                continue
+        
+        price = await self.aget_price_api_fallback(token_id)
+        if price and 0.01 <= price <= 0.99:
+            return price
+        return None
+
+    def cache_price(self, token_id: str, price: float, now: float):
+        """Store a fetched price, evicting the oldest entry when the cache is full"""
+        with self._price_cache_lock:
+            # Re-insert so the dict stays ordered oldest-first for eviction
+            self._price_cache.pop(token_id, None)
+            self._price_cache[token_id] = (now, price)
+            if len(self._price_cache) > PRICE_CACHE_MAX_SIZE:
+                del self._price_cache[next(iter(self._price_cache))]
+
+    def get_prices_clob_batch(self, token_ids: List[str]) -> Dict[str, float]:
+        """Price many tokens at once: cached prices plus one CLOB last-trades request for the rest"""
+        now = time.time()
+        prices = {}
+        missing = []
+        for token_id in token_ids:
+            price = self.cached_price(token_id, now)
+            if price is not None:
+                prices[token_id] = price
+            else:
+                missing.append(token_id)
+        
+        if not self.clob_client or not missing:
+            return prices
+        
+        try:
+            results = self.clob_client.get_last_trades_prices([BookParams(token_id=token_id) for token_id in missing])
+            for entry in results or []:
+                price = float(entry.get("price") or 0)
+                if 0.01 <= price <= 0.99:
+                    prices[entry["token_id"]] = price
+                    self.cache_price(entry["token_id"], price, now)
+        except Exception as e:
+            logger.warning(f"⚠️ Batched CLOB price request failed: {e}")
+        return prices
+
+    def fetch_price_multi_source(self, token_id: str) -> Optional[float]:
         """Get price using multiple sources"""
         sources = [
             self.get_price_clob,
@@ -254,8 +543,8 @@ class HybridAutoTrader:
 
     def get_price_web_scraping(self, token_id: str) -> Optional[float]:
         """Get price via web scraping"""
-        if not self.browser_driver:
-            return None
+        if self._browser_driver is None:
+            return None  # Not worth launching a browser just to price a token
         
         try:
             # This would involve navigating to Polymarket and scraping prices
@@ -269,86 +558,74 @@ class HybridAutoTrader:
         """Get price from alternative APIs"""
         try:
             # Try multiple API endpoints
-            endpoints = [
-                f"https://clob.polymarket.com/prices-history?market={token_id}&interval=1m&fidelity=1",
-                f"https://gamma-api.polymarket.com/markets/{token_id}"
-            ]
-            
-            for endpoint in endpoints:
+            for endpoint in PRICE_API_ENDPOINTS:
                 try:
-                    response = requests.get(endpoint, timeout=10)
+                    url = endpoint.format(token_id=token_id)
+                    # CLOB endpoints reuse the client's HTTP/2 connection
+                    if self.clob_http is not None and url.startswith(CLOB_HOST):
+                        response = self.clob_http.get(url, timeout=10)
+                    else:
+                        response = self.http.get(url, timeout=10)
                     if response.status_code == 200:
-                        data = response.json()
-                        if isinstance(data, list) and len(data) > 0:
-                            return float(data[-1].get("p", 0))
-                        elif isinstance(data, dict):
-                            return float(data.get("price", 0))
+                        price = self.parse_api_price(json_loads(response.content))
+                        if price is not None:
+                            return price
                 except:
                     continue
         except:
             pass
         return None
 
-    def analyze_market_hybrid(self, market: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Advanced market analysis for maximum profit"""
+    async def aget_price_api_fallback(self, token_id: str) -> Optional[float]:
+        """Async get_price_api_fallback over the pooled aiohttp session"""
+        for endpoint in PRICE_API_ENDPOINTS:
+            try:
+                async with self.http_session.get(endpoint.format(token_id=token_id)) as response:
+                    if response.status == 200:
+                        price = self.parse_api_price(json_loads(await response.read()))
+                        if price is not None:
+                            return price
+            except Exception:
+                continue
+        return None
+
+    @staticmethod
+    def parse_api_price(data: Any) -> Optional[float]:
+        """Price from a prices-history list or a gamma market document"""
+        if isinstance(data, list) and len(data) > 0:
+            return float(data[-1].get("p", 0))
+        elif isinstance(data, dict):
+            return float(data.get("price", 0))
+        return None
+
+    def analyze_market_hybrid(self, market: MarketRow, price: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Advanced market analysis for maximum profit, using price if it was already fetched"""
         try:
-            condition_id = market.get("condition_id")
-            question = market.get("question", "")
-            volume = float(market.get("volume", 0))
-            tokens = market.get("tokens", [])
-            
-            if not condition_id or not question or len(tokens) < 2:
-                return None
-            
-            yes_token_id = tokens[0]
+            question = market.question
+            volume = market.volume
             
-            # Get price using multiple sources
-            current_price = self.get_price_multi_source(yes_token_id)
+            # Get price using multiple sources unless the batch already priced it
+            current_price = price if price is not None else self.get_price_multi_source(market.yes_id)
             if current_price is None:
                 return None
             
             # Enhanced AI analysis
-            profit_signals = {
-                "strong_bullish": ["championship", "finals", "victory", "win", "succeed", "qualify", "advance"],
-                "bullish": ["likely", "expected", "probable", "increase", "rise", "achieve", "lead"],
-                "strong_bearish": ["fail", "lose", "reject", "crash", "eliminated", "defeat", "relegated"],
-                "bearish": ["unlikely", "decrease", "fall", "miss", "struggle", "behind"]
-            }
-            
-            question_lower = question.lower()
-            
-            # Calculate weighted sentiment
-            strong_bull = sum(4 if word in question_lower else 0 for word in profit_signals["strong_bullish"])
-            bull = sum(2 if word in question_lower else 0 for word in profit_signals["bullish"])
-            strong_bear = sum(4 if word in question_lower else 0 for word in profit_signals["strong_bearish"])
-            bear = sum(2 if word in question_lower else 0 for word in profit_signals["bearish"])
-            
+            strong_bull, bull, strong_bear, bear = self.keyword_weights(market.question_lower)
             sentiment_score = (strong_bull + bull) - (strong_bear + bear)
             
-            # Volume and liquidity factors
-            volume_factor = min(volume / 300000, 0.4)  # Up to 40% adjustment
-            liquidity_factor = 0.1 if volume > 100000 else 0.05
-            
-            # Calculate AI probability
-            base_probability = 0.5
-            sentiment_adjustment = sentiment_score * 0.03
-            
-            ai_probability = max(0.05, min(0.95, 
-                base_probability + sentiment_adjustment + volume_factor + liquidity_factor))
-            
-            # Calculate edge
-            if ai_probability > current_price:
-                edge = (ai_probability - current_price) / current_price
+            # AI probability from sentiment, volume and liquidity, and the edge
+            # against the current price, in one native kernel call
+            edge, is_yes, ai_probability = score_edge(strong_bull, bull, strong_bear, bear, current_price, volume)
+            if is_yes:
                 side = "YES"
-                token_id = yes_token_id
+                token_id = market.yes_id
             else:
-                edge = (current_price - ai_probability) / ai_probability
                 side = "NO"
-                token_id = tokens[1] if len(tokens) > 1 else yes_token_id
+                token_id = market.no_id
             
             if edge >= MIN_EDGE_THRESHOLD:
                 return {
-                    "condition_id": condition_id,
+                    "condition_id": market.condition_id,
                     "token_id": token_id,
                     "side": side,
                     "edge": edge,
@@ -365,21 +642,81 @@ class HybridAutoTrader:
         except Exception as e:
             return None
 
-    def calculate_dynamic_bet_size(self, edge: float, confidence: float, sentiment: float) -> float:
-        """Calculate dynamic bet size based on multiple factors"""
-        # Base Kelly Criterion
-        kelly_fraction = edge * confidence * 0.3
+    def keyword_weights(self, question_lower: str) -> Tuple[int, int, int, int]:
+        """Weighted (strong_bull, bull, strong_bear, bear) sentiment; each keyword counts once however often it appears"""
+        return (
+            4 * len(set(self._strong_bullish_pattern.findall(question_lower))),
+            2 * len(set(self._bullish_pattern.findall(question_lower))),
+            4 * len(set(self._strong_bearish_pattern.findall(question_lower))),
+            2 * len(set(self._bearish_pattern.findall(question_lower)))
+        )
+
+    def could_reach_edge(self, market: MarketRow) -> bool:
+        """Cheap go/no-go before pricing: can the market reach MIN_EDGE_THRESHOLD near its last known price?"""
+        with self._price_cache_lock:
+            cached = self._price_cache.get(market.yes_id)
+        if cached is None or time.time() - cached[0] > PREFILTER_MAX_AGE:
+            return True  # No recent price, so no bound - fetch it
+        
+        # Edge only grows moving away from the AI probability, so the best
+        # case within the band is at one of its ends
+        weights = self.keyword_weights(market.question_lower)
+        low = max(0.01, cached[1] - PREFILTER_PRICE_BAND)
+        high = min(0.99, cached[1] + PREFILTER_PRICE_BAND)
+        return max(score_edge(*weights, low, market.volume)[0],
+                   score_edge(*weights, high, market.volume)[0]) >= MIN_EDGE_THRESHOLD
+
+    def analyze_markets_batch(self, markets: List[MarketRow], prices: List[Optional[float]]) -> List[Dict[str, Any]]:
+        """Score many markets at once with vectorized NumPy math, best first"""
+        rows = [(market, price) for market, price in zip(markets, prices) if price is not None]
+        
+        if not rows:
+            return []
+        
+        # Structure-of-arrays view of the priced markets
+        count = len(rows)
+        price_arr = np.fromiter((price for _, price in rows), dtype=np.float64, count=count)
+        volumes = np.fromiter((market.volume for market, _ in rows), dtype=np.float64, count=count)
         
-        # Sentiment boost
-        sentiment_multiplier = 1.0 + (abs(sentiment) * 0.1)
+        # Net sentiment: bullish minus bearish keyword weights
+        weights = [self.keyword_weights(market.question_lower) for market, _ in rows]
+        sentiment = np.fromiter((sb + b - sbe - be for sb, b, sbe, be in weights), dtype=np.int64, count=count)
         
-        # Success rate adjustment
-        if self.successful_trades > self.failed_trades:
-            success_multiplier = 1.2
-        else:
-            success_multiplier = 0.8
+        edge, is_yes, ai_probability, confidence = score_edge_batch(price_arr, volumes, sentiment)
         
-        bet_size = self.current_balance * kelly_fraction * sentiment_multiplier * success_multiplier
+        # Apply edge threshold, then rank by profit potential
+        scores = edge * confidence * (1 + np.abs(sentiment) * 0.1)
+        candidates = np.flatnonzero(edge >= MIN_EDGE_THRESHOLD)
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+        
+        opportunities = []
+        for i in candidates:
+            market, current_price = rows[i]
+            opportunities.append({
+                "condition_id": market.condition_id,
+                "token_id": market.yes_id if is_yes[i] else market.no_id,
+                "side": "YES" if is_yes[i] else "NO",
+                "edge": float(edge[i]),
+                "current_price": current_price,
+                "ai_probability": float(ai_probability[i]),
+                "question": market.question,
+                "volume": market.volume,
+                "confidence": float(confidence[i]),
+                "sentiment_score": int(sentiment[i])
+            })
+        
+        return opportunities
+
+    def calculate_dynamic_bet_size(self, edge: float, confidence: float, sentiment: float) -> float:
+        """Calculate dynamic bet size based on multiple factors"""
+        # Entries keyed on a far-off balance will never be hit again
+        if abs(self.current_balance - self._bet_cache_balance) > self._bet_cache_balance * BET_SIZE_CACHE_RESET:
+            _bet_size_cached.cache_clear()
+            self._bet_cache_balance = self.current_balance
+        
+        bet_size = _bet_size_cached(round(edge, 2), round(confidence, 2), round(sentiment),
+                                    round(self.current_balance, 0),
+                                    self.successful_trades > self.failed_trades)
         
         # Apply limits
         bet_size = max(MIN_BET_SIZE, min(MAX_BET_SIZE, bet_size))
@@ -399,21 +736,21 @@ class HybridAutoTrader:
         bet_size = self.calculate_dynamic_bet_size(edge, confidence, sentiment)
         
         if bet_size < MIN_BET_SIZE:
-            print(f"❌ Bet size too small: ${bet_size:.2f}")
+            logger.error(f"❌ Bet size too small: ${bet_size:.2f}")
             return False
         
-        print(f"\n🚀 EXECUTING HYBRID TRADE")
-        print(f"Market: {question[:50]}...")
-        print(f"Side: {side}")
-        print(f"Amount: ${bet_size:.2f}")
-        print(f"Edge: {edge:.1%}")
-        print(f"Confidence: {confidence:.1%}")
-        print(f"Sentiment: {sentiment}")
+        logger.info(f"\n🚀 EXECUTING HYBRID TRADE")
+        logger.info(f"Market: {question[:50]}...")
+        logger.info(f"Side: {side}")
+        logger.info(f"Amount: ${bet_size:.2f}")
+        logger.info(f"Edge: {edge:.1%}")
+        logger.info(f"Confidence: {confidence:.1%}")
+        logger.info(f"Sentiment: {sentiment}")
         
         # Try each trading method until one succeeds
         for method in self.trading_methods:
             try:
-                print(f"🔄 Trying method: {method}")
+                logger.info(f"🔄 Trying method: {method}")
                 
                 if method == "clob_api":
                     success = self.execute_clob_trade(opportunity, bet_size)
@@ -427,7 +764,7 @@ class HybridAutoTrader:
                     continue
                 
                 if success:
-                    print(f"✅ TRADE EXECUTED via {method}!")
+                    logger.info(f"✅ TRADE EXECUTED via {method}!")
                     
                     # Update tracking
                     self.trades_today += 1
@@ -452,13 +789,13 @@ class HybridAutoTrader:
                     
                     return True
                 else:
-                    print(f"❌ {method} failed, trying next method...")
+                    logger.error(f"❌ {method} failed, trying next method...")
                     
             except Exception as e:
-                print(f"❌ Error with {method}: {e}")
+                logger.error(f"❌ Error with {method}: {e}")
                 continue
         
-        print(f"❌ All trading methods failed")
+        logger.error(f"❌ All trading methods failed")
         self.failed_trades += 1
         self.cloudflare_failures += 1
         self.current_bet_size = max(self.current_bet_size * 0.9, MIN_BET_SIZE)
@@ -497,7 +834,8 @@ class HybridAutoTrader:
 
     def execute_browser_trade(self, opportunity: Dict[str, Any], bet_size: float) -> bool:
         """Execute trade via browser automation"""
-        if not self.browser_driver:
+        driver = self.browser_driver
+        if not driver:
             return False
         
         try:
@@ -505,7 +843,7 @@ class HybridAutoTrader:
             condition_id = opportunity["condition_id"]
             market_url = f"https://polymarket.com/event/{condition_id}"
             
-            self.browser_driver.get(market_url)
+            driver.get(market_url)
             time.sleep(5)
             
             # This would involve:
@@ -519,7 +857,7 @@ class HybridAutoTrader:
             return False
             
         except Exception as e:
-            print(f"Browser automation error: {e}")
+            logger.info(f"Browser automation error: {e}")
             return False
 
     def execute_contract_trade(self, opportunity: Dict[str, Any], bet_size: float) -> bool:
@@ -533,15 +871,15 @@ class HybridAutoTrader:
             return False
             
         except Exception as e:
-            print(f"Contract trade error: {e}")
+            logger.info(f"Contract trade error: {e}")
             return False
 
     def execute_manual_fallback(self, opportunity: Dict[str, Any], bet_size: float) -> bool:
         """Fallback to manual execution guidance"""
-        print(f"\n🔧 MANUAL FALLBACK ACTIVATED")
-        print(f"🌐 Open: https://polymarket.com/event/{opportunity['condition_id']}")
-        print(f"💰 Bet ${bet_size:.2f} on {opportunity['side']}")
-        print(f"📈 Expected Edge: {opportunity['edge']:.1%}")
+        logger.info(f"\n🔧 MANUAL FALLBACK ACTIVATED")
+        logger.info(f"🌐 Open: https://polymarket.com/event/{opportunity['condition_id']}")
+        logger.info(f"💰 Bet ${bet_size:.2f} on {opportunity['side']}")
+        logger.info(f"📈 Expected Edge: {opportunity['edge']:.1%}")
         
         # Auto-open browser if possible
         try:
@@ -557,49 +895,75 @@ class HybridAutoTrader:
 
     def find_hybrid_opportunities(self) -> List[Dict[str, Any]]:
         """Find opportunities using hybrid analysis"""
-        print("🔍 Hybrid opportunity scanning...")
+        logger.info("🔍 Hybrid opportunity scanning...")
         
-        markets = self.get_markets_with_fallback()
-        opportunities = []
+        markets = self.get_markets_with_fallback()[:20]
         
-        # Parallel analysis for speed
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            futures = [executor.submit(self.analyze_market_hybrid, market) 
-                      for market in markets[:20]]
-            
-            for future in futures:
-                try:
-                    result = future.result(timeout=12)
-                    if result:
-                        opportunities.append(result)
-                except:
-                    continue
+        # Don't pay for prices on markets that can't cross the edge threshold
+        candidates = [market for market in markets if self.could_reach_edge(market)]
+        if len(candidates) < len(markets):
+            logger.info(f"⏭️ Skipped {len(markets) - len(candidates)} markets below the edge threshold")
+        markets = candidates
         
-        # Sort by profit potential
-        opportunities.sort(
-            key=lambda x: x["edge"] * x["confidence"] * (1 + abs(x["sentiment_score"]) * 0.1), 
-            reverse=True
-        )
+        # One batched CLOB request prices every market; only the tokens it
+        # misses go through the per-token sources, concurrently
+        price_map = self.get_prices_clob_batch([market.yes_id for market in markets])
+        prices = self._loop.run_until_complete(self.scan_markets_async(markets, price_map))
+        
+        # Score every priced market in one vectorized pass, best first
+        opportunities = self.analyze_markets_batch(markets, prices)
         
-        print(f"✅ Found {len(opportunities)} hybrid opportunities")
+        self.save_price_cache()
+        logger.info(f"💾 Price cache: {self._price_cache_hits} hits, {self._price_cache_misses} misses")
+        logger.info(f"✅ Found {len(opportunities)} hybrid opportunities")
         return opportunities
 
+    async def scan_markets_async(self, markets: List[MarketRow], price_map: Dict[str, float]) -> List[Optional[float]]:
+        """Price all markets concurrently on one pooled aiohttp session; None where no price was found"""
+        if self.http_session is None:
+            self.http_session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=10),
+                connector=aiohttp.TCPConnector(limit=HTTP_POOL_SIZE, keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT)
+            )
+        
+        tasks = [
+            asyncio.wait_for(self.price_market_async(market, price_map.get(market.yes_id)), MARKET_ANALYSIS_TIMEOUT)
+            for market in markets
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return [None if isinstance(result, BaseException) else result for result in results]
+
+    async def price_market_async(self, market: MarketRow, price: Optional[float]) -> Optional[float]:
+        """Return the batch price, or fetch one from the per-token sources if the batch missed it"""
+        if price is None:
+            price = await self.afetch_price_multi_source(market.yes_id)
+            if price is not None:
+                self.cache_price(market.yes_id, price, time.time())
+        return price
+
+    def close_http_session(self):
+        """Close the aiohttp session and the event loop that owns it"""
+        if self.http_session is not None:
+            self._loop.run_until_complete(self.http_session.close())
+            self.http_session = None
+        self._loop.close()
+
     def should_continue_hybrid_trading(self) -> bool:
         """Check if we should continue trading"""
         if self.trades_today >= MAX_DAILY_TRADES:
-            print("🛑 Daily trade limit reached")
+            logger.info("🛑 Daily trade limit reached")
             return False
         
         if self.current_balance < MIN_BET_SIZE * 2:
-            print("🛑 Balance too low")
+            logger.info("🛑 Balance too low")
             return False
         
         if self.current_balance < self.starting_balance * 0.15:
-            print("🛑 Stop loss triggered (85% drawdown)")
+            logger.info("🛑 Stop loss triggered (85% drawdown)")
             return False
         
         if self.cloudflare_failures > MAX_CLOUDFLARE_RETRIES:
-            print("🛑 Too many Cloudflare failures")
+            logger.info("🛑 Too many Cloudflare failures")
             return False
         
         return True
@@ -610,52 +974,79 @@ class HybridAutoTrader:
         profit_pct = (profit / self.starting_balance) * 100
         win_rate = (self.successful_trades / max(1, self.successful_trades + self.failed_trades)) * 100
         
-        print(f"\n🤖 HYBRID TRADING STATUS")
-        print(f"💰 Balance: ${self.current_balance:.2f} (${profit:+.2f})")
-        print(f"📈 Return: {profit_pct:+.1f}%")
-        print(f"🎯 Trades: {self.trades_today}/{MAX_DAILY_TRADES}")
-        print(f"✅ Win Rate: {win_rate:.1f}%")
-        print(f"🔄 Active Positions: {len(self.active_positions)}")
-        print(f"💵 Next Bet: ${self.current_bet_size:.2f}")
-        print(f"🚫 Cloudflare Failures: {self.cloudflare_failures}")
-        print(f"🔧 Available Methods: {len(self.trading_methods)}")
+        logger.info(f"\n🤖 HYBRID TRADING STATUS")
+        logger.info(f"💰 Balance: ${self.current_balance:.2f} (${profit:+.2f})")
+        logger.info(f"📈 Return: {profit_pct:+.1f}%")
+        logger.info(f"🎯 Trades: {self.trades_today}/{MAX_DAILY_TRADES}")
+        logger.info(f"✅ Win Rate: {win_rate:.1f}%")
+        logger.info(f"🔄 Active Positions: {len(self.active_positions)}")
+        logger.info(f"💵 Next Bet: ${self.current_bet_size:.2f}")
+        logger.info(f"🚫 Cloudflare Failures: {self.cloudflare_failures}")
+        logger.info(f"🔧 Available Methods: {len(self.trading_methods)}")
+
+    def load_idle_scans(self) -> int:
+        """Restore the empty-scan count if the last run stopped within MAX_IDLE_DELAY"""
+        try:
+            with open(IDLE_STATE_PATH, "rb") as f:
+                state = json_loads(f.read())
+            if time.time() - state["time"] < MAX_IDLE_DELAY:
+                return int(state["idle_scans"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return 0
+
+    def save_idle_scans(self):
+        """Persist the empty-scan count so a restart keeps backing off"""
+        try:
+            os.makedirs(os.path.dirname(IDLE_STATE_PATH), exist_ok=True)
+            with open(IDLE_STATE_PATH, "w") as f:
+                json.dump({"idle_scans": self._idle_scans, "time": time.time()}, f)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not save idle state: {e}")
 
     def run_hybrid_trading(self):
         """Main hybrid trading loop"""
-        print(f"\n🚀 STARTING HYBRID AUTOMATED TRADING")
-        print(f"⚡ Hyper-Aggressive Mode: Every {TRADING_INTERVAL} seconds")
-        print(f"💰 Starting Balance: ${self.starting_balance:.2f} USDC")
-        print(f"🎯 Target: {MAX_DAILY_TRADES} trades/day with multiple methods")
+        logger.info(f"\n🚀 STARTING HYBRID AUTOMATED TRADING")
+        logger.info(f"⚡ Hyper-Aggressive Mode: Every {TRADING_INTERVAL} seconds")
+        logger.info(f"💰 Starting Balance: ${self.starting_balance:.2f} USDC")
+        logger.info(f"🎯 Target: {MAX_DAILY_TRADES} trades/day with multiple methods")
         
         while self.should_continue_hybrid_trading():
             try:
                 current_time = time.time()
+                self.close_browser_driver(idle_only=True)
                 
-                # Check trading interval
-                if current_time - self.last_trade_time < TRADING_INTERVAL:
-                    time.sleep(10)
+                # Sleep straight through to the next trading slot
+                wait = self.last_trade_time + TRADING_INTERVAL - current_time
+                if wait > 0:
+                    time.sleep(wait)
                     continue
                 
                 # Find best opportunities
                 opportunities = self.find_hybrid_opportunities()
                 
                 if opportunities:
+                    self._idle_scans = 0
+                    
                     # Execute the best opportunity
                     best_opportunity = opportunities[0]
                     
-                    print(f"\n🎯 BEST HYBRID OPPORTUNITY:")
-                    print(f"   Edge: {best_opportunity['edge']:.1%}")
-                    print(f"   Confidence: {best_opportunity['confidence']:.1%}")
-                    print(f"   Sentiment: {best_opportunity['sentiment_score']}")
-                    print(f"   Volume: ${best_opportunity['volume']:,.0f}")
+                    logger.info(f"\n🎯 BEST HYBRID OPPORTUNITY:")
+                    logger.info(f"   Edge: {best_opportunity['edge']:.1%}")
+                    logger.info(f"   Confidence: {best_opportunity['confidence']:.1%}")
+                    logger.info(f"   Sentiment: {best_opportunity['sentiment_score']}")
+                    logger.info(f"   Volume: ${best_opportunity['volume']:,.0f}")
                     
                     if self.execute_trade_hybrid(best_opportunity):
                         self.last_trade_time = current_time
-                        print(f"🎉 Hybrid trade #{self.trades_today} completed!")
+                        self.get_usdc_balance(force=True)  # Refresh the cached reading after settlement
+                        logger.info(f"🎉 Hybrid trade #{self.trades_today} completed!")
                     
                     self.print_hybrid_status()
                 else:
-                    print("🔍 No profitable opportunities found...")
+                    logger.info("🔍 No profitable opportunities found...")
+                    self._idle_scans += 1
+                self.save_idle_scans()
                 
                 # Adaptive delay based on success rate
                 if self.cloudflare_failures > 3:
@@ -663,37 +1054,48 @@ class HybridAutoTrader:
                 else:
                     delay = random.uniform(20, 60)
                 
+                # Quiet markets: back off exponentially until a scan finds an edge
+                if self._idle_scans:
+                    delay = min(TRADING_INTERVAL * 2 ** self._idle_scans, MAX_IDLE_DELAY) + random.uniform(0, 10)
+                    logger.info(f"😴 {self._idle_scans} empty scans, next scan in {delay:.0f}s")
+                
                 time.sleep(delay)
                 
             except KeyboardInterrupt:
-                print("\n🛑 Hybrid trading stopped by user")
+                logger.info("\n🛑 Hybrid trading stopped by user")
+                self.executor.shutdown(wait=False)
                 break
             except Exception as e:
-                print(f"❌ Error in hybrid trading loop: {e}")
+                logger.error(f"❌ Error in hybrid trading loop: {e}")
                 time.sleep(45)
         
-        print(f"\n🏁 HYBRID TRADING SESSION COMPLETE")
+        logger.info(f"\n🏁 HYBRID TRADING SESSION COMPLETE")
         self.print_hybrid_status()
         
         # Cleanup
-        if self.browser_driver:
-            self.browser_driver.quit()
+        self.executor.shutdown(wait=False)
+        self.close_http_session()
+        self.http.close()
+        if self.clob_http is not None:
+            self.clob_http.close()
+        self.close_browser_driver()
 
 def main():
     """Main function for hybrid automated trading"""
-    print("🤖 HYBRID AUTOMATED POLYMARKET TRADER")
-    print("=" * 60)
-    print("🔧 Uses multiple methods to bypass Cloudflare")
-    print("💰 Executes real trades automatically for maximum profit")
-    print("⚡ Hyper-aggressive trading with fallback strategies")
-    print("=" * 60)
+    start_log_listener()
+    logger.info("🤖 HYBRID AUTOMATED POLYMARKET TRADER")
+    logger.info("=" * 60)
+    logger.info("🔧 Uses multiple methods to bypass Cloudflare")
+    logger.info("💰 Executes real trades automatically for maximum profit")
+    logger.info("⚡ Hyper-aggressive trading with fallback strategies")
+    logger.info("=" * 60)
     
     try:
         trader = HybridAutoTrader()
         trader.run_hybrid_trading()
         
     except Exception as e:
-        print(f"❌ Fatal error: {e}")
+        logger.error(f"❌ Fatal error: {e}")
         import traceback
         traceback.print_exc()
         sys.exit(1)
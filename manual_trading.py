@@ -8,7 +8,181 @@ and guides you to place trades manually on the Polymarket website.
 
 import time
 import json
-from place_real_trades import RealPolymarketTrader
+import random
+import asyncio
+import hashlib
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+from place_real_trades import RealPolymarketTrader, MIN_EDGE_THRESHOLD
+
+# Try to import websockets for streaming order books
+try:
+    import websockets
+    WEBSOCKETS_AVAILABLE = True
+except ImportError:
+    WEBSOCKETS_AVAILABLE = False
+
+CLOB_WS_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
+WS_PING_INTERVAL = 10  # the market channel drops connections that stay silent
+WS_RECONNECT_DELAY = 5
+
+# Polling monitor (no websockets): rescan interval bounds in seconds
+MONITOR_MIN_INTERVAL = 30
+MONITOR_MAX_INTERVAL = 600
+
+GUIDE_PATH = "trading_guide.md"
+GUIDE_CONTENT = """
+# 🎯 Polymarket Manual Trading Guide
+
+## 🚀 Quick Start
+1. Open https://polymarket.com
+2. Connect your wallet (the one with USDC)
+3. Use the opportunities found by this script
+4. Place trades manually for each opportunity
+
+## 💰 Wallet Setup
+- Ensure you have USDC on Polygon network
+- Your current balance: Check with the script
+- Approve USDC for trading if needed
+
+## 📊 How to Read Opportunities
+- **Market**: The prediction market question
+- **Side**: YES or NO (which side to bet on)
+- **Edge**: Expected profit percentage
+- **Bet Size**: Recommended amount to wager
+- **Current Price**: Current market price
+
+## 🎯 Trading Strategy
+1. **High Edge First**: Start with highest edge opportunities
+2. **Diversify**: Don't put all money in one market
+3. **Monitor**: Check positions regularly
+4. **Exit Strategy**: Consider taking profits early
+
+## ⚠️ Risk Management
+- Never bet more than you can afford to lose
+- Start with small amounts to test the system
+- Monitor market news that could affect outcomes
+- Set stop-losses if positions move against you
+
+## 🔗 Useful Links
+- Polymarket: https://polymarket.com
+- Your Portfolio: https://polymarket.com/portfolio
+- Market Analytics: https://polymarket.com/leaderboard
+
+## 📞 Support
+- Polymarket Discord: https://discord.gg/polymarket
+- Documentation: https://docs.polymarket.com
+"""
+GUIDE_BYTES = GUIDE_CONTENT.encode()
+GUIDE_SHA = hashlib.sha256(GUIDE_BYTES).digest()
+
+def apply_book_event(levels: Dict[str, Tuple[Dict[float, float], Dict[float, float]]], event: Dict[str, Any]) -> List[str]:
+    """Fold one market-channel event into the per-token (bids, asks) levels; return the token IDs it touched"""
+    event_type = event.get("event_type")
+    
+    if event_type == "book":
+        # Full snapshot replaces whatever we had
+        token_id = event.get("asset_id")
+        levels[token_id] = (
+            {float(level["price"]): float(level["size"]) for level in event.get("bids", event.get("buys", []))},
+            {float(level["price"]): float(level["size"]) for level in event.get("asks", event.get("sells", []))}
+        )
+        return [token_id]
+    
+    if event_type == "price_change":
+        # Newer payloads carry one asset_id per change, older ones one per event
+        changes = event.get("price_changes") or [
+            dict(change, asset_id=event.get("asset_id")) for change in event.get("changes", [])
+        ]
+        touched = []
+        for change in changes:
+            book = levels.get(change.get("asset_id"))
+            if book is None:
+                continue  # Wait for the snapshot
+            side = book[0] if change.get("side") == "BUY" else book[1]
+            price, size = float(change["price"]), float(change["size"])
+            if size:
+                side[price] = size
+            else:
+                side.pop(price, None)
+            touched.append(change["asset_id"])
+        return touched
+    
+    return []
+
+def top_of_book(book: Tuple[Dict[float, float], Dict[float, float]]) -> Tuple[Optional[float], Optional[float]]:
+    """Best (bid, ask) of a token's levels"""
+    bids, asks = book
+    return (max(bids) if bids else None, min(asks) if asks else None)
+
+def recompute_edge(trader: RealPolymarketTrader, opp: Dict[str, Any], best_bid: Optional[float], best_ask: Optional[float]):
+    """Re-score one opportunity from its live YES book, reporting when it opens, closes or flips side"""
+    if best_bid is None and best_ask is None:
+        return
+    if best_bid is None or best_ask is None:
+        price = best_bid if best_ask is None else best_ask
+    else:
+        price = (best_bid + best_ask) / 2
+    
+    ai_probability = opp["ai_probability"]
+    if ai_probability > price:
+        edge = (ai_probability - price) / price
+        side = "YES"
+    else:
+        edge = (price - ai_probability) / ai_probability
+        side = "NO"
+    
+    state = (side, edge >= MIN_EDGE_THRESHOLD)
+    changed = state != opp.get("_live_state", (opp["side"], True))
+    tokens = opp["market"]["tokens"]
+    opp.update(current_price=price, edge=edge, side=side, token_id=tokens[0] if side == "YES" else tokens[1], _live_state=state)
+    
+    if not changed:
+        return
+    if state[1]:
+        print(f"\n🆕 LIVE OPPORTUNITY:")
+        print(f"📊 Market: {opp['question'][:60]}...")
+        print(f"💰 Price: ${price:.3f}")
+        print(f"🎲 Side: {side}")
+        print(f"📈 Edge: {edge:.1%}")
+        print(f"💵 Suggested Bet Size: ${trader.calculate_bet_size(edge):.2f}")
+        print(f"🌐 Link: https://polymarket.com/event/{opp['condition_id']}")
+    else:
+        print(f"\n📉 Edge gone ({edge:.1%}): {opp['question'][:60]}...")
+
+async def send_pings(ws):
+    """Keep the market channel open with its text heartbeat"""
+    while True:
+        await asyncio.sleep(WS_PING_INTERVAL)
+        await ws.send("PING")
+
+async def monitor_loop(trader: RealPolymarketTrader, opportunities: List[Dict[str, Any]]):
+    """Stream order book updates for the opportunities' markets, re-scoring a market only when its book moves"""
+    tracked = {opp["market"]["tokens"][0]: opp for opp in opportunities}
+    levels = {}
+    book_cache = {}  # token_id -> (best_bid, best_ask)
+    
+    while True:
+        try:
+            async with websockets.connect(CLOB_WS_URL) as ws:
+                await ws.send(json.dumps({"assets_ids": list(tracked), "type": "market"}))
+                heartbeat = asyncio.create_task(send_pings(ws))
+                try:
+                    async for message in ws:
+                        if message == "PONG":
+                            continue
+                        payload = json.loads(message)
+                        for event in payload if isinstance(payload, list) else [payload]:
+                            for token_id in apply_book_event(levels, event):
+                                top = top_of_book(levels[token_id])
+                                if token_id in tracked and top != book_cache.get(token_id):
+                                    book_cache[token_id] = top
+                                    recompute_edge(trader, tracked[token_id], *top)
+                finally:
+                    heartbeat.cancel()
+        except (OSError, ValueError, websockets.WebSocketException) as e:
+            print(f"⚠️ Market stream dropped ({e}), reconnecting in {WS_RECONNECT_DELAY}s...")
+            await asyncio.sleep(WS_RECONNECT_DELAY)
 
 def display_trading_opportunities():
     """Find and display trading opportunities for manual execution"""
@@ -34,13 +208,16 @@ def display_trading_opportunities():
         print("\n" + "=" * 80)
         
         for i, opp in enumerate(opportunities, 1):
+            # Size each bet once; the instructions and summary reuse it
+            opp['_bet'] = trader.calculate_bet_size(opp['edge'])
+            
             print(f"\n🎯 OPPORTUNITY #{i}")
             print("-" * 50)
             print(f"📊 Market: {opp['question']}")
             print(f"💰 Current Price: ${opp['current_price']:.3f}")
             print(f"🎲 Recommended Side: {opp['side']}")
             print(f"📈 Calculated Edge: {opp['edge']:.1%}")
-            print(f"💵 Suggested Bet Size: ${trader.calculate_bet_size(opp['edge']):.2f}")
+            print(f"💵 Suggested Bet Size: ${opp['_bet']:.2f}")
             print(f"🔗 Token ID: {opp['token_id']}")
             
             # Generate direct link to market
@@ -51,7 +228,7 @@ def display_trading_opportunities():
             print(f"\n📋 MANUAL TRADING INSTRUCTIONS:")
             print(f"   1. Open: {market_url}")
             print(f"   2. Click '{opp['side']}' button")
-            print(f"   3. Enter amount: ${trader.calculate_bet_size(opp['edge']):.2f}")
+            print(f"   3. Enter amount: ${opp['_bet']:.2f}")
             print(f"   4. Review and confirm trade")
             print(f"   5. Expected profit if correct: ~{opp['edge']:.1%}")
             
@@ -61,10 +238,10 @@ def display_trading_opportunities():
         print(f"\n📊 TRADING SUMMARY")
         print(f"💰 Your Balance: ${trader.current_balance:.2f} USDC")
         print(f"🎯 Total Opportunities: {len(opportunities)}")
-        print(f"💵 Total Suggested Investment: ${sum(trader.calculate_bet_size(opp['edge']) for opp in opportunities):.2f}")
+        print(f"💵 Total Suggested Investment: ${sum(opp['_bet'] for opp in opportunities):.2f}")
         
         # Calculate potential profit
-        potential_profit = sum(trader.calculate_bet_size(opp['edge']) * opp['edge'] for opp in opportunities)
+        potential_profit = sum(opp['_bet'] * opp['edge'] for opp in opportunities)
         print(f"📈 Potential Profit (if all correct): ${potential_profit:.2f}")
         
         print(f"\n🎯 NEXT STEPS:")
@@ -80,27 +257,42 @@ def display_trading_opportunities():
         
         if monitor.lower() == 'y':
             print(f"\n🔄 Monitoring mode activated...")
-            print(f"💡 Will check for new opportunities every 10 minutes")
             print(f"⏹️  Press Ctrl+C to stop")
             
             try:
-                while True:
-                    time.sleep(600)  # Wait 10 minutes
-                    print(f"\n🔍 Checking for new opportunities...")
-                    new_opportunities = trader.find_real_opportunities()
-                    
-                    if len(new_opportunities) > len(opportunities):
-                        print(f"🆕 Found {len(new_opportunities) - len(opportunities)} new opportunities!")
-                        # Show only new ones
-                        for opp in new_opportunities[len(opportunities):]:
-                            print(f"\n🆕 NEW OPPORTUNITY:")
-                            print(f"📊 Market: {opp['question'][:60]}...")
-                            print(f"🎲 Side: {opp['side']}")
-                            print(f"📈 Edge: {opp['edge']:.1%}")
-                            print(f"🌐 Link: https://polymarket.com/event/{opp['condition_id']}")
-                        opportunities = new_opportunities
-                    else:
-                        print(f"📊 No new opportunities (still {len(opportunities)} available)")
+                if WEBSOCKETS_AVAILABLE:
+                    print(f"💡 Streaming live order books for these {len(opportunities)} markets")
+                    asyncio.run(monitor_loop(trader, opportunities))
+                else:
+                    print(f"💡 Will check every {MONITOR_MIN_INTERVAL}s, backing off to {MONITOR_MAX_INTERVAL // 60} minutes while nothing changes")
+                    seen = {opp['token_id'] for opp in opportunities}
+                    current = {(opp['token_id'], opp['side']) for opp in opportunities}
+                    interval = MONITOR_MIN_INTERVAL
+                    while True:
+                        # Jitter so several copies don't scan in lockstep
+                        time.sleep(interval * random.uniform(0.8, 1.2))
+                        print(f"\n🔍 Checking for new opportunities...")
+                        new_opportunities = trader.find_real_opportunities()
+                        
+                        # Back off while the opportunity set is stable, tighten when it moves
+                        latest = {(opp['token_id'], opp['side']) for opp in new_opportunities}
+                        interval = min(interval * 2, MONITOR_MAX_INTERVAL) if latest == current else MONITOR_MIN_INTERVAL
+                        current = latest
+                        
+                        # Only tokens we haven't shown before, however the list reordered
+                        fresh = [opp for opp in new_opportunities if opp['token_id'] not in seen]
+                        seen.update(opp['token_id'] for opp in fresh)
+                        
+                        if fresh:
+                            print(f"🆕 Found {len(fresh)} new opportunities!")
+                            for opp in fresh:
+                                print(f"\n🆕 NEW OPPORTUNITY:")
+                                print(f"📊 Market: {opp['question'][:60]}...")
+                                print(f"🎲 Side: {opp['side']}")
+                                print(f"📈 Edge: {opp['edge']:.1%}")
+                                print(f"🌐 Link: https://polymarket.com/event/{opp['condition_id']}")
+                        else:
+                            print(f"📊 No new opportunities (still {len(new_opportunities)} available)")
                         
             except KeyboardInterrupt:
                 print(f"\n⏹️  Monitoring stopped by user")
@@ -114,53 +306,15 @@ def create_trading_guide():
     """Create a comprehensive trading guide"""
     print(f"\n📚 CREATING POLYMARKET TRADING GUIDE...")
     
-    guide_content = """
-# 🎯 Polymarket Manual Trading Guide
-
-## 🚀 Quick Start
-1. Open https://polymarket.com
-2. Connect your wallet (the one with USDC)
-3. Use the opportunities found by this script
-4. Place trades manually for each opportunity
-
-## 💰 Wallet Setup
-- Ensure you have USDC on Polygon network
-- Your current balance: Check with the script
-- Approve USDC for trading if needed
-
-## 📊 How to Read Opportunities
-- **Market**: The prediction market question
-- **Side**: YES or NO (which side to bet on)
-- **Edge**: Expected profit percentage
-- **Bet Size**: Recommended amount to wager
-- **Current Price**: Current market price
-
-## 🎯 Trading Strategy
-1. **High Edge First**: Start with highest edge opportunities
-2. **Diversify**: Don't put all money in one market
-3. **Monitor**: Check positions regularly
-4. **Exit Strategy**: Consider taking profits early
-
-## ⚠️ Risk Management
-- Never bet more than you can afford to lose
-- Start with small amounts to test the system
-- Monitor market news that could affect outcomes
-- Set stop-losses if positions move against you
-
-## 🔗 Useful Links
-- Polymarket: https://polymarket.com
-- Your Portfolio: https://polymarket.com/portfolio
-- Market Analytics: https://polymarket.com/leaderboard
-
-## 📞 Support
-- Polymarket Discord: https://discord.gg/polymarket
-- Documentation: https://docs.polymarket.com
-"""
+    # Skip the write when the file on disk already matches
+    guide_path = Path(GUIDE_PATH)
+    if guide_path.exists() and hashlib.sha256(guide_path.read_bytes()).digest() == GUIDE_SHA:
+        print(f"✅ {GUIDE_PATH} is up to date")
+        return
     
-    with open("trading_guide.md", "w") as f:
-        f.write(guide_content)
+    guide_path.write_bytes(GUIDE_BYTES)
     
-    print("✅ Created trading_guide.md")
+    print(f"✅ Created {GUIDE_PATH}")
 
 def main():
     """Main function"""
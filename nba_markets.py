@@ -1,49 +1,121 @@
 #!/usr/bin/env python3
+import os
+import json
 import requests
 import datetime
 import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import numpy as np
 from typing import List, Dict, Any, Optional, Union
 
+# Prefer orjson for faster parsing when it is installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# One pooled, keep-alive session for every Gamma and CLOB request
+SESSION = requests.Session()
+SESSION.headers.update({
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/118.0.0.0 Safari/537.36",
+    "Accept": "application/json"
+})
+_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504])
+)
+SESSION.mount("https://", _ADAPTER)
+
+# Concurrent order book lookups; kept well inside the session pool and the CLOB rate limit
+ORDER_BOOK_WORKERS = 16
+
+GAMMA_MARKETS_URL = "https://gamma-api.polymarket.com/markets"
+MARKETS_CACHE_PATH = os.path.expanduser("~/.polytrader/gamma_markets.json")
+MARKETS_CACHE_TTL = 60  # seconds a fetched market list is reused
+
+_markets_cache = {}  # params key -> (time.time(), markets)
+
+CLOB_BOOKS_URL = "https://clob.polymarket.com/books"
+BOOKS_BATCH_SIZE = 100  # tokens per bulk order book request
+
+def fetch_markets(params: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+    """
+    Fetch Gamma markets for params, reusing a copy younger than MARKETS_CACHE_TTL from memory or disk
+    """
+    key = json.dumps(params, sort_keys=True)
+    now = time.time()
+    
+    cached = _markets_cache.get(key)
+    if cached and now - cached[0] < MARKETS_CACHE_TTL:
+        return cached[1]
+    
+    try:
+        mtime = os.path.getmtime(MARKETS_CACHE_PATH)
+        if now - mtime < MARKETS_CACHE_TTL:
+            with open(MARKETS_CACHE_PATH, "rb") as f:
+                data = json_loads(f.read())
+            if data.get("params") == key:
+                _markets_cache[key] = (mtime, data["markets"])
+                return data["markets"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    
+    response = SESSION.get(GAMMA_MARKETS_URL, params=params)
+    
+    if response.status_code != 200:
+        print(f"Failed to fetch markets: {response.status_code}")
+        return None
+    
+    markets = json_loads(response.content)
+    
+    if not isinstance(markets, list):
+        print("Unexpected API response format")
+        return None
+    
+    _markets_cache[key] = (now, markets)
+    
+    # Write to a temp file and swap it in so readers never see half a file
+    try:
+        os.makedirs(os.path.dirname(MARKETS_CACHE_PATH), exist_ok=True)
+        tmp_path = MARKETS_CACHE_PATH + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"params": key, "markets": markets}, f)
+        os.replace(tmp_path, MARKETS_CACHE_PATH)
+    except OSError as e:
+        print(f"⚠️ Could not cache markets: {e}")
+    
+    return markets
+
 def get_active_sports_markets() -> List[Dict[str, Any]]:
     """
     Fetch active sports markets from Polymarket with working order books
     """
     print("Fetching active sports markets...")
     
-    # Step 1: Get all active markets
-    markets_url = "https://gamma-api.polymarket.com/markets"
-    
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/118.0.0.0 Safari/537.36"
-    }
-    
+    # Step 1: Get active, open markets with an order book, highest volume
+    # first; the server does the filtering and sorting
     params = {
-        "limit": 100,  # Get up to 100 markets
-        "active": True  # Only get active markets
+        "limit": 500,  # Get up to 500 markets
+        "active": "true",
+        "closed": "false",
+        "enableOrderBook": "true",
+        "order": "volume",
+        "ascending": "false"
     }
     
     try:
-        response = requests.get(markets_url, params=params, headers=headers)
-        
-        if response.status_code != 200:
-            print(f"Failed to fetch markets: {response.status_code}")
-            return []
+        all_markets = fetch_markets(params)
         
-        all_markets = response.json()
-        
-        if not isinstance(all_markets, list):
-            print("Unexpected API response format")
+        if all_markets is None:
             return []
         
         print(f"Retrieved {len(all_markets)} active markets from Polymarket")
         
-        # Step 2: Filter for tradable markets (with CLOB token IDs)
-        tradable_markets = [
-            market for market in all_markets 
-            if market.get("clobTokenIds") and len(market.get("clobTokenIds", [])) > 0
-        ]
-        
-        # Step 3: Filter for sports-related markets
+        # Step 2: Filter for sports-related markets
         sports_keywords = [
             # NBA terms
             "nba", "basketball", "lakers", "celtics", "warriors", "knicks", "heat", "bucks",
@@ -66,7 +138,7 @@ def get_active_sports_markets() -> List[Dict[str, Any]]:
         ]
         
         sports_markets = []
-        for market in tradable_markets:
+        for market in all_markets:
             question = market.get("question", "").lower()
             description = market.get("description", "").lower()
             
@@ -78,22 +150,19 @@ def get_active_sports_markets() -> List[Dict[str, Any]]:
         
         print(f"Found {len(sports_markets)} sports-related markets")
         
-        # Step 4: Check for active order books
-        active_markets = []
-        for market in sports_markets:
-            # Get token IDs
-            token_ids = parse_token_ids(market)
-            
-            # Check if any token ID has an active order book
-            has_active_book = False
-            for token_id in token_ids:
-                book = get_order_book(token_id)
-                if book and (book.get("asks") or book.get("bids")):
-                    has_active_book = True
-                    break
-            
-            if has_active_book:
-                active_markets.append(market)
+        # Step 3: Check for active order books, all tokens in one bulk request
+        token_lists = [parse_token_ids(market) for market in sports_markets]
+        books = get_order_books_bulk([token_id for token_ids in token_lists for token_id in token_ids])
+        
+        if books is not None:
+            has_active_book = [
+                any(book_has_orders(books.get(token_id)) for token_id in token_ids)
+                for token_ids in token_lists
+            ]
+        else:
+            has_active_book = check_order_books_concurrently(token_lists)
+        
+        active_markets = [market for market, active in zip(sports_markets, has_active_book) if active]
         
         print(f"Found {len(active_markets)} sports markets with active order books")
         return active_markets
@@ -102,30 +171,39 @@ def get_active_sports_markets() -> List[Dict[str, Any]]:
         print(f"Error fetching markets: {e}")
         return []
 
+@lru_cache(maxsize=256)
+def parse_list_string(raw: str) -> tuple:
+    """
+    Parse a stringified list field such as clobTokenIds or outcomes, once per distinct string
+    """
+    try:
+        # Try to parse as a Python/JSON literal
+        import ast
+        parsed = ast.literal_eval(raw)
+        if isinstance(parsed, list):
+            return tuple(parsed)
+    except:
+        # Try simple bracket parsing
+        if raw.startswith("[") and raw.endswith("]"):
+            # Remove brackets and split by comma
+            items = raw[1:-1].split(",")
+            # Clean up each item
+            return tuple(item.strip(' "\'') for item in items if item.strip())
+        
+        # If no parsing works, return as single item
+        return (raw,)
+    
+    return ()
+
 def parse_token_ids(market: Dict[str, Any]) -> List[str]:
     """
     Parse token IDs from market data
     """
     token_ids = market.get("clobTokenIds", [])
     
-    # If token_ids is a string, try to parse it
+    # If token_ids is a string, parse it (cached, since every pass re-reads the same market)
     if isinstance(token_ids, str):
-        try:
-            # Try to parse as JSON
-            import ast
-            parsed = ast.literal_eval(token_ids)
-            if isinstance(parsed, list):
-                return parsed
-        except:
-            # Try simple bracket parsing
-            if token_ids.startswith("[") and token_ids.endswith("]"):
-                # Remove brackets and split by comma
-                tokens = token_ids[1:-1].split(",")
-                # Clean up each token
-                return [t.strip(' "\'') for t in tokens if t.strip()]
-            
-            # If no parsing works, return as single item
-            return [token_ids]
+        return list(parse_list_string(token_ids))
     
     # If it's already a list, return it
     elif isinstance(token_ids, list):
@@ -145,28 +223,91 @@ def parse_outcomes(market: Dict[str, Any]) -> List[str]:
     if isinstance(outcomes, list):
         return outcomes
     
-    # If outcomes is a string, try to parse it
+    # If outcomes is a string, parse it (cached, like token IDs)
     if isinstance(outcomes, str):
-        try:
-            # Try to parse as JSON
-            import ast
-            parsed = ast.literal_eval(outcomes)
-            if isinstance(parsed, list):
-                return parsed
-        except:
-            # Try simple parsing
-            if outcomes.startswith("[") and outcomes.endswith("]"):
-                # Remove brackets and split by comma
-                outcomes_list = outcomes[1:-1].split(",")
-                # Clean up each outcome
-                return [o.strip(' "\'') for o in outcomes_list if o.strip()]
-            
-            # If no parsing works, return as single item
-            return [outcomes]
+        return list(parse_list_string(outcomes))
     
     # Return empty list if we couldn't parse outcomes
     return []
 
+def book_has_orders(book: Optional[Dict[str, Any]]) -> bool:
+    """
+    True if the order book has any bids or asks
+    """
+    return bool(book and (book.get("asks") or book.get("bids")))
+
+def book_levels(levels: List[Dict[str, Any]], descending: bool, depth: int) -> np.ndarray:
+    """
+    Best `depth` (price, size) levels of one book side as an (n, 2) array
+    """
+    arr = np.array([(level["price"], level["size"]) for level in levels], dtype=np.float64).reshape(-1, 2)
+    order = np.argsort(-arr[:, 0] if descending else arr[:, 0], kind="stable")
+    return arr[order[:depth]]
+
+def summarize_book(book: Dict[str, Any], depth: int = 3) -> Dict[str, Any]:
+    """
+    Liquidity summary of an order book: best levels per side, their volumes, spread and a depth/spread score
+    """
+    bids = book_levels(book.get("bids", []), True, depth)
+    asks = book_levels(book.get("asks", []), False, depth)
+    bid_volume = bids[:, 1].sum()
+    ask_volume = asks[:, 1].sum()
+    best_bid = bids[0, 0] if len(bids) else None
+    best_ask = asks[0, 0] if len(asks) else None
+    spread = best_ask - best_bid if len(bids) and len(asks) else None
+    return {
+        "bids": bids,
+        "asks": asks,
+        "best_bid": best_bid,
+        "best_ask": best_ask,
+        "bid_volume": bid_volume,
+        "ask_volume": ask_volume,
+        "spread": spread,
+        "score": (bid_volume + ask_volume) / max(spread, 1e-9) if spread is not None else 0.0
+    }
+
+def check_order_books_concurrently(token_lists: List[List[str]]) -> List[bool]:
+    """
+    Per-token fallback: every market's first outcome is fetched at once, then
+    the next outcome only for markets still without a book
+    """
+    has_active_book = [False] * len(token_lists)
+    
+    with ThreadPoolExecutor(max_workers=ORDER_BOOK_WORKERS) as executor:
+        depth = 0
+        while True:
+            pending = [i for i, token_ids in enumerate(token_lists) if not has_active_book[i] and depth < len(token_ids)]
+            if not pending:
+                break
+            books = executor.map(get_order_book, [token_lists[i][depth] for i in pending])
+            for i, book in zip(pending, books):
+                if book_has_orders(book):
+                    has_active_book[i] = True
+            depth += 1
+    
+    return has_active_book
+
+def get_order_books_bulk(token_ids: List[str]) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Get order books for many tokens with POST /books, keyed by token ID; None if the bulk endpoint fails
+    """
+    books = {}
+    try:
+        for start in range(0, len(token_ids), BOOKS_BATCH_SIZE):
+            batch = token_ids[start:start + BOOKS_BATCH_SIZE]
+            response = SESSION.post(CLOB_BOOKS_URL, json=[{"token_id": token_id} for token_id in batch])
+            
+            if response.status_code != 200:
+                print(f"Bulk order book request failed: {response.status_code}")
+                return None
+            
+            for book in json_loads(response.content):
+                books[book.get("asset_id")] = book
+        return books
+    except Exception as e:
+        print(f"Error fetching order books: {str(e)}")
+        return None
+
 def get_order_book(token_id: str) -> Optional[Dict[str, Any]]:
     """
     Get the order book for a specific token from the CLOB API
@@ -175,15 +316,10 @@ def get_order_book(token_id: str) -> Optional[Dict[str, Any]]:
         url = "https://clob.polymarket.com/book"
         params = {"token_id": token_id}
         
-        headers = {
-            "Accept": "application/json",
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
-        
-        response = requests.get(url, params=params, headers=headers)
+        response = SESSION.get(url, params=params)
         
         if response.status_code == 200:
-            return response.json()
+            return json_loads(response.content)
         else:
             # Only log 404 errors for debugging, not all failed requests
             if response.status_code == 404:
@@ -268,27 +404,28 @@ def display_market(market: Dict[str, Any]) -> None:
         print(f"Token ID: {token_short}")
         
         if order_book and (order_book.get("bids") or order_book.get("asks")):
-            # Display bid and ask data
-            bids = order_book.get("bids", [])
-            asks = order_book.get("asks", [])
+            # Parse each side once, best levels first whatever order the API sent
+            summary = summarize_book(order_book)
             
             # Best bid and ask
-            best_bid = f"{float(bids[0]['price']):.3f}" if bids else "None"
-            best_ask = f"{float(asks[0]['price']):.3f}" if asks else "None"
+            best_bid = f"{summary['best_bid']:.3f}" if summary["best_bid"] is not None else "None"
+            best_ask = f"{summary['best_ask']:.3f}" if summary["best_ask"] is not None else "None"
             
             print(f"Best Bid: {best_bid}")
             print(f"Best Ask: {best_ask}")
+            if summary["spread"] is not None:
+                print(f"Spread: {summary['spread']:.3f}")
             
             # Show order depth (up to 3 levels)
-            if bids:
-                print("\nBid Depth:")
-                for j, bid in enumerate(bids[:3]):
-                    print(f"  {float(bid['price']):.3f} - Size: {float(bid['size']):.1f}")
+            if len(summary["bids"]):
+                print(f"\nBid Depth ({summary['bid_volume']:.1f} total):")
+                for price, size in summary["bids"]:
+                    print(f"  {price:.3f} - Size: {size:.1f}")
             
-            if asks:
-                print("\nAsk Depth:")
-                for j, ask in enumerate(asks[:3]):
-                    print(f"  {float(ask['price']):.3f} - Size: {float(ask['size']):.1f}")
+            if len(summary["asks"]):
+                print(f"\nAsk Depth ({summary['ask_volume']:.1f} total):")
+                for price, size in summary["asks"]:
+                    print(f"  {price:.3f} - Size: {size:.1f}")
         else:
             print("No active order book available")
         
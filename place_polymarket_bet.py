@@ -1,23 +1,48 @@
 #!/usr/bin/env python3
-import requests
-import json
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List, Tuple
 from dotenv import load_dotenv
 from web3 import Web3
 from eth_account import Account
+from contracts import MULTICALL3_ABI, MULTICALL3_ADDRESS, USDC_CONTRACT, encode_balance_of, usdc_contract
 from nba_markets import get_active_sports_markets, parse_token_ids, parse_outcomes, classify_market
 
+# Try to import py-clob-client for signed order submission
+try:
+    from py_clob_client.client import ClobClient
+    from py_clob_client.constants import POLYGON
+    from py_clob_client.clob_types import MarketOrderArgs, OrderType
+    from py_clob_client.order_builder.constants import BUY, SELL
+    from clob_creds import get_api_creds
+    CLOB_AVAILABLE = True
+except ImportError:
+    CLOB_AVAILABLE = False
+
 # Load environment variables
 load_dotenv()
 
 # Constants
 POLYMARKET_EXCHANGE = "0x4bFb41d5B3570DeFd03C39a9A4D8dE6Bd8B8982E"  # Polymarket Exchange contract
-USDC_CONTRACT = "0x3c499c542cEF5E3811e1192ce70d8cC03d5c3359"  # USDC on Polygon
 RPC_URL = "https://polygon-rpc.com"
 CLOB_API_URL = "https://clob.polymarket.com"
 
+# CLOB client per private key, built once and reused so later orders skip
+# credential setup and ride the client's open connection
+_CLOB_CLIENTS = {}
+
+def get_clob_client(private_key: str) -> "ClobClient":
+    """
+    Return a CLOB client with API credentials set, creating it on first use
+    """
+    client = _CLOB_CLIENTS.get(private_key)
+    if client is None:
+        client = ClobClient(CLOB_API_URL, key=private_key, chain_id=POLYGON)
+        client.set_api_creds(get_api_creds(client))
+        _CLOB_CLIENTS[private_key] = client
+    return client
+
 def get_wallet_info() -> Tuple[str, str, Web3]:
     """
     Get wallet address and web3 connection from private key
@@ -51,36 +76,24 @@ def check_usdc_approval(wallet_address: str, w3: Web3) -> bool:
     """
     Check if USDC is approved for spending by Polymarket
     """
-    # USDC contract ABI (for balanceOf and allowance functions)
-    usdc_abi = json.loads('''[
-        {
-            "constant": true,
-            "inputs": [{"name": "account", "type": "address"}],
-            "name": "balanceOf",
-            "outputs": [{"name": "", "type": "uint256"}],
-            "payable": false,
-            "stateMutability": "view",
-            "type": "function"
-        },
-        {
-            "constant": true,
-            "inputs": [
-                {"name": "owner", "type": "address"},
-                {"name": "spender", "type": "address"}
-            ],
-            "name": "allowance",
-            "outputs": [{"name": "", "type": "uint256"}],
-            "payable": false,
-            "stateMutability": "view",
-            "type": "function"
-        }
-    ]''')
+    # Contract object is built once per Web3 instance and reused
+    usdc = usdc_contract(w3)
     
-    # Create contract instance
-    usdc_contract = w3.eth.contract(address=USDC_CONTRACT, abi=usdc_abi)
+    # Read balance and allowance in one Multicall3 aggregate3 call
+    try:
+        multicall = w3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+        calls = [
+            (USDC_CONTRACT, False, encode_balance_of(wallet_address)),
+            (USDC_CONTRACT, False, usdc.encode_abi("allowance", args=[wallet_address, POLYMARKET_EXCHANGE])),
+        ]
+        (_, balance_data), (_, allowance_data) = multicall.functions.aggregate3(calls).call()
+        balance = int.from_bytes(balance_data, "big")
+        current_allowance = int.from_bytes(allowance_data, "big")
+    except Exception:
+        # Multicall unavailable; read each value separately
+        balance = usdc.functions.balanceOf(wallet_address).call()
+        current_allowance = usdc.functions.allowance(wallet_address, POLYMARKET_EXCHANGE).call()
     
-    # Check USDC balance
-    balance = usdc_contract.functions.balanceOf(wallet_address).call()
     balance_usdc = balance / 10**6  # USDC has 6 decimals
     
     print(f"USDC balance: {balance_usdc} USDC")
@@ -89,11 +102,6 @@ def check_usdc_approval(wallet_address: str, w3: Web3) -> bool:
         print("You don't have any USDC in your wallet.")
         return False
     
-    # Check current allowance
-    current_allowance = usdc_contract.functions.allowance(
-        wallet_address, 
-        POLYMARKET_EXCHANGE
-    ).call()
     current_allowance_usdc = current_allowance / 10**6
     
     print(f"Current Polymarket allowance: {current_allowance_usdc} USDC")
@@ -101,6 +109,23 @@ def check_usdc_approval(wallet_address: str, w3: Web3) -> bool:
     # If allowance is sufficient, return True
     return current_allowance > 0 and current_allowance >= 1_000_000  # 1 USDC minimum
 
+def prepare_market_order(token_id: str, private_key: str) -> Optional[str]:
+    """
+    Set up the CLOB client and fetch the token's tick size, neg-risk flag and
+    fee rate, so placing the order only has to price it, sign locally and post
+    
+    Returns:
+        An error message if preparation failed, otherwise None
+    """
+    try:
+        client = get_clob_client(private_key)
+        client.get_tick_size(token_id)
+        client.get_neg_risk(token_id)
+        client.get_fee_rate_bps(token_id)
+    except Exception as e:
+        return str(e)
+    return None
+
 def place_market_order(
     token_id: str, 
     side: str, 
@@ -115,114 +140,41 @@ def place_market_order(
     Args:
         token_id: The token ID to trade
         side: Either 'buy' or 'sell'
-        size: The size of the position in number of shares
+        size: USDC to spend when buying, shares to sell when selling
         wallet_address: The wallet address
         private_key: The private key for signing
         w3: Web3 instance
         
     Returns:
-        Optional transaction hash if successful
+        "success" if the order was filled, otherwise None
     """
+    if not CLOB_AVAILABLE:
+        print("❌ Polymarket client not installed. Run: pip install py-clob-client")
+        return None
+    
     try:
-        # Step 1: Create the order structure
-        order = {
-            "order": {
-                "token_id": token_id,
-                "side": side.upper(),
-                "type": "MARKET",
-                "size": str(size),
-                "time_in_force": "FOK"  # Fill-or-Kill
-            }
-        }
-        
-        # Step 2: Get nonce, expiration, and order signature from the API
-        signature_url = f"{CLOB_API_URL}/orders/signature"
-        
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "User-Agent": "Mozilla/5.0"
-        }
-        
-        response = requests.post(signature_url, headers=headers, json=order)
-        
-        if response.status_code != 200:
-            print(f"Failed to get order signature: {response.status_code}")
-            print(response.text)
-            return None
-        
-        signature_data = response.json()
+        client = get_clob_client(private_key)
         
-        # Extract data for the signed order
-        nonce = signature_data.get("nonce")
-        expiration = signature_data.get("expiration")
-        signature = signature_data.get("signature")
-        
-        if not all([nonce, expiration, signature]):
-            print("Missing signature data")
-            return None
-        
-        # Step 3: Create the final order with signature
-        signed_order = {
-            "token_id": token_id,
-            "side": side.upper(),
-            "type": "MARKET",
-            "size": str(size),
-            "time_in_force": "FOK",
-            "nonce": nonce,
-            "expiration": expiration,
-            "signature": signature,
-            "wallet": wallet_address
-        }
-        
-        # Step 4: Submit the order
-        order_url = f"{CLOB_API_URL}/orders"
+        # Market order: amount is USDC for buys, shares for sells
+        order_args = MarketOrderArgs(
+            token_id=token_id,
+            amount=size,
+            side=BUY if side.lower() == "buy" else SELL
+        )
         
-        order_response = requests.post(order_url, headers=headers, json=signed_order)
+        # Sign locally (EIP-712) and submit once as Fill-or-Kill; the CLOB
+        # settles the match on-chain itself
+        signed_order = client.create_market_order(order_args)
+        order_result = client.post_order(signed_order, OrderType.FOK)
         
-        if order_response.status_code != 200:
-            print(f"Failed to place order: {order_response.status_code}")
-            print(order_response.text)
+        if not order_result or not order_result.get("success"):
+            error_msg = order_result.get("errorMsg", "Unknown error") if order_result else "No response"
+            print(f"Failed to place order: {error_msg}")
             return None
         
-        order_result = order_response.json()
+        print(f"Order placed successfully! Order ID: {order_result.get('orderID')}")
+        return "success"
         
-        # Step 5: Check if we need to settle the order
-        if "tx_data" in order_result:
-            tx_data = order_result["tx_data"]
-            
-            # Build transaction
-            tx = {
-                'from': wallet_address,
-                'to': tx_data.get("to"),
-                'data': tx_data.get("data"),
-                'value': w3.to_wei(0, 'ether'),  # No ETH value
-                'gas': 500000,  # Gas limit
-                'gasPrice': w3.to_wei('50', 'gwei'),
-                'nonce': w3.eth.get_transaction_count(wallet_address),
-            }
-            
-            # Sign and send transaction
-            signed_tx = w3.eth.account.sign_transaction(tx, private_key)
-            tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-            
-            print(f"Settlement transaction sent! Hash: {tx_hash.hex()}")
-            print(f"View on PolygonScan: https://polygonscan.com/tx/{tx_hash.hex()}")
-            
-            # Wait for transaction to be mined
-            print("Waiting for transaction to be confirmed...")
-            tx_receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
-            
-            if tx_receipt['status'] == 1:
-                print("✅ Transaction confirmed!")
-                return tx_hash.hex()
-            else:
-                print("❌ Transaction failed. Please check PolygonScan for details.")
-                return None
-        else:
-            print("Order placed successfully!")
-            return "success"
-            
     except Exception as e:
         print(f"Error placing order: {str(e)}")
         return None
@@ -294,12 +246,23 @@ def place_bet_on_market(
     print(f"MARKET: {market_question}")
     print("=" * 70)
     
-    # Confirm the bet
+    # Confirm the bet, preparing the order in the background meanwhile
+    executor = ThreadPoolExecutor(max_workers=1)
+    prepared = executor.submit(prepare_market_order, token_id, private_key) if CLOB_AVAILABLE else None
     confirm = input("\nConfirm bet (y/n): ").strip().lower()
     if confirm != 'y':
+        # Don't make the user wait on a preparation that will never be used
+        executor.shutdown(wait=False, cancel_futures=True)
         print("Bet cancelled")
         return
     
+    # Report a failed preparation only now, so it can't print over the prompt
+    if prepared is not None:
+        error = prepared.result()
+        if error:
+            print(f"⚠️ Could not prepare order: {error}")
+    executor.shutdown()
+    
     # Place the order
     tx_hash = place_market_order(token_id, "buy", amount, wallet_address, private_key, w3)
     
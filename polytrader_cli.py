@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Polytrader wallet CLI
+One entry point for the balance and deposit scripts. With --daemon it reads
+commands from stdin, so web3 and the other heavy imports load only once.
+
+Usage:
+    python3 polytrader_cli.py check-wallets [--json]
+    python3 polytrader_cli.py check-polymarket [--refresh-creds]
+    python3 polytrader_cli.py deposit-all
+    python3 polytrader_cli.py deposit [--refresh-creds]
+    python3 polytrader_cli.py --daemon
+"""
+
+import sys
+import shlex
+import asyncio
+import argparse
+
+def run_check_wallets(args):
+    """Compare USDC balances of both wallets"""
+    from check_both_wallets import check_both_wallets
+    check_both_wallets(as_json=args.json)
+
+def run_check_polymarket(args):
+    """Check wallet, MATIC and Polymarket trading balances"""
+    from check_polymarket_balance import check_polymarket_balance
+    asyncio.run(check_polymarket_balance(refresh_creds=args.refresh_creds))
+
+def run_deposit_all(args):
+    """Deposit all USDC (minus reserve) into Polymarket"""
+    from deposit_all_usdc import main as deposit_all_main
+    deposit_all_main()
+
+def run_deposit(args):
+    """Interactively deposit a chosen amount of USDC"""
+    from deposit_usdc_polymarket import deposit_usdc_to_polymarket
+    deposit_usdc_to_polymarket(refresh_creds=args.refresh_creds)
+
+def build_parser():
+    """Build the argument parser with one subcommand per script"""
+    parser = argparse.ArgumentParser(description="Polytrader wallet tools")
+    parser.add_argument("--daemon", action="store_true", help="read commands from stdin, one per line")
+    subparsers = parser.add_subparsers(dest="command")
+    
+    check_wallets = subparsers.add_parser("check-wallets", help=run_check_wallets.__doc__)
+    check_wallets.add_argument("--json", action="store_true", help="print one machine-readable JSON line")
+    check_wallets.set_defaults(handler=run_check_wallets)
+    
+    check_polymarket = subparsers.add_parser("check-polymarket", help=run_check_polymarket.__doc__)
+    check_polymarket.add_argument("--refresh-creds", action="store_true", help="derive new CLOB API credentials")
+    check_polymarket.set_defaults(handler=run_check_polymarket)
+    
+    subparsers.add_parser("deposit-all", help=run_deposit_all.__doc__).set_defaults(handler=run_deposit_all)
+    
+    deposit = subparsers.add_parser("deposit", help=run_deposit.__doc__)
+    deposit.add_argument("--refresh-creds", action="store_true", help="derive new CLOB API credentials")
+    deposit.set_defaults(handler=run_deposit)
+    
+    return parser
+
+def run_daemon(parser):
+    """Run commands read from stdin until EOF or 'quit'"""
+    print("🤖 Polytrader daemon ready (commands: check-wallets, check-polymarket, deposit-all, deposit, quit)")
+    for line in sys.stdin:
+        words = shlex.split(line)
+        if not words:
+            continue
+        if words[0] in ("quit", "exit"):
+            break
+        
+        try:
+            args = parser.parse_args(words)
+        except SystemExit:
+            # argparse already printed the usage error
+            continue
+        
+        if args.command is None:
+            parser.print_help()
+            continue
+        
+        try:
+            args.handler(args)
+        except SystemExit:
+            pass
+        except Exception as e:
+            print(f"❌ {args.command} failed: {e}")
+
+def main():
+    """Main function"""
+    parser = build_parser()
+    args = parser.parse_args()
+    
+    if args.daemon:
+        run_daemon(parser)
+    elif args.command is None:
+        parser.print_help()
+    else:
+        args.handler(args)
+
+if __name__ == "__main__":
+    main()
@@ -8,44 +8,35 @@ and execute real trades automatically for maximum profit.
 
 import os
 import sys
+import importlib.util
 import time
 import random
 import json
 from typing import Dict, Any, Optional, List
 from dotenv import load_dotenv
-from web3 import Web3
+from rpc_client import get_w3
 from eth_account import Account
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 
-# Import py-clob-client
-try:
-    from py_clob_client.client import ClobClient
-    from py_clob_client.constants import POLYGON
-    from py_clob_client.order_builder.constants import BUY, SELL
-    from py_clob_client.exceptions import PolyApiException
-    from py_clob_client.clob_types import (
-        ApiCreds, OrderArgs, OrderType, MarketOrderArgs,
-        BalanceAllowanceParams, AssetType
-    )
-except ImportError:
-    print("❌ py-clob-client not installed. Installing...")
-    os.system("pip install py-clob-client")
-    from py_clob_client.client import ClobClient
-    from py_clob_client.constants import POLYGON
-    from py_clob_client.order_builder.constants import BUY, SELL
-    from py_clob_client.exceptions import PolyApiException
-    from py_clob_client.clob_types import (
-        ApiCreds, OrderArgs, OrderType, MarketOrderArgs,
-        BalanceAllowanceParams, AssetType
-    )
+# Require py-clob-client up front rather than installing it at import time
+if importlib.util.find_spec("py_clob_client") is None:
+    sys.exit("❌ py-clob-client not installed. Run: pip install -r requirements.txt")
+
+from py_clob_client.client import ClobClient
+from py_clob_client.constants import POLYGON
+from py_clob_client.order_builder.constants import BUY, SELL
+from py_clob_client.exceptions import PolyApiException
+from py_clob_client.clob_types import (
+    ApiCreds, OrderArgs, OrderType, MarketOrderArgs,
+    BalanceAllowanceParams, AssetType
+)
 
 # Load environment variables
 load_dotenv()
 
 # Constants
 USDC_CONTRACT = "0x3c499c542cEF5E3811e1192ce70d8cC03d5c3359"
-RPC_URL = "https://polygon-rpc.com"
 
 # Aggressive Trading Configuration
 INITIAL_BET_SIZE = 3.0
@@ -85,7 +76,7 @@ class RealAutoTrader:
         if not private_key.startswith("0x"):
             private_key = "0x" + private_key
         
-        self.w3 = Web3(Web3.HTTPProvider(RPC_URL))
+        self.w3 = get_w3()
         
         if not self.w3.is_connected():
             raise ConnectionError("Failed to connect to Polygon network")
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Shared Polygon RPC connection
+
+One Web3 instance backed by a pooled, retrying requests.Session, so the
+wallet scripts reuse keep-alive connections instead of opening a new
+provider (and TLS handshake) each time. Async callers get a WebSocket
+connection instead, which keeps one socket open for the whole run.
+"""
+
+import time
+import asyncio
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from web3 import AsyncHTTPProvider, AsyncWeb3, Web3, WebSocketProvider
+from web3.exceptions import TimeExhausted, TransactionNotFound
+
+# Constants
+RPC_URL = "https://polygon-rpc.com"
+WSS_URL = "wss://polygon-bor-rpc.publicnode.com"
+CHAIN_ID = 137  # Polygon mainnet
+RPC_TIMEOUT = 10
+RPC_POOL_CONNECTIONS = 4
+RPC_POOL_SIZE = 32
+RPC_RETRIES = 3
+RPC_BACKOFF_FACTOR = 0.3
+
+_session = None
+_w3 = None
+
+
+def get_session():
+    """Return the shared pooled requests.Session used for RPC calls"""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=RPC_POOL_CONNECTIONS,
+            pool_maxsize=RPC_POOL_SIZE,
+            max_retries=Retry(total=RPC_RETRIES, backoff_factor=RPC_BACKOFF_FACTOR),
+        )
+        _session.mount("https://", adapter)
+    return _session
+
+
+def get_w3():
+    """Return the shared Web3 instance, creating it on first use"""
+    global _w3
+    if _w3 is None:
+        _w3 = Web3(Web3.HTTPProvider(
+            RPC_URL,
+            session=get_session(),
+            request_kwargs={"timeout": RPC_TIMEOUT},
+        ))
+    return _w3
+
+
+async def connect_async_w3():
+    """Return a connected AsyncWeb3, over WebSocket when the endpoint accepts it"""
+    try:
+        return await AsyncWeb3(WebSocketProvider(WSS_URL, max_connection_retries=1))
+    except Exception:
+        # WebSocket handshake failed; fall back to async HTTP
+        return AsyncWeb3(AsyncHTTPProvider(RPC_URL, request_kwargs={"timeout": RPC_TIMEOUT}))
+
+
+async def _receipt_from_new_heads(tx_hash):
+    """Check for the receipt once per new block pushed over the WebSocket"""
+    async with AsyncWeb3(WebSocketProvider(WSS_URL, max_connection_retries=1)) as w3:
+        await w3.eth.subscribe("newHeads")
+        
+        # The transaction may already be mined before the subscription started
+        try:
+            return await w3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            pass
+        
+        async for _ in w3.socket.process_subscriptions():
+            try:
+                return await w3.eth.get_transaction_receipt(tx_hash)
+            except TransactionNotFound:
+                continue
+
+
+def wait_for_receipt(w3, tx_hash, timeout=300):
+    """Wait for a transaction receipt, driven by newHeads instead of HTTP polling
+
+    Falls back to w3.eth.wait_for_transaction_receipt if the WebSocket
+    subscription cannot be set up or drops, polling only for the time left.
+    """
+    start = time.monotonic()
+    try:
+        return asyncio.run(asyncio.wait_for(_receipt_from_new_heads(tx_hash), timeout))
+    except asyncio.TimeoutError:
+        raise TimeExhausted(f"Transaction {tx_hash.hex()} is not in the chain after {timeout} seconds")
+    except Exception:
+        remaining = timeout - (time.monotonic() - start)
+        if remaining <= 0:
+            raise TimeExhausted(f"Transaction {tx_hash.hex()} is not in the chain after {timeout} seconds")
+        return w3.eth.wait_for_transaction_receipt(tx_hash, timeout=remaining)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Numeric kernels shared by the trading bots
+
+Pure-float helpers for edge and bet-size math. When numba is installed they
+are JIT-compiled (and cached on disk); otherwise they run as plain Python.
+"""
+
+import numpy as np
+
+# Try to import numba for JIT compilation
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def edge_calc(ai_probability, price):
+    """Return (edge, is_yes) for buying the side the AI probability favours"""
+    if ai_probability > price:
+        return (ai_probability - price) / price, True
+    return (price - ai_probability) / ai_probability, False
+
+
+@njit(cache=True)
+def kelly_bet(edge, confidence, balance, min_bet, max_bet, kelly_scale, max_fraction):
+    """Scaled Kelly bet clamped to [min_bet, max_bet] and to max_fraction of balance"""
+    bet = balance * edge * confidence * kelly_scale
+    if bet < min_bet:
+        bet = min_bet
+    elif bet > max_bet:
+        bet = max_bet
+    cap = balance * max_fraction
+    return bet if bet < cap else cap
+
+
+@njit(cache=True)
+def score_edge(strong_bull, bull, strong_bear, bear, price, volume):
+    """HybridAutoTrader scoring: (edge, is_yes, ai_probability) from keyword weights, price and volume"""
+    sentiment = (strong_bull + bull) - (strong_bear + bear)
+    volume_factor = min(volume / 300000, 0.4)  # Up to 40% adjustment
+    liquidity_factor = 0.1 if volume > 100000 else 0.05
+    ai_probability = max(0.05, min(0.95, 0.5 + sentiment * 0.03 + volume_factor + liquidity_factor))
+    # Same formula as edge_calc, inlined so the AOT build doesn't call a dispatcher
+    if ai_probability > price:
+        return (ai_probability - price) / price, True, ai_probability
+    return (price - ai_probability) / ai_probability, False, ai_probability
+
+
+def analyze_batch(prices, volumes, bull_counts, bear_counts):
+    """Vectorized AdvancedAutoTrader scoring over arrays of markets
+
+    Returns (edge, is_yes, ai_probability, confidence) arrays.
+    """
+    volume_norm = volumes * 1e-6
+    sentiment = (bull_counts - bear_counts) * 2 * 0.05
+    ai_probability = np.clip(0.5 + sentiment + np.minimum(volume_norm, 0.2) + 0.1, 0.15, 0.85)
+    is_yes = ai_probability > prices
+    edge = np.where(is_yes, (ai_probability - prices) / prices, (prices - ai_probability) / ai_probability)
+    confidence = np.minimum(volume_norm, 1.0)
+    return edge, is_yes, ai_probability, confidence
+
+
+def score_edge_batch(prices, volumes, sentiment):
+    """Vectorized score_edge over arrays of markets, from net sentiment weights
+
+    Returns (edge, is_yes, ai_probability, confidence) arrays.
+    """
+    volume_factor = np.minimum(volumes / 300000, 0.4)
+    liquidity_factor = np.where(volumes > 100000, 0.1, 0.05)
+    ai_probability = np.clip(0.5 + sentiment * 0.03 + volume_factor + liquidity_factor, 0.05, 0.95)
+    is_yes = ai_probability > prices
+    edge = np.where(is_yes, (ai_probability - prices) / prices, (prices - ai_probability) / ai_probability)
+    confidence = np.minimum(volumes / 500000, 1.0)
+    return edge, is_yes, ai_probability, confidence
+
+
+# Python/JIT definitions, kept so build_kernels.py can compile them ahead of time
+PY_KERNELS = {
+    "edge_calc": edge_calc,
+    "kelly_bet": kelly_bet,
+    "score_edge": score_edge,
+    "analyze_batch": analyze_batch,
+    "score_edge_batch": score_edge_batch,
+}
+
+# Prefer the ahead-of-time build from build_kernels.py: it needs no JIT
+# compilation when the bot restarts
+try:
+    from poly_kernels import edge_calc, kelly_bet, score_edge, analyze_batch, score_edge_batch
+    AOT_KERNELS_AVAILABLE = True
+except ImportError:
+    AOT_KERNELS_AVAILABLE = False
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Wallet account from the environment
+
+Reads POLYGON_WALLET_PRIVATE_KEY once and derives the account once, so
+scripts (and the CLI daemon) don't repeat the key normalization and
+secp256k1 public key derivation on every call.
+"""
+
+import os
+import functools
+from dotenv import load_dotenv
+from eth_account import Account
+
+# Load environment variables
+load_dotenv()
+
+@functools.lru_cache(maxsize=1)
+def get_private_key():
+    """Return the 0x-prefixed private key, or "" if none is configured"""
+    private_key = os.getenv("POLYGON_WALLET_PRIVATE_KEY", "")
+    if private_key and not private_key.startswith("0x"):
+        private_key = "0x" + private_key
+    return private_key
+
+@functools.lru_cache(maxsize=1)
+def get_account():
+    """Return the LocalAccount for the configured private key"""
+    private_key = get_private_key()
+    if not private_key:
+        raise ValueError("No private key found in environment variables")
+    return Account.from_key(private_key)